@@ -1,13 +1,22 @@
 import json
 import os
 import logging
-from openai import OpenAI
+import random
+import threading
+import time
+from functools import wraps
+from openai import OpenAI, DefaultHttpxClient
 import httpx
 from httpcore import ReadTimeout, ConnectTimeout
-from openai import APIConnectionError, APITimeoutError
+from openai import APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
 
 # Get OpenAI API key from environment
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
+
+# Cap on in-flight OpenAI requests across request threads and background workers;
+# bursts above this wait for a free connection instead of tripping rate limits
+OPENAI_MAX_CONCURRENCY = int(os.environ.get("OPENAI_MAX_CONCURRENCY", "8"))
+
 if not OPENAI_API_KEY:
     logging.warning("OPENAI_API_KEY not found in environment variables")
     openai = None
@@ -16,9 +25,71 @@ else:
     openai = OpenAI(
         api_key=OPENAI_API_KEY,
         timeout=30.0,  # 30 second timeout
-        max_retries=3  # Retry failed requests up to 3 times
+        max_retries=3,  # Retry failed requests up to 3 times
+        http_client=DefaultHttpxClient(
+            limits=httpx.Limits(
+                max_connections=OPENAI_MAX_CONCURRENCY,
+                max_keepalive_connections=OPENAI_MAX_CONCURRENCY
+            )
+        )
     )
 
+# Attempt budgets for retry_openai: a request thread can't sit through a long backoff, background work can
+REQUEST_MAX_ATTEMPTS = 2
+BACKGROUND_MAX_ATTEMPTS = 5
+
+# Retries performed by retry_openai, keyed by function name (exposed for monitoring)
+openai_retry_counts = {}
+_retry_counts_lock = threading.Lock()
+
+def _retry_after_seconds(error):
+    """Return the server-requested wait from a Retry-After header, if any"""
+    response = getattr(error, 'response', None)
+    if response is None:
+        return None
+    headers = response.headers
+    try:
+        if headers.get('retry-after-ms'):
+            return float(headers['retry-after-ms']) / 1000
+        if headers.get('retry-after'):
+            return float(headers['retry-after'])
+    except ValueError:
+        # HTTP-date form - fall back to exponential backoff
+        return None
+    return None
+
+def retry_openai(func=None, *, max_attempts=BACKGROUND_MAX_ATTEMPTS, initial_wait=1.0, max_wait=16.0):
+    """
+    Retry an OpenAI call on rate limits, timeouts and transient server errors with
+    exponential backoff and jitter. A Retry-After header from the API replaces the computed wait,
+    and every wait is capped at max_wait. Callers on the request path pass max_attempts=REQUEST_MAX_ATTEMPTS
+    to the decorated function to override the attempt budget for that call.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, max_attempts=max_attempts, **kwargs):
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    return fn(*args, **kwargs)
+                except (RateLimitError, APIConnectionError, InternalServerError) as e:
+                    if attempt == max_attempts:
+                        raise
+                    wait = _retry_after_seconds(e)
+                    if wait is None:
+                        wait = initial_wait * 2 ** (attempt - 1) + random.uniform(0, initial_wait)
+                    wait = min(max_wait, wait)
+                    with _retry_counts_lock:
+                        openai_retry_counts[fn.__name__] = openai_retry_counts.get(fn.__name__, 0) + 1
+                    logging.warning(f"OpenAI {type(e).__name__} in {fn.__name__}, retry {attempt}/{max_attempts - 1} in {wait:.1f}s")
+                    time.sleep(wait)
+        return wrapper
+    return decorator(func) if func else decorator
+
+@retry_openai
+def create_chat_completion(client, **kwargs):
+    """Create a chat completion with backoff; the SDK's own retries are disabled so attempts don't multiply"""
+    return client.with_options(max_retries=0).chat.completions.create(**kwargs)
+
 def generate_interview_questions(job_description, job_title, num_questions=5):
     """
     Generate interview questions based on job description using OpenAI
@@ -90,7 +161,9 @@ def generate_interview_questions(job_description, job_title, num_questions=5):
         }}
         """
 
-        response = openai.chat.completions.create(
+        response = create_chat_completion(
+            openai,
+            max_attempts=REQUEST_MAX_ATTEMPTS,
             model="gpt-4o",
             messages=[
                 {
@@ -130,7 +203,7 @@ def generate_interview_questions(job_description, job_title, num_questions=5):
         logging.error(f"Error generating interview questions: {e}")
         return fallback_questions
 
-def score_interview_responses(answers, job_description):
+def score_interview_responses(answers, job_description, max_attempts=REQUEST_MAX_ATTEMPTS):
     """
     Score interview responses using OpenAI
     # the newest OpenAI model is "gpt-4o" which was released May 13, 2024.
@@ -207,7 +280,9 @@ def score_interview_responses(answers, job_description):
         }}
         """
 
-        response = openai.chat.completions.create(
+        response = create_chat_completion(
+            openai,
+            max_attempts=max_attempts,
             model="gpt-4o",
             messages=[
                 {
@@ -323,7 +398,9 @@ def analyze_video_interview(video_path, interview_context=None):
         }}
         """
         
-        response = openai.chat.completions.create(
+        response = create_chat_completion(
+            openai,
+            max_attempts=REQUEST_MAX_ATTEMPTS,
             model="gpt-4o",
             messages=[
                 {
@@ -374,7 +451,8 @@ def analyze_sentiment(text):
         return {"rating": 3, "confidence": 0.5}
     
     try:
-        response = openai.chat.completions.create(
+        response = create_chat_completion(
+            openai,
             model="gpt-4o",
             messages=[
                 {
@@ -1,9 +1,12 @@
 import os
 import logging
-from flask import Flask
+import orjson
+from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager
 from sqlalchemy.orm import DeclarativeBase
+from werkzeug.exceptions import RequestEntityTooLarge
 from werkzeug.middleware.proxy_fix import ProxyFix
 
 # Configure logging
@@ -12,20 +15,58 @@ logging.basicConfig(level=logging.DEBUG)
 class Base(DeclarativeBase):
     pass
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson; datetimes are emitted natively as RFC 3339 strings"""
+    
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 db = SQLAlchemy(model_class=Base)
 
 # Create the app
 app = Flask(__name__)
 app.secret_key = os.environ.get("SESSION_SECRET")
 app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
+app.json = OrjsonProvider(app)
+
+# Let the reverse proxy serve uploaded files directly when it supports X-Sendfile
+app.config["USE_X_SENDFILE"] = os.environ.get("USE_X_SENDFILE", "false").lower() == "true"
 
 # Configure the database
 app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get("DATABASE_URL")
 app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
     "pool_recycle": 300,
     "pool_pre_ping": True,
+    # Compiled-SQL cache; the default 500 entries is smaller than the set of distinct queries the routes issue
+    "query_cache_size": 1200,
 }
 
+# Largest JSON request body accepted; uploads are multipart and not affected
+app.config["MAX_JSON_BODY_BYTES"] = int(os.environ.get("MAX_JSON_BODY_BYTES", str(1024 * 1024)))
+
+@app.before_request
+def limit_json_body_size():
+    # Reject oversized JSON before anything reads and decodes the body
+    if not request.is_json:
+        return None
+    max_bytes = app.config["MAX_JSON_BODY_BYTES"]
+    if request.content_length is None:
+        # Chunked bodies have no length up front: read and cache at most max_bytes now, so the
+        # overflow is rejected here rather than inside a route's own error handling
+        request.max_content_length = max_bytes
+        try:
+            request.get_data(cache=True)
+        except RequestEntityTooLarge:
+            return jsonify({'error': 'Request body too large'}), 413
+    elif request.content_length > max_bytes:
+        return jsonify({'error': 'Request body too large'}), 413
+
 # Initialize the app with extensions
 db.init_app(app)
 
@@ -38,7 +79,8 @@ login_manager.login_message = 'Please log in to access this page.'
 @login_manager.user_loader
 def load_user(user_id):
     from models import User
-    return User.query.get(int(user_id))
+    # Resolved once per request by Flask-Login; role and organization checks read the loaded row
+    return db.session.get(User, int(user_id))
 
 # Add custom template filters
 @app.template_filter('from_json')
@@ -128,6 +170,10 @@ with app.app_context():
     db.create_all()
     logging.info("Database tables created")
     
+    # create_all() skips tables that already exist, so add any newer columns to them
+    from schema_migrations import apply_schema_migrations
+    apply_schema_migrations()
+    
     # Initialize job scheduler (avoid circular imports) - TEMPORARILY DISABLED
     # try:
     #     import job_scheduler
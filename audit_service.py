@@ -0,0 +1,147 @@
+"""
+Audit Log Service for Ez2source
+Buffers audit trail entries in memory and writes them in batches off the request path
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+
+from sqlalchemy import insert
+
+from app import app, db
+from models import AuditLog, Organization
+
+FLUSH_INTERVAL_SECONDS = 1.0
+MAX_BATCH_SIZE = 500
+PRUNE_INTERVAL_SECONDS = 3600
+PRUNE_MAX_RECORDS_PER_RUN = 10_000
+DEFAULT_AUDIT_LOG_DAYS_TO_KEEP = 365
+
+
+class AuditLogQueue:
+    """In-process queue of audit rows drained by a single writer thread in multi-row INSERTs"""
+
+    def __init__(self, max_pending: int = 100_000):
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._writer = None
+        self._writer_pid = None
+
+    def enqueue(self, entries):
+        """
+        Queue audit rows (dicts of AuditLog columns) for the writer thread.
+        Rows that don't fit in the queue are inserted directly in the caller's session.
+        """
+        overflow = []
+        for entry in entries:
+            entry.setdefault('timestamp', datetime.utcnow())
+            try:
+                self._queue.put_nowait(entry)
+            except queue.Full:
+                overflow.append(entry)
+
+        if overflow:
+            logging.warning(f"Audit queue full - writing {len(overflow)} entries synchronously")
+            db.session.execute(insert(AuditLog), overflow)
+            db.session.commit()
+
+        self._ensure_writer()
+
+    def flush(self):
+        """Write everything currently queued"""
+        while self._write_batch():
+            pass
+
+    def _ensure_writer(self):
+        # Threads don't survive gunicorn's fork after --preload, so start (or restart) per process
+        with self._lock:
+            if self._writer is None or not self._writer.is_alive() or self._writer_pid != os.getpid():
+                self._writer = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+                self._writer_pid = os.getpid()
+                self._writer.start()
+
+    def _run(self):
+        last_pruned = time.monotonic()
+        while True:
+            if time.monotonic() - last_pruned >= PRUNE_INTERVAL_SECONDS:
+                prune_audit_logs()
+                last_pruned = time.monotonic()
+            try:
+                first = self._queue.get(timeout=FLUSH_INTERVAL_SECONDS)
+            except queue.Empty:
+                continue
+            self._write_batch([first])
+
+    def _write_batch(self, batch=None):
+        batch = batch or []
+        while len(batch) < MAX_BATCH_SIZE:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        if not batch:
+            return False
+
+        with app.app_context():
+            try:
+                self._insert_rows(batch)
+            finally:
+                db.session.remove()
+        return True
+
+    def _insert_rows(self, rows):
+        """
+        Insert rows in one statement; if that fails, bisect and retry each half
+        so a single bad row only loses itself rather than the whole batch.
+        """
+        try:
+            db.session.execute(insert(AuditLog), rows)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            if len(rows) == 1:
+                logging.error(f"Dropping audit log entry {rows[0].get('action')!r}: {e}")
+                return
+            middle = len(rows) // 2
+            self._insert_rows(rows[:middle])
+            self._insert_rows(rows[middle:])
+
+
+def prune_audit_logs(max_records: int = PRUNE_MAX_RECORDS_PER_RUN) -> int:
+    """
+    Delete audit rows older than their organization's retention window.
+    Capped per run so a large backlog is worked off gradually instead of in one long delete.
+    """
+    days_to_keep = db.func.coalesce(Organization.audit_log_days_to_keep, DEFAULT_AUDIT_LOG_DAYS_TO_KEEP)
+    cutoff = db.literal(datetime.utcnow(), db.DateTime) - db.func.make_interval(0, 0, 0, days_to_keep)
+    expired_ids = db.select(AuditLog.id).join(
+        Organization, Organization.id == AuditLog.organization_id
+    ).where(AuditLog.timestamp < cutoff).limit(max_records).scalar_subquery()
+
+    with app.app_context():
+        try:
+            deleted = db.session.execute(
+                db.delete(AuditLog).where(AuditLog.id.in_(expired_ids))
+            ).rowcount
+            db.session.commit()
+            if deleted:
+                logging.info(f"Pruned {deleted} expired audit log entries")
+            return deleted
+        except Exception as e:
+            db.session.rollback()
+            logging.error(f"Failed to prune audit log: {e}")
+            return 0
+        finally:
+            db.session.remove()
+
+
+audit_queue = AuditLogQueue()
+
+# Don't drop buffered entries on a clean shutdown
+atexit.register(audit_queue.flush)
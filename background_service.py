@@ -0,0 +1,38 @@
+"""
+Background Task Service for Ez2source
+Runs slow side effects (AI scoring, notifications) off the request thread
+"""
+
+import os
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+from app import app, db
+
+# Shared pool for work that must not hold a request thread; sized independently of gunicorn threads
+executor = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("BACKGROUND_WORKERS", "4")),
+    thread_name_prefix="background"
+)
+
+
+def submit_background_task(func: Callable, *args, **kwargs) -> Future:
+    """
+    Run func(*args, **kwargs) on the background pool inside an application context.
+
+    The task gets its own scoped database session, which is removed when it finishes.
+    Pass plain values (ids, strings, dicts) rather than ORM objects bound to the request session.
+    """
+    def run():
+        with app.app_context():
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                logging.error(f"Background task {func.__name__} failed: {e}")
+                db.session.rollback()
+                raise
+            finally:
+                db.session.remove()
+
+    return executor.submit(run)
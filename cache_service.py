@@ -0,0 +1,83 @@
+"""
+In-process Cache Service for Ez2source
+Small thread-safe TTL caches for hot, rarely-changing read endpoints
+"""
+
+import threading
+import time
+from typing import Any, Callable, Hashable, Optional
+
+
+class TTLCache:
+    """Thread-safe key/value cache whose entries expire after a fixed number of seconds"""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key for ttl_seconds"""
+        with self._lock:
+            self._store(key, value)
+    
+    def add(self, key: Hashable, value: Any) -> bool:
+        """Atomically store value only if key is missing or expired; returns whether it was stored"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] >= time.monotonic():
+                return False
+            self._store(key, value)
+            return True
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return the cached value for key, building and storing it with factory on a miss"""
+        value = self.get(key)
+        if value is None:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a single key if present"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Remove every key for which predicate(key) is true"""
+        with self._lock:
+            for key in [k for k in self._entries if predicate(k)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        # Caller holds self._lock
+        if len(self._entries) >= self.max_entries and key not in self._entries:
+            self._evict_expired()
+            if len(self._entries) >= self.max_entries:
+                # Still full - drop the entry closest to expiry
+                oldest_key = min(self._entries, key=lambda k: self._entries[k][0])
+                del self._entries[oldest_key]
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+    
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        for key in [k for k, (expires_at, _) in self._entries.items() if expires_at < now]:
+            del self._entries[key]
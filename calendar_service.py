@@ -84,6 +84,58 @@ class CalendarService:
             logging.error(f"Error initializing calendar service: {e}")
             return False
     
+    def _build_event_body(self, title, description, start_datetime, end_datetime,
+                          attendee_emails=None, time_zone='UTC'):
+        """Build the insert body for an event with a Google Meet link"""
+        event = {
+            'summary': title,
+            'description': description,
+            'start': {
+                'dateTime': start_datetime.isoformat(),
+                'timeZone': time_zone,
+            },
+            'end': {
+                'dateTime': end_datetime.isoformat(),
+                'timeZone': time_zone,
+            },
+            'conferenceData': {
+                'createRequest': {
+                    'requestId': f"meet-{start_datetime.isoformat()}",
+                    'conferenceSolutionKey': {
+                        'type': 'hangoutsMeet'
+                    }
+                }
+            },
+            'reminders': {
+                'useDefault': False,
+                'overrides': [
+                    {'method': 'email', 'minutes': 24 * 60},  # 1 day before
+                    {'method': 'popup', 'minutes': 30},       # 30 minutes before
+                ],
+            },
+        }
+        
+        if attendee_emails:
+            event['attendees'] = [{'email': email} for email in attendee_emails]
+        
+        return event
+    
+    def _event_result(self, created_event):
+        """Return both event ID and meeting link for a created event"""
+        meet_link = None
+        if 'conferenceData' in created_event and 'entryPoints' in created_event['conferenceData']:
+            for entry_point in created_event['conferenceData']['entryPoints']:
+                if entry_point['entryPointType'] == 'video':
+                    meet_link = entry_point['uri']
+                    break
+        
+        return {
+            'id': created_event.get('id'),
+            'meeting_link': meet_link,
+            'hangout_link': created_event.get('hangoutLink'),  # Fallback
+            'html_link': created_event.get('htmlLink')
+        }
+    
     def create_event(self, title, description, start_datetime, end_datetime, 
                     attendee_emails=None, time_zone='UTC'):
         """Create a calendar event with Google Meet link"""
@@ -92,36 +144,8 @@ class CalendarService:
             return None
             
         try:
-            event = {
-                'summary': title,
-                'description': description,
-                'start': {
-                    'dateTime': start_datetime.isoformat(),
-                    'timeZone': time_zone,
-                },
-                'end': {
-                    'dateTime': end_datetime.isoformat(),
-                    'timeZone': time_zone,
-                },
-                'conferenceData': {
-                    'createRequest': {
-                        'requestId': f"meet-{start_datetime.isoformat()}",
-                        'conferenceSolutionKey': {
-                            'type': 'hangoutsMeet'
-                        }
-                    }
-                },
-                'reminders': {
-                    'useDefault': False,
-                    'overrides': [
-                        {'method': 'email', 'minutes': 24 * 60},  # 1 day before
-                        {'method': 'popup', 'minutes': 30},       # 30 minutes before
-                    ],
-                },
-            }
-            
-            if attendee_emails:
-                event['attendees'] = [{'email': email} for email in attendee_emails]
+            event = self._build_event_body(title, description, start_datetime, end_datetime,
+                                           attendee_emails, time_zone)
             
             # Use conferenceDataVersion=1 to enable Google Meet link creation
             created_event = self.service.events().insert(
@@ -130,25 +154,50 @@ class CalendarService:
                 conferenceDataVersion=1
             ).execute()
             
-            # Return both event ID and meeting link
-            meet_link = None
-            if 'conferenceData' in created_event and 'entryPoints' in created_event['conferenceData']:
-                for entry_point in created_event['conferenceData']['entryPoints']:
-                    if entry_point['entryPointType'] == 'video':
-                        meet_link = entry_point['uri']
-                        break
-            
-            return {
-                'id': created_event.get('id'),
-                'meeting_link': meet_link,
-                'hangout_link': created_event.get('hangoutLink'),  # Fallback
-                'html_link': created_event.get('htmlLink')
-            }
+            return self._event_result(created_event)
             
         except HttpError as error:
             logging.error(f"Error creating calendar event: {error}")
             return None
     
+    def create_events_batch(self, events):
+        """Create several calendar events over batched HTTP requests.
+        
+        Takes a list of create_event keyword-argument dicts and returns a list of
+        results in the same order, with None for events that failed. Runs on the
+        calling thread, so the googleapiclient service is never shared across threads.
+        """
+        if not self.service:
+            logging.error("Calendar service not initialized")
+            return [None] * len(events)
+        
+        results = [None] * len(events)
+        
+        def handle_response(request_id, response, exception):
+            if exception is not None:
+                logging.error(f"Error creating calendar event: {exception}")
+                return
+            results[int(request_id)] = self._event_result(response)
+        
+        # The Calendar API accepts at most 50 calls per batch request
+        for start in range(0, len(events), 50):
+            batch = self.service.new_batch_http_request(callback=handle_response)
+            for index, event_args in enumerate(events[start:start + 50], start):
+                batch.add(
+                    self.service.events().insert(
+                        calendarId='primary',
+                        body=self._build_event_body(**event_args),
+                        conferenceDataVersion=1
+                    ),
+                    request_id=str(index)
+                )
+            try:
+                batch.execute()
+            except HttpError as error:
+                logging.error(f"Error creating calendar events: {error}")
+        
+        return results
+    
     def update_event(self, event_id, title=None, description=None, 
                     start_datetime=None, end_datetime=None, attendee_emails=None):
         """Update an existing calendar event"""
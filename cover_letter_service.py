@@ -16,6 +16,9 @@ openai_client = OpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
 class CoverLetterGenerator:
     """AI-powered cover letter generator with company-specific templates"""
     
+    # Template listing is identical for every instance, so it is built once per process
+    _available_templates = None
+    
     def __init__(self):
         self.company_templates = {
             'google': {
@@ -297,6 +300,9 @@ Sincerely,
 
     def get_available_templates(self) -> Dict:
         """Get list of available templates with descriptions"""
+        if CoverLetterGenerator._available_templates is not None:
+            return CoverLetterGenerator._available_templates
+        
         templates = {}
         
         # Company templates
@@ -319,6 +325,7 @@ Sincerely,
                 'category': 'Role-Specific'
             }
         
+        CoverLetterGenerator._available_templates = templates
         return templates
 
     def analyze_cover_letter(self, cover_letter_text: str, job_requirements: str = "") -> Dict:
@@ -4,14 +4,18 @@ Complete email integration with SMTP configuration, professional templates, and
 """
 
 import os
+import queue
+import secrets
 import smtplib
 import logging
+import threading
+import time
 from datetime import datetime
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from jinja2 import Template
 from models import db, User, Organization, AuditLog, EmailNotification, NotificationPreference
 
@@ -19,11 +23,97 @@ from models import db, User, Organization, AuditLog, EmailNotification, Notifica
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class SMTPConnectionPool:
+    """Bounded pool of logged-in SMTP connections reused across sends to skip per-message TLS setup"""
+    
+    def __init__(self, config: Dict[str, Any], max_connections: int = 4, max_sends_per_second: float = 0):
+        self.config = config
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._min_interval = 1.0 / max_sends_per_second if max_sends_per_second > 0 else 0
+        self._throttle_lock = threading.Lock()
+        self._next_send_at = 0.0
+    
+    def send_message(self, message: MIMEMultipart):
+        """Send on a pooled connection, reconnecting once if the server dropped it while idle"""
+        with self._slots:
+            self._throttle()
+            server, reused = self._checkout()
+            try:
+                server.send_message(message)
+            except Exception as e:
+                self._close(server)
+                if not (reused and self._is_dropped_connection_error(e)):
+                    raise
+                server = self._connect()
+                try:
+                    server.send_message(message)
+                except Exception:
+                    self._close(server)
+                    raise
+            self._idle.put(server)
+    
+    def _checkout(self) -> Tuple[smtplib.SMTP, bool]:
+        """Return (connection, reused); idle connections are checked with NOOP before reuse"""
+        while True:
+            try:
+                server = self._idle.get_nowait()
+            except queue.Empty:
+                return self._connect(), False
+            try:
+                if server.noop()[0] == 250:
+                    return server, True
+            except OSError:
+                pass
+            self._close(server)
+    
+    @staticmethod
+    def _is_dropped_connection_error(error: Exception) -> bool:
+        # Servers end idle sessions with a 421 reply (smtplib then closes the socket) or just reset it
+        if isinstance(error, smtplib.SMTPResponseException):
+            return error.smtp_code == 421
+        if isinstance(error, smtplib.SMTPRecipientsRefused):
+            return any(code == 421 for code, _ in error.recipients.values())
+        if isinstance(error, smtplib.SMTPException):
+            return isinstance(error, smtplib.SMTPServerDisconnected)
+        return isinstance(error, OSError)
+    
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.config['host'], self.config['port'])
+        if self.config['use_tls']:
+            server.starttls()
+        if self.config['username'] and self.config['password']:
+            server.login(self.config['username'], self.config['password'])
+        return server
+    
+    def _close(self, server: smtplib.SMTP):
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+    
+    def _throttle(self):
+        # Space sends out evenly so bulk invites don't trip provider burst limits
+        if not self._min_interval:
+            return
+        with self._throttle_lock:
+            now = time.monotonic()
+            wait = self._next_send_at - now
+            self._next_send_at = max(now, self._next_send_at) + self._min_interval
+        if wait > 0:
+            time.sleep(wait)
+
+
 class EnhancedEmailService:
     """Comprehensive email service with SMTP configuration and template management"""
     
     def __init__(self):
         self.smtp_config = self._load_smtp_config()
+        self.smtp_pool = SMTPConnectionPool(
+            self.smtp_config,
+            max_connections=int(os.environ.get('SMTP_MAX_CONNECTIONS', '4')),
+            max_sends_per_second=float(os.environ.get('SMTP_MAX_SENDS_PER_SECOND', '0'))
+        )
         self.template_cache = {}
         self.delivery_stats = {
             'total_sent': 0,
@@ -212,18 +302,8 @@ class EnhancedEmailService:
     def _send_smtp_email(self, message: MIMEMultipart, to_email: str) -> Dict[str, Any]:
         """Send email via SMTP"""
         try:
-            # Create SMTP connection
-            server = smtplib.SMTP(self.smtp_config['host'], self.smtp_config['port'])
-            
-            if self.smtp_config['use_tls']:
-                server.starttls()
-            
-            if self.smtp_config['username'] and self.smtp_config['password']:
-                server.login(self.smtp_config['username'], self.smtp_config['password'])
-            
-            # Send email
-            server.send_message(message)
-            server.quit()
+            # Send email on a pooled connection
+            self.smtp_pool.send_message(message)
             
             # Update delivery stats
             self.delivery_stats['total_sent'] += 1
@@ -375,6 +455,31 @@ class EnhancedEmailService:
                 logger.error(f"Error sending bulk email to {recipient['email']}: {e}")
         
         return results
+    
+    def generate_secure_password(self) -> str:
+        """Generate a random temporary password for a newly invited user"""
+        return secrets.token_urlsafe(12)
+    
+    def send_user_invitation_email(self, user_email: str, user_name: str, username: str, password: str,
+                                   organization_name: str, role: str, invited_by: str) -> bool:
+        """Send an invited user their login credentials; returns whether the email was delivered"""
+        context = {
+            'user_name': user_name,
+            'username': username,
+            'temporary_password': password,
+            'organization_name': organization_name,
+            'login_url': 'https://ez2source.com/login',
+            'role': role.replace('_', ' ').title(),
+            'message': f'{invited_by} has created an Ez2source account for you at {organization_name}.'
+        }
+        
+        result = self.send_email(
+            to_email=user_email,
+            subject=f'Welcome to Ez2source - {organization_name}',
+            template_name='user_invitation',
+            context=context
+        )
+        return result['success']
 
 # Global service instance
 email_service = EnhancedEmailService()
@@ -67,7 +67,7 @@ class MessagingService:
             self._send_message_notification(recipient, message)
             
             # Log activity
-            self._log_message_activity(sender_id, recipient_id, message.id, 'sent')
+            self._log_message_activity(sender_id, sender.organization_id, recipient_id, message.id, 'sent')
             
             return {
                 'success': True,
@@ -401,11 +401,12 @@ class MessagingService:
         # This would integrate with push notification service
         pass
     
-    def _log_message_activity(self, sender_id: int, recipient_id: int, message_id: int, action: str):
+    def _log_message_activity(self, sender_id: int, organization_id: int, recipient_id: int, message_id: int, action: str):
         """Log message activity for audit trail"""
         try:
             audit_log = AuditLog(
                 user_id=sender_id,
+                organization_id=organization_id,
                 action=f"message_{action}",
                 resource_type="message",
                 resource_id=message_id,
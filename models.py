@@ -1,6 +1,9 @@
 from datetime import datetime
+from functools import cached_property
+import orjson
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import UserMixin
+from sqlalchemy import event, inspect, update
 from app import db
 
 
@@ -14,6 +17,7 @@ class Organization(db.Model):
     is_active = db.Column(db.Boolean, default=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     trial_ends_at = db.Column(db.DateTime)
+    audit_log_days_to_keep = db.Column(db.Integer, default=365)  # Audit rows older than this are pruned
     
     # Relationships
     users = db.relationship('User', backref='organization', lazy=True)
@@ -33,6 +37,25 @@ class SystemSettings(db.Model):
     updated_by = db.Column(db.Integer, db.ForeignKey('user.id'))
 
 
+# Profile completion bit flags - one bit per field required for a complete profile
+PROFILE_FLAG_FIRST_NAME = 1
+PROFILE_FLAG_LAST_NAME = 2
+PROFILE_FLAG_JOB_TITLE = 4
+PROFILE_FLAG_BIO = 8
+PROFILE_FLAG_SKILLS = 16
+PROFILE_FLAG_EXPERIENCE_YEARS = 32
+
+PROFILE_FIELD_FLAGS = {
+    'first_name': PROFILE_FLAG_FIRST_NAME,
+    'last_name': PROFILE_FLAG_LAST_NAME,
+    'job_title': PROFILE_FLAG_JOB_TITLE,
+    'bio': PROFILE_FLAG_BIO,
+    'skills': PROFILE_FLAG_SKILLS,
+    'experience_years': PROFILE_FLAG_EXPERIENCE_YEARS,
+}
+PROFILE_REQUIRED_MASK = sum(PROFILE_FIELD_FLAGS.values())
+
+
 class User(UserMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), nullable=False)
@@ -68,6 +91,7 @@ class User(UserMixin, db.Model):
     reset_token_expires = db.Column(db.DateTime)
     last_login = db.Column(db.DateTime)
     profile_completed = db.Column(db.Boolean, default=False)
+    profile_flags = db.Column(db.Integer, default=0)  # Bitmask of PROFILE_FIELD_FLAGS that are filled in
     experience = db.Column(db.Text)  # JSON string of work experience
     
     # Universal Profile Access fields
@@ -84,13 +108,80 @@ class User(UserMixin, db.Model):
     
     # Career Journey Step Completion Tracking removed - Ez2source focuses on core talent intelligence features
     
-    # Composite unique constraint for username within organization
+    # Composite unique constraints for username/email within organization; their indexes also serve
+    # the (email, organization_id) and (username, organization_id) lookups in invites and sign-up.
+    # Directory and scheduling filters on (organization_id, role, user_active) use idx_user_org_role_active.
     __table_args__ = (db.UniqueConstraint('username', 'organization_id', name='_username_org_uc'),
-                      db.UniqueConstraint('email', 'organization_id', name='_email_org_uc'))
+                      db.UniqueConstraint('email', 'organization_id', name='_email_org_uc'),
+                      db.Index('idx_user_org_role_active', 'organization_id', 'role', 'user_active'),
+                      db.Index('idx_user_org_role_when_active', 'organization_id', 'role',
+                               postgresql_where=db.text('user_active')))
     
     # Relationships
     interviews_created = db.relationship('Interview', backref='creator', lazy=True, foreign_keys='Interview.recruiter_id')
     interview_responses = db.relationship('InterviewResponse', backref='candidate', lazy=True)
+    
+    # Parsed views of the JSON text columns, decoded at most once per loaded instance
+    @cached_property
+    def skills_list(self):
+        return parse_json_list(self.skills)
+    
+    @cached_property
+    def education_list(self):
+        return parse_json_list(self.education)
+    
+    @cached_property
+    def certifications_list(self):
+        return parse_json_list(self.certifications)
+    
+    @cached_property
+    def experience_list(self):
+        return parse_json_list(self.experience)
+
+
+def parse_json_list(raw):
+    """Decode a JSON array stored in a Text column, returning [] for empty or invalid values"""
+    if not raw:
+        return []
+    try:
+        value = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return []
+    return value if isinstance(value, list) else []
+
+
+def _clear_parsed_json_list(target, value, oldvalue, initiator):
+    target.__dict__.pop(initiator.key + '_list', None)
+
+
+# Drop the cached parsed list whenever the underlying JSON column is reassigned
+for _field in ('skills', 'education', 'certifications', 'experience'):
+    event.listen(getattr(User, _field), 'set', _clear_parsed_json_list)
+
+
+def compute_profile_flags(user):
+    """Build the profile completion bitmask from the user's current field values"""
+    flags = 0
+    for field, flag in PROFILE_FIELD_FLAGS.items():
+        if getattr(user, field, None):
+            flags |= flag
+    return flags
+
+
+def _profile_flag_listener(flag):
+    def update_profile_flags(target, value, oldvalue, initiator):
+        flags = target.profile_flags
+        if flags is None:
+            # Existing rows are backfilled at startup (schema_migrations); compute as a fallback
+            flags = compute_profile_flags(target)
+        target.profile_flags = (flags | flag) if value else (flags & ~flag)
+    return update_profile_flags
+
+
+# Keep profile_flags in sync whenever one of the required fields is assigned
+for _field, _flag in PROFILE_FIELD_FLAGS.items():
+    event.listen(getattr(User, _field), 'set', _profile_flag_listener(_flag))
+
 
 class Interview(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -114,6 +205,11 @@ class Interview(db.Model):
     responses = db.relationship('InterviewResponse', backref='interview', lazy=True)
     invitations = db.relationship('InterviewInvitation', backref='interview', lazy=True)
 
+    __table_args__ = (
+        db.Index('idx_interview_org_type_active', 'organization_id', 'interview_type', 'is_active'),
+        db.Index('idx_interview_recruiter', 'recruiter_id'),
+    )
+
 class InterviewResponse(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     interview_id = db.Column(db.Integer, db.ForeignKey('interview.id'), nullable=False)
@@ -124,7 +220,7 @@ class InterviewResponse(db.Model):
     ai_feedback = db.Column(db.Text)
     completed_at = db.Column(db.DateTime, default=datetime.utcnow)
     time_taken_minutes = db.Column(db.Integer)
-    status = db.Column(db.String(20), default='completed')  # completed, reviewed, pending
+    status = db.Column(db.String(20), default='completed')  # scoring, completed, reviewed, pending
     
     # Composite unique constraint to prevent duplicate responses
     __table_args__ = (db.UniqueConstraint('interview_id', 'candidate_id', name='_interview_candidate_uc'),)
@@ -186,6 +282,8 @@ class IntegrationSettings(db.Model):
 class AuditLog(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    # Denormalized from the acting user (callers pass it) so per-organization log views are an index range scan
+    organization_id = db.Column(db.Integer, db.ForeignKey('organization.id'), nullable=False)
     action = db.Column(db.String(100), nullable=False)
     resource_type = db.Column(db.String(50), nullable=False)
     resource_id = db.Column(db.Integer)
@@ -196,6 +294,10 @@ class AuditLog(db.Model):
     
     # Relationships
     user = db.relationship('User', backref='audit_logs')
+    
+    __table_args__ = (
+        db.Index('idx_audit_log_org_timestamp', 'organization_id', 'timestamp'),
+    )
 
 class EmailNotification(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -251,6 +353,10 @@ class InterviewSchedule(db.Model):
     interview = db.relationship('Interview', backref='schedules')
     candidate = db.relationship('User', foreign_keys=[candidate_id], backref='candidate_schedules')
     recruiter = db.relationship('User', foreign_keys=[recruiter_id], backref='recruiter_schedules')
+    
+    __table_args__ = (
+        db.Index('idx_schedule_interview_candidate', 'interview_id', 'candidate_id'),
+    )
 
 class AvailabilitySlot(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -297,7 +403,12 @@ class InterviewInvitation(db.Model):
     candidate = db.relationship('User', foreign_keys=[candidate_id], backref='interview_invitations')
     recruiter = db.relationship('User', foreign_keys=[recruiter_id], backref='sent_invitations')
     
-    __table_args__ = (db.UniqueConstraint('interview_id', 'candidate_id', name='_interview_candidate_invitation_uc'),)
+    __table_args__ = (
+        db.UniqueConstraint('interview_id', 'candidate_id', name='_interview_candidate_invitation_uc'),
+        db.Index('idx_invitation_candidate_status_invited', 'candidate_id', 'status', 'invited_at'),
+        db.Index('idx_invitation_candidate_pending', 'candidate_id', 'invited_at',
+                 postgresql_where=db.text("status = 'pending'")),
+    )
 
 class InterviewApplication(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -335,6 +446,8 @@ class Company(db.Model):
     culture_keywords = db.Column(db.Text)  # JSON string for company culture
     glassdoor_rating = db.Column(db.Float)
     is_hiring = db.Column(db.Boolean, default=True)
+    # Denormalized count of active job postings, maintained by the JobPosting mapper events below
+    active_job_count = db.Column(db.Integer, default=0, nullable=False)
     last_scraped = db.Column(db.DateTime)
     scraping_enabled = db.Column(db.Boolean, default=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -399,10 +512,47 @@ class JobPosting(db.Model):
         db.Index('idx_job_salary', 'salary_min', 'salary_max'),
         db.Index('idx_job_experience', 'experience_level'),
         db.Index('idx_job_active', 'is_active'),
+        db.Index('idx_job_company_active', 'company_id', 'is_active'),
         db.Index('idx_job_posted_date', 'posted_date'),
     )
 
 
+def _adjust_active_job_count(connection, company_id, delta):
+    if company_id is not None and delta:
+        connection.execute(
+            update(Company).where(Company.id == company_id).values(
+                active_job_count=Company.active_job_count + delta
+            )
+        )
+
+
+@event.listens_for(JobPosting, 'after_insert')
+def _job_posting_inserted(mapper, connection, target):
+    if target.is_active:
+        _adjust_active_job_count(connection, target.company_id, 1)
+
+
+@event.listens_for(JobPosting, 'after_delete')
+def _job_posting_deleted(mapper, connection, target):
+    if target.is_active:
+        _adjust_active_job_count(connection, target.company_id, -1)
+
+
+@event.listens_for(JobPosting, 'after_update')
+def _job_posting_updated(mapper, connection, target):
+    state = inspect(target)
+    active_history = state.attrs.is_active.history
+    company_history = state.attrs.company_id.history
+    if not active_history.has_changes() and not company_history.has_changes():
+        return
+    was_active = active_history.deleted[0] if active_history.deleted else target.is_active
+    old_company_id = company_history.deleted[0] if company_history.deleted else target.company_id
+    if was_active:
+        _adjust_active_job_count(connection, old_company_id, -1)
+    if target.is_active:
+        _adjust_active_job_count(connection, target.company_id, 1)
+
+
 class SavedJob(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
@@ -624,6 +774,9 @@ class CandidateTag(db.Model):
     # Relationships
     organization = db.relationship('Organization', backref='candidate_tags')
     creator = db.relationship('User', backref='created_tags')
+    
+    # Tag names are unique per organization; create_tag relies on this instead of a pre-check
+    __table_args__ = (db.UniqueConstraint('organization_id', 'name', name='_candidate_tag_org_name_uc'),)
 
 
 class CandidateTagAssignment(db.Model):
@@ -638,6 +791,9 @@ class CandidateTagAssignment(db.Model):
     candidate = db.relationship('User', foreign_keys=[candidate_id], backref='tag_assignments')
     tag = db.relationship('CandidateTag', backref='assignments')
     assigner = db.relationship('User', foreign_keys=[assigned_by])
+    
+    # A tag is assigned to a candidate at most once; also the conflict target for bulk tagging
+    __table_args__ = (db.UniqueConstraint('candidate_id', 'tag_id', name='_tag_assignment_candidate_tag_uc'),)
 
 
 class CandidateList(db.Model):
@@ -653,6 +809,9 @@ class CandidateList(db.Model):
     # Relationships
     organization = db.relationship('Organization', backref='candidate_lists')
     creator = db.relationship('User', backref='created_lists')
+    
+    # List names are unique per organization; create_candidate_list relies on this instead of a pre-check
+    __table_args__ = (db.UniqueConstraint('organization_id', 'name', name='_candidate_list_org_name_uc'),)
 
 
 class CandidateListMembership(db.Model):
@@ -667,6 +826,9 @@ class CandidateListMembership(db.Model):
     candidate_list = db.relationship('CandidateList', backref='memberships')
     candidate = db.relationship('User', foreign_keys=[candidate_id], backref='list_memberships')
     adder = db.relationship('User', foreign_keys=[added_by])
+    
+    # A candidate appears in a list at most once; also the conflict target for bulk adds
+    __table_args__ = (db.UniqueConstraint('list_id', 'candidate_id', name='_list_membership_list_candidate_uc'),)
 
 
 class TechnicalInterviewAssignment(db.Model):
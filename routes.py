@@ -1,12 +1,24 @@
+import hashlib
+import io
 import json
 import logging
 import os
 import re
-from datetime import datetime, timedelta
-from flask import render_template, request, redirect, url_for, flash, jsonify, make_response, send_from_directory
+import shutil
+import uuid
+from functools import wraps
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import orjson
+from datetime import datetime, timedelta, timezone
+from flask import render_template, request, redirect, url_for, flash, jsonify, make_response, send_from_directory, Response, stream_with_context
 from flask_login import login_user, logout_user, login_required, current_user
 from werkzeug.security import generate_password_hash, check_password_hash
 from werkzeug.utils import secure_filename
+from sqlalchemy import insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload, load_only, selectinload
 from app import app, db
 from models import (
     User, Interview, InterviewResponse, Question, VideoRecording, TeamMember, 
@@ -18,10 +30,12 @@ from models import (
     TechnicalPersonNotification, CVAnalysis, CoverLetter, CoverLetterTemplate, CoverLetterFeedback,
     ResumeTemplate, Resume, ResumeWorkExperience, ResumeEducation, ResumeProject,
     ResumeAchievement, ResumeAnalysis, ResumeFeedback, InterviewPracticeSession,
-    Message, NotificationSettings, TeamCollaboration
+    Message, NotificationSettings, TeamCollaboration,
+    PROFILE_REQUIRED_MASK, compute_profile_flags
 )
 from organization_assignment_service import OrganizationAssignmentService
 from ai_service import generate_interview_questions, score_interview_responses, analyze_video_interview
+from ai_service import openai as openai_client, create_chat_completion, BACKGROUND_MAX_ATTEMPTS
 from voice_service import transcribe_audio, validate_audio_file
 from validation_service import ValidationService
 from form_validation_service import FormValidationService, validate_form_data, get_form_errors_html
@@ -39,6 +53,50 @@ from enhanced_email_service import (
     get_email_delivery_stats, email_service
 )
 from hr_registration_service import hr_registration_service
+from cache_service import TTLCache
+from background_service import submit_background_task
+from audit_service import audit_queue
+from view_count_service import job_view_counts
+
+# Role groups used by access checks
+ADMIN_ROLES = frozenset({'admin', 'super_admin'})
+RECRUITER_OR_ADMIN_ROLES = frozenset({'recruiter', 'admin'})
+# Roles each kind of admin may assign when inviting users
+ALLOWED_ROLES_FOR_ADMIN = frozenset({'candidate', 'recruiter', 'technical_person'})
+ALLOWED_ROLES_FOR_SUPER_ADMIN = ALLOWED_ROLES_FOR_ADMIN | {'admin'}
+
+# Serialized interview lists for the invitation/scheduling pickers, keyed by (interview_type, organization_id)
+interview_list_cache = TTLCache(ttl_seconds=60)
+# Parsed interview questions keyed by interview id (questions are not edited after creation)
+interview_questions_cache = TTLCache(ttl_seconds=3600)
+# Instant chat interview feedback produced by background scoring, keyed by response id
+chat_feedback_cache = TTLCache(ttl_seconds=900)
+# Organization names keyed by organization id; cleared when an organization is edited
+organization_name_cache = TTLCache(ttl_seconds=600)
+# Generated cover letters keyed by a hash of the exact candidate/job/template inputs
+cover_letter_cache = TTLCache(ttl_seconds=3600)
+# Downloadable text resumes keyed by (user_id, updated_at); the short TTL picks up new interview results
+text_resume_cache = TTLCache(ttl_seconds=300)
+# Voice dictation transcription jobs run on the background pool, keyed by job id
+transcription_cache = TTLCache(ttl_seconds=600)
+# Interview responses whose AI summary is being regenerated in the background; coalesces repeat clicks
+summary_regeneration_jobs = TTLCache(ttl_seconds=300)
+# Finished summary regenerations keyed by response id, held until the client polls them
+regenerated_summary_cache = TTLCache(ttl_seconds=300)
+# AI job match scores keyed by (user_id, job_id, profile updated_at, hash of MATCH_SCORE_JOB_FIELDS)
+match_score_cache = TTLCache(ttl_seconds=86400)
+# JobPosting content a match score depends on; counters and timestamps are left out
+MATCH_SCORE_JOB_FIELDS = (
+    'title', 'description', 'requirements', 'experience_level', 'location', 'remote_type',
+    'technologies', 'programming_languages', 'frameworks', 'databases', 'cloud_platforms'
+)
+# (id, name) rows for the post-job company dropdown; cleared when a company is added
+company_choices_cache = TTLCache(ttl_seconds=60, max_entries=1)
+# Candidate communication flags and summary for the filter page, keyed by (recruiter_id, organization_id)
+communication_flags_cache = TTLCache(ttl_seconds=30)
+# Tag and list rows for the candidate filter dropdowns, keyed by ('tags' | 'lists', organization_id);
+# cleared when a tag or list is created
+candidate_filter_choices_cache = TTLCache(ttl_seconds=300)
 
 # Helper function for profile completion calculation
 def calculate_profile_completion(user):
@@ -70,6 +128,135 @@ def safe_json_loads(json_str, default=None):
     except (json.JSONDecodeError, TypeError, ValueError):
         return default
 
+# Helper function for JSON serialization of Text columns
+def json_dumps(obj):
+    """Serialize to a JSON string using orjson"""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+# Helper function for interview question lists
+def get_interview_questions(interview):
+    """Return the parsed questions for an interview, decoding the JSON column once per cache window"""
+    return interview_questions_cache.get_or_set(interview.id, lambda: orjson.loads(interview.questions))
+
+# Helper functions for decoding JSON request bodies
+def parse_chat_submission(raw_body):
+    """
+    Decode and validate a chat interview submission in one pass over the request bytes.
+    Returns (formatted_answers, time_taken); raises ValueError on a malformed body.
+    """
+    data = orjson.loads(raw_body)
+    responses = data.get('responses', []) if isinstance(data, dict) else None
+    if not isinstance(responses, list) or not all(isinstance(item, dict) for item in responses):
+        raise ValueError("responses must be a list of objects")
+    
+    formatted_answers = {
+        str(i): {
+            'question': str(item.get('question') or ''),
+            'answer': str(item.get('answer') or ''),
+            'timestamp': str(item.get('timestamp') or ''),
+            'response_type': 'chat'
+        }
+        for i, item in enumerate(responses)
+    }
+    return formatted_answers, int(data.get('time_taken') or 0)
+
+def parse_bulk_schedule_request(raw_body):
+    """
+    Decode and validate a bulk scheduling request, applying defaults and coercing types once.
+    Raises ValueError on a malformed body.
+    """
+    data = orjson.loads(raw_body)
+    if not isinstance(data, dict) or not isinstance(data.get('candidate_ids', []), list):
+        raise ValueError("expected an object with a candidate_ids list")
+    
+    params = {
+        'interview_id': int(data['interview_id']),
+        'candidate_ids': [int(candidate_id) for candidate_id in data.get('candidate_ids', [])],
+        'start_date': data.get('start_date'),
+        'end_date': data.get('end_date'),
+        'start_time': data.get('start_time'),
+        'end_time': data.get('end_time'),
+        'duration_minutes': int(data.get('duration_minutes', 60)),
+        'break_minutes': int(data.get('break_minutes', 15)),
+        'time_zone': data.get('time_zone', 'UTC'),
+        'auto_assign': bool(data.get('auto_assign', False))
+    }
+    if params['duration_minutes'] <= 0 or params['break_minutes'] < 0:
+        raise ValueError("duration_minutes must be positive and break_minutes non-negative")
+    return params
+
+# Helper function for organization display names
+def get_organization_name(organization_id):
+    """Return an organization's name without a per-request lookup, or None if it doesn't exist"""
+    if organization_id is None:
+        return None
+    return organization_name_cache.get_or_set(
+        organization_id,
+        lambda: db.session.query(Organization.name).filter(Organization.id == organization_id).scalar()
+    )
+
+# Helper function for writing audit trail rows
+def log_audit_bulk(entries):
+    """Insert audit log rows as one multi-row INSERT without tracking ORM objects"""
+    if entries:
+        db.session.execute(insert(AuditLog), entries)
+
+# Helper functions for generated usernames
+def username_variants_clause(*base_usernames):
+    """SQL condition matching each base username and its base_username_N variants"""
+    alternatives = '|'.join(re.escape(base_username) for base_username in base_usernames)
+    return User.username.op('~')(f'^({alternatives})(_[0-9]+)?$')
+
+def paginate_with_total(query, page, per_page):
+    """
+    Return (items, total) for one page of an ORM query in a single round-trip,
+    reading the total from COUNT(*) OVER () instead of a separate count() query.
+    """
+    rows = query.add_columns(db.func.count().over().label('total_count')).offset(
+        (page - 1) * per_page
+    ).limit(per_page).all()
+    if rows:
+        return [row[0] for row in rows], rows[0].total_count
+    # A page past the end has no rows to carry the total
+    return [], query.order_by(None).count() if page > 1 else 0
+
+def first_free_username(base_username, taken):
+    """Return base_username, or base_username_N with the first N not in taken"""
+    username = base_username
+    counter = 1
+    while username in taken:
+        username = f"{base_username}_{counter}"
+        counter += 1
+    return username
+
+def generate_unique_username(base_username, organization_id=None):
+    """
+    Return a free username derived from base_username, using one query for every taken variant.
+    Scoped to an organization when organization_id is given, otherwise system-wide.
+    """
+    taken_query = db.session.query(User.username).filter(username_variants_clause(base_username))
+    if organization_id is not None:
+        taken_query = taken_query.filter(User.organization_id == organization_id)
+    return first_free_username(base_username, {row.username for row in taken_query})
+
+# Helper decorator for role-restricted routes
+def require_role(*roles, message=None):
+    """
+    Reject users whose role is not in roles. With a message the user is flashed and sent to the
+    dashboard (page routes); without one a JSON 403 is returned (API routes).
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if current_user.role not in roles:
+                if message:
+                    flash(message, 'error')
+                    return redirect(url_for('dashboard'))
+                return jsonify({'error': 'Access denied'}), 403
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
+
 @app.route('/')
 def index():
     """Landing page - shows different content based on user role"""
@@ -224,7 +411,7 @@ def hr_register():
 def guest_admin_dashboard():
     """Guest Admin Dashboard for managing Guest HR users"""
     # Check if user is Guest Admin
-    if not (current_user.role == 'admin' and current_user.organization.name == 'Guest Organization'):
+    if not (current_user.role == 'admin' and get_organization_name(current_user.organization_id) == 'Guest Organization'):
         flash('Access denied. Guest Admin privileges required.', 'error')
         return redirect(url_for('dashboard'))
     
@@ -266,7 +453,7 @@ def guest_admin_dashboard():
 def guest_admin_review_hr(user_id):
     """Review Guest HR user details"""
     # Check if user is Guest Admin
-    if not (current_user.role == 'admin' and current_user.organization.name == 'Guest Organization'):
+    if not (current_user.role == 'admin' and get_organization_name(current_user.organization_id) == 'Guest Organization'):
         flash('Access denied. Guest Admin privileges required.', 'error')
         return redirect(url_for('dashboard'))
     
@@ -297,7 +484,7 @@ def guest_admin_review_hr(user_id):
 def guest_admin_approve_hr(user_id):
     """Approve Guest HR user for limited access"""
     # Check if user is Guest Admin
-    if not (current_user.role == 'admin' and current_user.organization.name == 'Guest Organization'):
+    if not (current_user.role == 'admin' and get_organization_name(current_user.organization_id) == 'Guest Organization'):
         flash('Access denied. Guest Admin privileges required.', 'error')
         return redirect(url_for('dashboard'))
     
@@ -347,7 +534,7 @@ def guest_admin_approve_hr(user_id):
 def guest_admin_transfer_hr(user_id):
     """Transfer Guest HR user to appropriate organization"""
     # Check if user is Guest Admin
-    if not (current_user.role == 'admin' and current_user.organization.name == 'Guest Organization'):
+    if not (current_user.role == 'admin' and get_organization_name(current_user.organization_id) == 'Guest Organization'):
         flash('Access denied. Guest Admin privileges required.', 'error')
         return redirect(url_for('dashboard'))
     
@@ -665,7 +852,7 @@ def dashboard():
                              user_role='recruiter')
     elif current_user.role == 'admin':
         # Check if this is Guest Admin
-        if current_user.organization.name == 'Guest Organization':
+        if get_organization_name(current_user.organization_id) == 'Guest Organization':
             return redirect(url_for('guest_admin_dashboard'))
         
         # Admin dashboard - show organization statistics
@@ -798,12 +985,9 @@ def dashboard():
 
 @app.route('/interview/create', methods=['GET', 'POST'])
 @login_required
+@require_role('recruiter', message='Access denied. Only recruiters can create interviews.')
 def create_interview():
     """Interview builder for recruiters"""
-    if current_user.role != 'recruiter':
-        flash('Access denied. Only recruiters can create interviews.', 'error')
-        return redirect(url_for('dashboard'))
-    
     if request.method == 'POST':
         title = request.form['title']
         job_description = request.form['job_description']
@@ -836,6 +1020,7 @@ def create_interview():
             
             db.session.add(interview)
             db.session.commit()
+            invalidate_interview_lists(interview.organization_id)
             
             # Success message based on interview type
             if interview_type == 'public':
@@ -953,7 +1138,7 @@ def interview_interface(interview_id):
         flash('You have already completed this interview.', 'info')
         return redirect(url_for('interview_results', response_id=existing_response.id))
     
-    questions = json.loads(interview.questions)
+    questions = get_interview_questions(interview)
     return render_template('interview_interface.html', interview=interview, questions=questions)
 
 @app.route('/interview/<int:interview_id>/submit', methods=['POST'])
@@ -985,7 +1170,7 @@ def submit_interview(interview_id):
     try:
         # Get answers from form
         answers = {}
-        questions = json.loads(interview.questions)
+        questions = get_interview_questions(interview)
         
         for i, question in enumerate(questions):
             answer_key = f'answer_{i}'
@@ -1005,7 +1190,7 @@ def submit_interview(interview_id):
             interview_id=interview_id,
             candidate_id=current_user.id,
             organization_id=current_user.organization_id,
-            answers=json.dumps(answers),
+            answers=json_dumps(answers),
             ai_score=score,
             ai_feedback=feedback,
             time_taken_minutes=int(time_taken) if time_taken else None
@@ -1039,7 +1224,7 @@ def interview_results(response_id):
         return redirect(url_for('dashboard'))
     
     try:
-        answers = json.loads(response.answers)
+        answers = orjson.loads(response.answers)
         # Ensure answers is a dictionary for template compatibility
         if isinstance(answers, list):
             answers = {str(i): answer for i, answer in enumerate(answers)}
@@ -1050,12 +1235,9 @@ def interview_results(response_id):
 
 @app.route('/candidates/<int:interview_id>')
 @login_required
+@require_role('recruiter', message='Access denied. Only recruiters can view analytics.')
 def candidate_analytics(interview_id):
     """Candidate analytics for recruiters"""
-    if current_user.role != 'recruiter':
-        flash('Access denied. Only recruiters can view analytics.', 'error')
-        return redirect(url_for('dashboard'))
-    
     interview = Interview.query.filter_by(
         id=interview_id,
         organization_id=current_user.organization_id
@@ -1111,6 +1293,7 @@ def toggle_interview_status():
         # Update the status
         interview.is_active = is_active
         db.session.commit()
+        invalidate_interview_lists(interview.organization_id)
         
         return jsonify({
             'success': True,
@@ -1321,12 +1504,9 @@ def not_found_error(error):
 
 @app.route('/analytics/advanced')
 @login_required
+@require_role('recruiter', message='Access denied. Only recruiters can view advanced analytics.')
 def advanced_analytics():
     """Advanced analytics dashboard with filtering and charts"""
-    if current_user.role != 'recruiter':
-        flash('Access denied. Only recruiters can view advanced analytics.', 'error')
-        return redirect(url_for('dashboard'))
-    
     # Get filter parameters
     start_date = request.args.get('start_date')
     end_date = request.args.get('end_date')
@@ -1394,12 +1574,9 @@ def advanced_analytics():
 
 @app.route('/candidate/<int:candidate_id>/profile')
 @login_required
+@require_role('recruiter', message='Access denied. Only recruiters can view candidate profiles.')
 def recruiter_view_candidate_profile(candidate_id):
     """Detailed candidate profile for recruiters"""
-    if current_user.role != 'recruiter':
-        flash('Access denied. Only recruiters can view candidate profiles.', 'error')
-        return redirect(url_for('dashboard'))
-    
     candidate = User.query.get_or_404(candidate_id)
     if candidate.role != 'candidate':
         flash('Invalid candidate ID.', 'error')
@@ -1459,11 +1636,9 @@ def recruiter_view_candidate_profile(candidate_id):
 
 @app.route('/compare_candidates', methods=['POST'])
 @login_required
+@require_role('recruiter')
 def compare_candidates():
     """Compare multiple candidates side by side"""
-    if current_user.role != 'recruiter':
-        return jsonify({'error': 'Access denied'}), 403
-    
     data = request.get_json()
     response_ids = data.get('response_ids', [])
     
@@ -1480,11 +1655,9 @@ def compare_candidates():
 
 @app.route('/bulk_action', methods=['POST'])
 @login_required
+@require_role('recruiter')
 def bulk_action():
     """Handle bulk actions on interview responses"""
-    if current_user.role != 'recruiter':
-        return jsonify({'error': 'Access denied'}), 403
-    
     data = request.get_json()
     action = data.get('action')
     response_ids = data.get('response_ids', [])
@@ -1510,12 +1683,9 @@ def bulk_action():
 
 @app.route('/export_report', methods=['POST'])
 @login_required
+@require_role('recruiter', message='Access denied.')
 def export_report():
     """Export analytics report in various formats"""
-    if current_user.role != 'recruiter':
-        flash('Access denied.', 'error')
-        return redirect(url_for('dashboard'))
-    
     format_type = request.form.get('format', 'pdf')
     
     # Get filtered data
@@ -1552,7 +1722,7 @@ def export_report():
 @login_required
 def team_management():
     """Team management dashboard for enterprise users"""
-    if current_user.role not in ['admin', 'recruiter']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         flash('Access denied. Insufficient permissions.', 'error')
         return redirect(url_for('dashboard'))
     
@@ -1560,16 +1730,20 @@ def team_management():
     organization_id = 1
     team_members = []
     
-    # Get all recruiters as team members
-    recruiters = User.query.filter_by(role='recruiter').all()
-    for recruiter in recruiters:
-        # Calculate stats for each recruiter
-        interviews_count = Interview.query.filter_by(recruiter_id=recruiter.id).count()
-        responses = InterviewResponse.query.join(Interview).filter(
-            Interview.recruiter_id == recruiter.id
-        ).all()
-        responses_count = len(responses)
-        avg_score = sum(r.ai_score for r in responses) / len(responses) if responses else 0
+    # Get all recruiters as team members, with their stats aggregated in the database
+    recruiter_stats = db.session.query(
+        User,
+        db.func.count(db.distinct(Interview.id)),
+        db.func.count(InterviewResponse.id),
+        db.func.coalesce(db.func.avg(InterviewResponse.ai_score), 0.0)
+    ).outerjoin(
+        Interview, Interview.recruiter_id == User.id
+    ).outerjoin(
+        InterviewResponse, InterviewResponse.interview_id == Interview.id
+    ).filter(User.role == 'recruiter').group_by(User.id).order_by(User.id).all()
+    
+    for recruiter, interviews_count, responses_count, avg_score in recruiter_stats:
+        avg_score = float(avg_score)
         
         # Create team member object
         member_data = type('obj', (object,), {
@@ -1601,7 +1775,7 @@ def team_management():
 @login_required
 def test_webhook():
     """Test webhook connectivity"""
-    if current_user.role not in ['admin', 'recruiter']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         return jsonify({'error': 'Access denied'}), 403
     
     data = request.get_json()
@@ -1637,7 +1811,7 @@ def test_webhook():
 @login_required
 def test_ats_connection():
     """Test ATS integration connectivity"""
-    if current_user.role not in ['admin', 'recruiter']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         return jsonify({'error': 'Access denied'}), 403
     
     data = request.get_json()
@@ -1658,7 +1832,7 @@ def test_ats_connection():
 @login_required
 def save_integration_settings():
     """Save integration settings"""
-    if current_user.role not in ['admin', 'recruiter']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         return jsonify({'error': 'Access denied'}), 403
     
     try:
@@ -1690,9 +1864,10 @@ def save_integration_settings():
         # Log the action
         audit_log = AuditLog(
             user_id=current_user.id,
+            organization_id=current_user.organization_id,
             action='update_integration_settings',
             resource_type='settings',
-            details=json.dumps({'settings_updated': list(settings.keys())}),
+            details=json_dumps({'settings_updated': list(settings.keys())}),
             ip_address=request.remote_addr,
             user_agent=request.headers.get('User-Agent')
         )
@@ -1747,10 +1922,11 @@ def add_team_member():
         # Log the action
         audit_log = AuditLog(
             user_id=current_user.id,
+            organization_id=current_user.organization_id,
             action='add_team_member',
             resource_type='user',
             resource_id=new_user.id,
-            details=json.dumps({'email': email, 'role': role})
+            details=json_dumps({'email': email, 'role': role})
         )
         db.session.add(audit_log)
         
@@ -1814,7 +1990,7 @@ def submit_application(interview_id):
 @login_required
 def manage_applications():
     """Manage candidate applications for recruiter's interviews"""
-    if current_user.role not in ['recruiter', 'admin']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         flash('Access denied.', 'danger')
         return redirect(url_for('dashboard'))
     
@@ -1836,7 +2012,7 @@ def manage_applications():
 @login_required
 def approve_application(application_id):
     """Approve candidate application"""
-    if current_user.role not in ['recruiter', 'admin']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         flash('Access denied.', 'danger')
         return redirect(url_for('dashboard'))
     
@@ -1863,7 +2039,7 @@ def approve_application(application_id):
 @login_required
 def reject_application(application_id):
     """Reject candidate application"""
-    if current_user.role not in ['recruiter', 'admin']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         flash('Access denied.', 'danger')
         return redirect(url_for('dashboard'))
     
@@ -1890,7 +2066,7 @@ def reject_application(application_id):
 @login_required
 def admin_view_interviews():
     """Admin can view all interviews in their organization"""
-    if current_user.role not in ['admin', 'super_admin']:
+    if current_user.role not in ADMIN_ROLES:
         flash('Access denied.', 'danger')
         return redirect(url_for('dashboard'))
     
@@ -2177,9 +2353,9 @@ def candidate_resume_register():
         phone=normalized_phone,
         job_title=extracted_info.get('job_title', ''),
         bio=extracted_info.get('bio', ''),
-        skills=json.dumps(extracted_info.get('skills', [])),
+        skills=json_dumps(extracted_info.get('skills', [])),
         experience_years=extracted_info.get('experience_years', 0),
-        education=json.dumps(extracted_info.get('education', [])),
+        education=json_dumps(extracted_info.get('education', [])),
         resume_url=resume_path,
         profile_completed=True,
         # Enable cross-organization access by default for universal visibility
@@ -2395,7 +2571,7 @@ def work_experience_details(user_id):
     work_experiences = []
     if candidate.experience:
         try:
-            work_experiences = json.loads(candidate.experience)
+            work_experiences = orjson.loads(candidate.experience)
         except json.JSONDecodeError:
             work_experiences = []
     
@@ -2425,9 +2601,9 @@ def linkedin_import():
         
         # Update user profile with extracted info
         current_user.bio = extracted_info.get('bio', current_user.bio)
-        current_user.skills = json.dumps(extracted_info.get('skills', json.loads(current_user.skills or '[]')))
-        current_user.experience = json.dumps(extracted_info.get('experience', json.loads(current_user.experience or '[]')))
-        current_user.education = json.dumps(extracted_info.get('education', json.loads(current_user.education or '[]')))
+        current_user.skills = json_dumps(extracted_info.get('skills', orjson.loads(current_user.skills or '[]')))
+        current_user.experience = json_dumps(extracted_info.get('experience', orjson.loads(current_user.experience or '[]')))
+        current_user.education = json_dumps(extracted_info.get('education', orjson.loads(current_user.education or '[]')))
         current_user.linkedin_url = linkedin_url
         
         if not current_user.first_name and extracted_info.get('first_name'):
@@ -2646,7 +2822,6 @@ def cv_checker():
         # Handle CV upload and analysis
         from cv_checker_service import analyze_candidate_cv
         from resume_parser import ResumeParser
-        import os
         
         if 'cv_file' not in request.files:
             flash('No file selected', 'danger')
@@ -2693,7 +2868,6 @@ def cv_checker():
                 analysis_result = analyze_candidate_cv(cv_text, current_user.first_name or current_user.username)
                 
                 # Save analysis to database
-                import json
                 
                 try:
                     cv_analysis = CVAnalysis(
@@ -2737,7 +2911,6 @@ def cv_checker():
                 return redirect(url_for('cv_checker'))
     
     # GET request - show the page
-    import json
     try:
         # Handle any pending database issues
         db.session.rollback()
@@ -2763,8 +2936,6 @@ def cv_checker_upload():
     """Analyze uploaded CV and provide feedback"""
     from cv_checker_service import analyze_candidate_cv
     from resume_parser import ResumeParser
-    import json
-    import os
     from werkzeug.utils import secure_filename
     
     if current_user.role != 'candidate':
@@ -2861,6 +3032,7 @@ def cv_checker_upload():
         # Log the analysis
         audit_log = AuditLog(
             user_id=current_user.id,
+            organization_id=current_user.organization_id,
             action='CV Analysis',
             resource_type='CVAnalysis',
             resource_id=cv_analysis.id,
@@ -2939,7 +3111,6 @@ def view_cv_analysis(analysis_id):
         return redirect(url_for('dashboard'))
     
     # Parse JSON fields
-    import json
     analysis_data = {
         'id': analysis.id,
         'overall_score': analysis.overall_score,
@@ -3011,7 +3182,6 @@ def generate_cover_letter():
     
     try:
         from cover_letter_service import CoverLetterGenerator
-        import json
         
         # Get form data
         company_name = request.form.get('company_name', '').strip()
@@ -3027,9 +3197,9 @@ def generate_cover_letter():
         candidate_info = {
             'name': f"{current_user.first_name} {current_user.last_name}".strip() or current_user.username,
             'email': current_user.email,
-            'skills': json.loads(current_user.skills) if current_user.skills else [],
-            'experience': json.loads(current_user.experience) if current_user.experience else [],
-            'education': json.loads(current_user.education) if current_user.education else [],
+            'skills': orjson.loads(current_user.skills) if current_user.skills else [],
+            'experience': orjson.loads(current_user.experience) if current_user.experience else [],
+            'education': orjson.loads(current_user.education) if current_user.education else [],
             'job_title': current_user.job_title,
             'bio': current_user.bio,
             'experience_years': current_user.experience_years
@@ -3088,7 +3258,6 @@ def generate_cover_letter_from_job():
     
     try:
         from cover_letter_service import CoverLetterGenerator
-        import json
         
         # Get form data
         company_name = request.form.get('company_name', '').strip()
@@ -3104,9 +3273,9 @@ def generate_cover_letter_from_job():
         candidate_info = {
             'name': f"{current_user.first_name} {current_user.last_name}".strip() or current_user.username,
             'email': current_user.email,
-            'skills': json.loads(current_user.skills) if current_user.skills else [],
-            'experience': json.loads(current_user.experience) if current_user.experience else [],
-            'education': json.loads(current_user.education) if current_user.education else [],
+            'skills': orjson.loads(current_user.skills) if current_user.skills else [],
+            'experience': orjson.loads(current_user.experience) if current_user.experience else [],
+            'education': orjson.loads(current_user.education) if current_user.education else [],
             'job_title': current_user.job_title,
             'bio': current_user.bio,
             'experience_years': current_user.experience_years
@@ -3395,13 +3564,13 @@ def update_candidate_profile():
         new_email = request.form.get('email')
         if new_email and new_email != current_user.email:
             # Check if email already exists in the same organization
-            existing_user = User.query.filter(
+            email_taken = db.session.query(db.exists().where(
                 User.email == new_email,
                 User.organization_id == current_user.organization_id,
                 User.id != current_user.id
-            ).first()
+            )).scalar()
             
-            if existing_user:
+            if email_taken:
                 flash('This email address is already registered in your organization. Please use a different email.', 'error')
                 return redirect(url_for('candidate_profile', user_id=current_user.id))
             
@@ -3437,21 +3606,19 @@ def update_candidate_profile():
         # Update skills if provided
         skills_input = request.form.get('skills')
         if skills_input:
-            import json
             try:
                 # Handle both string and JSON input
                 if isinstance(skills_input, str):
                     skills_list = [skill.strip() for skill in skills_input.split(',') if skill.strip()]
                 else:
                     skills_list = skills_input
-                current_user.skills = json.dumps(skills_list)
+                current_user.skills = json_dumps(skills_list)
             except:
                 pass  # Keep existing skills if parsing fails
         
         # Update experience if provided
         experience_input = request.form.get('experience')
         if experience_input:
-            import json
             try:
                 current_user.experience = experience_input
             except:
@@ -3486,17 +3653,15 @@ def update_profile_section():
         flash('About section updated successfully!', 'success')
     
     elif section == 'skills':
-        import json
         skills_input = request.form.get('skills', '')
         if skills_input.strip():
             skills_list = [skill.strip() for skill in skills_input.split(',') if skill.strip()]
-            current_user.skills = json.dumps(skills_list)
+            current_user.skills = json_dumps(skills_list)
         else:
             current_user.skills = None
         flash('Skills updated successfully!', 'success')
     
     elif section == 'experience':
-        import json
         title = request.form.get('title')
         company = request.form.get('company')
         start_date = request.form.get('start_date')
@@ -3506,9 +3671,11 @@ def update_profile_section():
         
         if title and company and start_date:
             # Get existing experience or create new list
+            # Only a JSON array is a valid stored list; empty and legacy values start a new one
+            raw_experience = current_user.experience
             try:
-                experience_list = json.loads(current_user.experience) if current_user.experience else []
-            except:
+                experience_list = orjson.loads(raw_experience) if raw_experience and raw_experience[:1] == '[' else []
+            except orjson.JSONDecodeError:
                 experience_list = []
             
             # Format dates for display
@@ -3533,13 +3700,12 @@ def update_profile_section():
             }
             
             experience_list.append(new_experience)
-            current_user.experience = json.dumps(experience_list)
+            current_user.experience = json_dumps(experience_list)
             flash('Work experience added successfully!', 'success')
         else:
             flash('Please fill in all required fields.', 'error')
     
     elif section == 'education':
-        import json
         degree = request.form.get('degree')
         field = request.form.get('field')
         institution = request.form.get('institution')
@@ -3548,9 +3714,11 @@ def update_profile_section():
         
         if degree and field and institution and year:
             # Get existing education or create new list
+            # Only a JSON array is a valid stored list; empty and legacy values start a new one
+            raw_education = current_user.education
             try:
-                education_list = json.loads(current_user.education) if current_user.education else []
-            except:
+                education_list = orjson.loads(raw_education) if raw_education and raw_education[:1] == '[' else []
+            except orjson.JSONDecodeError:
                 education_list = []
             
             new_education = {
@@ -3562,14 +3730,35 @@ def update_profile_section():
             }
             
             education_list.append(new_education)
-            current_user.education = json.dumps(education_list)
+            current_user.education = json_dumps(education_list)
             flash('Education added successfully!', 'success')
         else:
             flash('Please fill in all required fields.', 'error')
     
+    # Keep the stored completion flag current so readers never recompute it
+    current_user.profile_completed = check_profile_completion(current_user)
     db.session.commit()
     return redirect(url_for('candidate_profile', user_id=current_user.id))
 
+def save_upload_stream(file_storage, dest_path):
+    """Write an uploaded file to disk, copying in the kernel when the upload is spooled to a temp file"""
+    src = file_storage.stream
+    with open(dest_path, 'wb') as dst:
+        # Werkzeug keeps small uploads in memory and rolls larger ones over to a real temp file
+        if getattr(src, '_rolled', False) and hasattr(os, 'sendfile'):
+            src.flush()
+            src_fd = src.fileno()
+            size = os.fstat(src_fd).st_size
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(dst.fileno(), src_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        else:
+            src.seek(0)
+            shutil.copyfileobj(src, dst, length=1 << 20)
+
 @app.route('/candidate/upload-photo', methods=['POST'])
 @login_required
 def upload_profile_photo():
@@ -3587,7 +3776,7 @@ def upload_profile_photo():
     filename = secure_filename(photo_file.filename)
     photo_path = os.path.join('uploads', 'photos', f"{current_user.id}_{filename}")
     os.makedirs(os.path.dirname(photo_path), exist_ok=True)
-    photo_file.save(photo_path)
+    save_upload_stream(photo_file, photo_path)
     
     # Store relative URL path for serving the image
     current_user.profile_image_url = f"/uploads/photos/{current_user.id}_{filename}"
@@ -3606,10 +3795,31 @@ def mobile_register():
     """Mobile-optimized registration page"""
     return render_template('mobile_register.html')
 
+# Resume fields returned when parsing fails; list slots are tuples so the shared value can't be mutated
+_EMPTY_RESUME_INFO = {
+    'first_name': '',
+    'last_name': '',
+    'phone': '',
+    'job_title': '',
+    'bio': '',
+    'skills': (),
+    'experience_years': 0,
+    'education': ()
+}
+
+_parse_resume_file = None
+
+def get_parse_resume_file():
+    """Import the resume parser on first use, since its module builds an OpenAI client at import time"""
+    global _parse_resume_file
+    if _parse_resume_file is None:
+        from resume_parser import parse_resume_file
+        _parse_resume_file = parse_resume_file
+    return _parse_resume_file
+
 def extract_resume_info(resume_path):
     """Extract information from resume using AI-powered parsing"""
-    from resume_parser import parse_resume_file
-    import os
+    parse_resume_file = get_parse_resume_file()
     
     try:
         # Get the filename from the path
@@ -3638,30 +3848,12 @@ def extract_resume_info(resume_path):
         else:
             logging.warning(f"Resume parsing failed: {parsed_result.get('error', 'Unknown error')}")
             # Return empty data instead of placeholder data
-            return {
-                'first_name': '',
-                'last_name': '',
-                'phone': '',
-                'job_title': '',
-                'bio': '',
-                'skills': [],
-                'experience_years': 0,
-                'education': []
-            }
+            return dict(_EMPTY_RESUME_INFO)
             
     except Exception as e:
         logging.error(f"Error in extract_resume_info: {e}")
         # Return empty data on error
-        return {
-            'first_name': '',
-            'last_name': '',
-            'phone': '',
-            'job_title': '',
-            'bio': '',
-            'skills': [],
-            'experience_years': 0,
-            'education': []
-        }
+        return dict(_EMPTY_RESUME_INFO)
 
 def extract_linkedin_info(linkedin_url):
     """Extract information from LinkedIn profile (placeholder)"""
@@ -3677,29 +3869,35 @@ def extract_linkedin_info(linkedin_url):
 
 def check_profile_completion(user):
     """Check if user profile is complete"""
-    required_fields = [
-        user.first_name, user.last_name, user.job_title, 
-        user.bio, user.skills, user.experience_years
-    ]
-    return all(field for field in required_fields)
+    flags = user.profile_flags
+    if flags is None:
+        flags = compute_profile_flags(user)
+    return (flags & PROFILE_REQUIRED_MASK) == PROFILE_REQUIRED_MASK
 
 @app.route('/api/get_member_details/<int:member_id>')
 @login_required
 def get_member_details(member_id):
     """Get detailed information about a team member"""
-    if current_user.role not in ['admin', 'recruiter']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         return jsonify({'error': 'Access denied'}), 403
     
     try:
-        member = User.query.get_or_404(member_id)
-        if member.role != 'recruiter':
+        member = db.session.get(User, member_id)
+        if not member or member.role != 'recruiter':
             return jsonify({'error': 'Invalid member ID'}), 404
         
-        # Get member statistics
-        interviews_count = Interview.query.filter_by(recruiter_id=member.id).count()
-        responses = InterviewResponse.query.join(Interview).filter(
-            Interview.recruiter_id == member.id
-        ).all()
+        # Get member statistics in a single aggregate query
+        interviews_count, responses_count, avg_score = db.session.query(
+            db.func.count(db.distinct(Interview.id)),
+            db.func.count(InterviewResponse.id),
+            db.func.coalesce(db.func.avg(InterviewResponse.ai_score), 0.0)
+        ).select_from(Interview).outerjoin(
+            InterviewResponse, InterviewResponse.interview_id == Interview.id
+        ).filter(Interview.recruiter_id == member.id).one()
+        
+        recent_interviews = Interview.query.options(
+            load_only(Interview.title, Interview.created_at)
+        ).filter_by(recruiter_id=member.id).order_by(Interview.created_at.desc()).limit(5)
         
         member_details = {
             'id': member.id,
@@ -3708,45 +3906,19 @@ def get_member_details(member_id):
             'role': member.role,
             'created_at': member.created_at.strftime('%Y-%m-%d'),
             'interviews_count': interviews_count,
-            'responses_count': len(responses),
-            'avg_score': sum(r.ai_score for r in responses) / len(responses) if responses else 0,
+            'responses_count': responses_count,
+            'avg_score': float(avg_score),
             'recent_activity': [
                 {
                     'type': 'interview_created',
                     'title': interview.title,
                     'date': interview.created_at.strftime('%Y-%m-%d')
                 }
-                for interview in Interview.query.filter_by(recruiter_id=member.id).order_by(Interview.created_at.desc()).limit(5)
+                for interview in recent_interviews
             ]
         }
         
-        html_content = f"""
-        <div class="member-details">
-            <div class="row">
-                <div class="col-md-6">
-                    <h6>Basic Information</h6>
-                    <p><strong>Username:</strong> {member_details['username']}</p>
-                    <p><strong>Email:</strong> {member_details['email']}</p>
-                    <p><strong>Role:</strong> {member_details['role'].title()}</p>
-                    <p><strong>Joined:</strong> {member_details['created_at']}</p>
-                </div>
-                <div class="col-md-6">
-                    <h6>Statistics</h6>
-                    <p><strong>Interviews Created:</strong> {member_details['interviews_count']}</p>
-                    <p><strong>Total Responses:</strong> {member_details['responses_count']}</p>
-                    <p><strong>Average Score:</strong> {member_details['avg_score']:.1f}%</p>
-                </div>
-            </div>
-            <div class="row mt-3">
-                <div class="col-12">
-                    <h6>Recent Activity</h6>
-                    <ul class="list-group">
-                        {''.join([f'<li class="list-group-item"><small>{activity["date"]}</small> - Created interview: {activity["title"]}</li>' for activity in member_details['recent_activity']])}
-                    </ul>
-                </div>
-            </div>
-        </div>
-        """
+        html_content = render_template('team_member_details.html', member=member_details)
         
         return jsonify({'html': html_content})
         
@@ -3769,21 +3941,23 @@ def update_member_role():
         if new_role not in ['recruiter', 'admin', 'viewer']:
             return jsonify({'success': False, 'error': 'Invalid role'})
         
-        member = User.query.get_or_404(member_id)
+        member = db.session.get(User, member_id)
+        if not member:
+            return jsonify({'success': False, 'error': 'Member not found'}), 404
         old_role = member.role
         member.role = new_role
         
-        # Log the action
-        audit_log = AuditLog(
-            user_id=current_user.id,
-            action='update_member_role',
-            resource_type='user',
-            resource_id=member_id,
-            details=json.dumps({'old_role': old_role, 'new_role': new_role})
-        )
-        db.session.add(audit_log)
-        
         db.session.commit()
+        
+        # Log the action via the background audit writer
+        audit_queue.enqueue([{
+            'user_id': current_user.id,
+            'organization_id': current_user.organization_id,
+            'action': 'update_member_role',
+            'resource_type': 'user',
+            'resource_id': member_id,
+            'details': json_dumps({'old_role': old_role, 'new_role': new_role})
+        }])
         return jsonify({'success': True, 'message': f'Role updated to {new_role}'})
         
     except Exception as e:
@@ -3844,41 +4018,60 @@ def submit_organization_assignment():
         flash(message, 'error')
         return redirect(url_for('assign_candidate_organization'))
 
-@app.route('/api/public-interviews', methods=['GET'])
-@login_required
-def get_public_interviews():
-    """API endpoint to get available public interviews for invitations"""
-    try:
-        # Get public interviews that support public invitations from current user's organization
-        interviews = Interview.query.filter_by(
-            organization_id=current_user.organization_id,
-            is_active=True,
-            interview_type='public',
-            public_invitation_enabled=True
-        ).all()
-        
-        # If super admin, can access all public interviews that support public invitations
-        if current_user.role == 'super_admin':
-            interviews = Interview.query.filter_by(
-                is_active=True,
-                interview_type='public',
-                public_invitation_enabled=True
-            ).all()
+def invalidate_interview_lists(organization_id):
+    """Drop cached interview lists for an organization and the all-organization super admin view"""
+    interview_list_cache.delete_where(lambda key: key[1] in (organization_id, None))
+
+def interview_list_response(interview_type, **extra_filters):
+    """Build (or reuse) the JSON interview list for the picker APIs, answering 304 on a matching ETag"""
+    # Super admins see interviews from every organization
+    organization_id = None if current_user.role == 'super_admin' else current_user.organization_id
+    cache_key = (interview_type, organization_id)
+    
+    cached = interview_list_cache.get(cache_key)
+    if cached is None:
+        filters = dict(is_active=True, interview_type=interview_type, **extra_filters)
+        if organization_id is not None:
+            filters['organization_id'] = organization_id
+        # Select only the columns the picker needs, joining the organization name in the same query
+        interviews = db.session.query(
+            Interview.id,
+            Interview.title,
+            Interview.duration_minutes,
+            Interview.created_at,
+            Organization.name.label('organization_name')
+        ).outerjoin(
+            Organization, Organization.id == Interview.organization_id
+        ).filter(*[getattr(Interview, column) == value for column, value in filters.items()]).all()
         
         interview_data = []
         for interview in interviews:
             interview_data.append({
                 'id': interview.id,
                 'title': interview.title,
-                'organization_name': interview.organization.name if interview.organization else 'Unknown',
+                'organization_name': interview.organization_name or 'Unknown',
                 'duration_minutes': interview.duration_minutes,
-                'created_at': interview.created_at.strftime('%Y-%m-%d')
+                'created_at': interview.created_at.date()
             })
         
-        return jsonify({
-            'success': True,
-            'interviews': interview_data
-        })
+        # orjson writes the date natively as YYYY-MM-DD
+        body = orjson.dumps({'success': True, 'interviews': interview_data})
+        cached = (body, hashlib.md5(body).hexdigest())
+        interview_list_cache.set(cache_key, cached)
+    
+    body, etag = cached
+    response = make_response(body)
+    response.mimetype = 'application/json'
+    response.set_etag(etag, weak=True)
+    return response.make_conditional(request)
+
+@app.route('/api/public-interviews', methods=['GET'])
+@login_required
+def get_public_interviews():
+    """API endpoint to get available public interviews for invitations"""
+    try:
+        # Public interviews that support public invitations from current user's organization
+        return interview_list_response('public', public_invitation_enabled=True)
         
     except Exception as e:
         return jsonify({
@@ -3891,34 +4084,8 @@ def get_public_interviews():
 def get_private_interviews():
     """API endpoint to get available private interviews for invitations"""
     try:
-        # Get private interviews from current user's organization
-        interviews = Interview.query.filter_by(
-            organization_id=current_user.organization_id,
-            is_active=True,
-            interview_type='private'
-        ).all()
-        
-        # If super admin, can access all private interviews
-        if current_user.role == 'super_admin':
-            interviews = Interview.query.filter_by(
-                is_active=True,
-                interview_type='private'
-            ).all()
-        
-        interview_data = []
-        for interview in interviews:
-            interview_data.append({
-                'id': interview.id,
-                'title': interview.title,
-                'organization_name': interview.organization.name if interview.organization else 'Unknown',
-                'duration_minutes': interview.duration_minutes,
-                'created_at': interview.created_at.strftime('%Y-%m-%d')
-            })
-        
-        return jsonify({
-            'success': True,
-            'interviews': interview_data
-        })
+        # Private interviews from current user's organization
+        return interview_list_response('private')
         
     except Exception as e:
         return jsonify({
@@ -3931,34 +4098,8 @@ def get_private_interviews():
 def get_scheduled_interviews():
     """API endpoint to get available scheduled interviews for scheduling"""
     try:
-        # Get scheduled interviews from current user's organization
-        interviews = Interview.query.filter_by(
-            organization_id=current_user.organization_id,
-            is_active=True,
-            interview_type='scheduled'
-        ).all()
-        
-        # If super admin, can access all scheduled interviews
-        if current_user.role == 'super_admin':
-            interviews = Interview.query.filter_by(
-                is_active=True,
-                interview_type='scheduled'
-            ).all()
-        
-        interview_data = []
-        for interview in interviews:
-            interview_data.append({
-                'id': interview.id,
-                'title': interview.title,
-                'organization_name': interview.organization.name if interview.organization else 'Unknown',
-                'duration_minutes': interview.duration_minutes,
-                'created_at': interview.created_at.strftime('%Y-%m-%d')
-            })
-        
-        return jsonify({
-            'success': True,
-            'interviews': interview_data
-        })
+        # Scheduled interviews from current user's organization
+        return interview_list_response('scheduled')
         
     except Exception as e:
         return jsonify({
@@ -3970,7 +4111,7 @@ def get_scheduled_interviews():
 @login_required
 def send_public_invitation():
     """Send public interview invitation to any candidate"""
-    if current_user.role not in ['recruiter', 'admin']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         return jsonify({'error': 'Access denied'}), 403
     
     from universal_profile_service import UniversalProfileService
@@ -3993,7 +4134,7 @@ def send_public_invitation():
 @login_required
 def toggle_employee_status():
     """Toggle organization employee status for candidate"""
-    if current_user.role not in ['recruiter', 'admin']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         return jsonify({'error': 'Access denied'}), 403
     
     from universal_profile_service import UniversalProfileService
@@ -4041,11 +4182,14 @@ def candidate_public_interviews():
         flash('Access denied.', 'error')
         return redirect(url_for('dashboard'))
     
-    # Get publicly available interviews from other organizations
+    # Get publicly available interviews from other organizations (skipping the job description text)
     public_interviews = db.session.query(
         Interview,
         User.username.label('recruiter_name'),
         Organization.name.label('organization_name')
+    ).options(
+        load_only(Interview.id, Interview.title, Interview.interview_type, Interview.duration_minutes,
+                  Interview.created_at, Interview.questions)
     ).join(
         User, User.id == Interview.recruiter_id
     ).join(
@@ -4058,14 +4202,14 @@ def candidate_public_interviews():
         Interview.organization_id != current_user.organization_id  # Different organization
     ).order_by(Interview.created_at.desc()).all()
     
-    # Get user's completed interviews to check completion status
-    completed_interviews = InterviewResponse.query.filter_by(
-        candidate_id=current_user.id
-    ).all()
+    # Map interview id -> response id for the user's completed interviews
+    completed_response_ids = dict(db.session.query(
+        InterviewResponse.interview_id, InterviewResponse.id
+    ).filter_by(candidate_id=current_user.id).all())
     
     return render_template('candidate_public_interviews.html',
                          public_interviews=public_interviews,
-                         completed_interviews=completed_interviews)
+                         completed_response_ids=completed_response_ids)
 
 @app.route('/candidate/completed-interviews')
 @login_required
@@ -4195,17 +4339,16 @@ def accept_invitation():
         invitation.responded_at = datetime.utcnow()
         
         # Log audit trail
-        from models import AuditLog
-        audit = AuditLog(
-            user_id=current_user.id,
-            action='interview_invitation_accepted',
-            resource_type='interview_invitation',
-            resource_id=invitation_id,
-            details=f'Accepted interview invitation {invitation_id}',
-            ip_address=request.remote_addr,
-            user_agent=request.headers.get('User-Agent', '')
-        )
-        db.session.add(audit)
+        log_audit_bulk([{
+            'user_id': current_user.id,
+            'organization_id': current_user.organization_id,
+            'action': 'interview_invitation_accepted',
+            'resource_type': 'interview_invitation',
+            'resource_id': invitation_id,
+            'details': json_dumps({'invitation_id': invitation_id, 'outcome': 'accepted'}),
+            'ip_address': request.remote_addr,
+            'user_agent': request.headers.get('User-Agent', '')
+        }])
         db.session.commit()
         
         return jsonify({
@@ -4247,17 +4390,16 @@ def decline_invitation():
         invitation.responded_at = datetime.utcnow()
         
         # Log audit trail
-        from models import AuditLog
-        audit = AuditLog(
-            user_id=current_user.id,
-            action='interview_invitation_declined',
-            resource_type='interview_invitation',
-            resource_id=invitation_id,
-            details=f'Declined interview invitation {invitation_id}',
-            ip_address=request.remote_addr,
-            user_agent=request.headers.get('User-Agent', '')
-        )
-        db.session.add(audit)
+        log_audit_bulk([{
+            'user_id': current_user.id,
+            'organization_id': current_user.organization_id,
+            'action': 'interview_invitation_declined',
+            'resource_type': 'interview_invitation',
+            'resource_id': invitation_id,
+            'details': json_dumps({'invitation_id': invitation_id, 'outcome': 'declined'}),
+            'ip_address': request.remote_addr,
+            'user_agent': request.headers.get('User-Agent', '')
+        }])
         db.session.commit()
         
         return jsonify({
@@ -4304,37 +4446,44 @@ def toggle_member_status():
 @login_required
 def export_team_report():
     """Export team performance report"""
-    if current_user.role not in ['admin', 'recruiter']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         flash('Access denied.', 'error')
         return redirect(url_for('dashboard'))
     
     try:
-        from flask import make_response
-        
-        # Get team data
-        recruiters = User.query.filter_by(role='recruiter').all()
-        
-        report_content = f"Team Performance Report\n"
-        report_content += f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n"
-        
-        for recruiter in recruiters:
-            interviews_count = Interview.query.filter_by(recruiter_id=recruiter.id).count()
-            responses = InterviewResponse.query.join(Interview).filter(
-                Interview.recruiter_id == recruiter.id
-            ).all()
-            avg_score = sum(r.ai_score for r in responses) / len(responses) if responses else 0
-            
-            report_content += f"Member: {recruiter.username}\n"
-            report_content += f"Email: {recruiter.email}\n"
-            report_content += f"Interviews Created: {interviews_count}\n"
-            report_content += f"Total Responses: {len(responses)}\n"
-            report_content += f"Average Score: {avg_score:.1f}%\n"
-            report_content += "---\n"
+        # Get team data - per-recruiter statistics in one GROUP BY query, fetched in batches
+        recruiter_stats = iter(db.session.query(
+            User.username,
+            User.email,
+            db.func.count(db.distinct(Interview.id)),
+            db.func.count(InterviewResponse.id),
+            db.func.coalesce(db.func.avg(InterviewResponse.ai_score), 0.0)
+        ).select_from(User).outerjoin(
+            Interview, Interview.recruiter_id == User.id
+        ).outerjoin(
+            InterviewResponse, InterviewResponse.interview_id == Interview.id
+        ).filter(User.role == 'recruiter').group_by(User.id).order_by(User.id).yield_per(500))
+        
+        def generate_report():
+            yield "Team Performance Report\n"
+            yield f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n"
+            
+            for username, email, interviews_count, responses_count, avg_score in recruiter_stats:
+                yield (
+                    f"Member: {username}\n"
+                    f"Email: {email}\n"
+                    f"Interviews Created: {interviews_count}\n"
+                    f"Total Responses: {responses_count}\n"
+                    f"Average Score: {float(avg_score):.1f}%\n"
+                    "---\n"
+                )
         
-        response = make_response(report_content)
-        response.headers['Content-Type'] = 'text/plain'
-        response.headers['Content-Disposition'] = 'attachment; filename=team_report.txt'
-        return response
+        # Stream the report so memory stays bounded and the first bytes go out immediately
+        return Response(
+            stream_with_context(generate_report()),
+            mimetype='text/plain',
+            headers={'Content-Disposition': 'attachment; filename=team_report.txt'}
+        )
         
     except Exception as e:
         logging.error(f"Error exporting team report: {e}")
@@ -4367,32 +4516,33 @@ def update_settings():
             return redirect(url_for('settings'))
         
         # Check if username/email already exists (excluding current user)
-        existing_user = User.query.filter(
+        identity_taken = db.session.query(db.exists().where(
             (User.username == username) | (User.email == email),
             User.id != current_user.id
-        ).first()
+        )).scalar()
         
-        if existing_user:
+        if identity_taken:
             flash('Username or email already in use.', 'error')
             return redirect(url_for('settings'))
         
         # Update user profile
+        user_id = current_user.id
+        organization_id = current_user.organization_id
         current_user.username = username
         current_user.email = email
-        
-        # Log the action
-        audit_log = AuditLog(
-            user_id=current_user.id,
-            action='update_profile',
-            resource_type='user',
-            resource_id=current_user.id,
-            details=json.dumps({'username': username, 'email': email}),
-            ip_address=request.remote_addr,
-            user_agent=request.headers.get('User-Agent')
-        )
-        db.session.add(audit_log)
-        
         db.session.commit()
+        
+        # Log the action via the background audit writer
+        audit_queue.enqueue([{
+            'user_id': user_id,
+            'organization_id': organization_id,
+            'action': 'update_profile',
+            'resource_type': 'user',
+            'resource_id': user_id,
+            'details': json_dumps({'username': username, 'email': email}),
+            'ip_address': request.remote_addr,
+            'user_agent': request.headers.get('User-Agent')
+        }])
         flash('Profile updated successfully!', 'success')
         
     except Exception as e:
@@ -4413,16 +4563,16 @@ def chat_interview(interview_id):
     interview = Interview.query.get_or_404(interview_id)
     
     # Check if already completed
-    existing_response = InterviewResponse.query.filter_by(
+    existing_response_id = db.session.query(InterviewResponse.id).filter_by(
         interview_id=interview_id, 
         candidate_id=current_user.id
-    ).first()
+    ).limit(1).scalar()
     
-    if existing_response:
+    if existing_response_id:
         flash('You have already completed this interview.', 'info')
-        return redirect(url_for('interview_results', response_id=existing_response.id))
+        return redirect(url_for('interview_results', response_id=existing_response_id))
     
-    questions = json.loads(interview.questions)
+    questions = get_interview_questions(interview)
     return render_template('chat_interview.html', interview=interview, questions=questions)
 
 @app.route('/interview/<int:interview_id>/chat/submit', methods=['POST'])
@@ -4435,52 +4585,41 @@ def submit_chat_interview(interview_id):
     interview = Interview.query.get_or_404(interview_id)
     
     # Check if already completed
-    existing_response = InterviewResponse.query.filter_by(
-        interview_id=interview_id, 
-        candidate_id=current_user.id
-    ).first()
+    already_completed = db.session.query(db.exists().where(
+        InterviewResponse.interview_id == interview_id,
+        InterviewResponse.candidate_id == current_user.id
+    )).scalar()
     
-    if existing_response:
+    if already_completed:
         return jsonify({'error': 'Interview already completed'}), 400
     
     try:
-        data = request.get_json()
-        responses = data.get('responses', [])
-        time_taken = data.get('time_taken', 0)
-        
-        # Format responses for storage
-        formatted_answers = {}
-        for i, response in enumerate(responses):
-            formatted_answers[str(i)] = {
-                'question': response.get('question', ''),
-                'answer': response.get('answer', ''),
-                'timestamp': response.get('timestamp', ''),
-                'response_type': 'chat'
-            }
-        
-        # Perform AI analysis on chat responses
-        score, feedback = score_interview_responses(formatted_answers, interview.job_description)
-        
-        # Generate instant feedback for chat format
-        instant_feedback = generate_instant_chat_feedback(responses)
-        
-        # Save response
+        formatted_answers, time_taken = parse_chat_submission(request.get_data())
+    except (ValueError, TypeError) as e:
+        return jsonify({'error': f'Invalid submission: {e}'}), 400
+    
+    try:
+        # Save response now; AI scoring and instant feedback run in the background
         response = InterviewResponse(
             interview_id=interview_id,
             candidate_id=current_user.id,
-            answers=json.dumps(formatted_answers),
-            ai_score=score,
-            ai_feedback=feedback,
+            organization_id=current_user.organization_id,
+            answers=json_dumps(formatted_answers),
+            status='scoring',
             time_taken_minutes=int(time_taken) if time_taken else None
         )
         
         db.session.add(response)
         db.session.commit()
         
+        submit_background_task(
+            score_chat_interview_response,
+            response.id, interview.job_description, formatted_answers
+        )
+        
         return jsonify({
             'success': True,
-            'score': score,
-            'feedback': instant_feedback,
+            'status': 'scoring',
             'response_id': response.id
         })
         
@@ -4489,18 +4628,60 @@ def submit_chat_interview(interview_id):
         logging.error(f"Chat interview submission error: {e}")
         return jsonify({'error': 'Failed to submit interview'}), 500
 
+def score_chat_interview_response(response_id, job_description, formatted_answers):
+    """Background task: score a submitted chat interview and keep its instant feedback for polling"""
+    try:
+        score, feedback = score_interview_responses(
+            formatted_answers, job_description, max_attempts=BACKGROUND_MAX_ATTEMPTS
+        )
+        chat_feedback_cache.set(response_id, generate_instant_chat_feedback(formatted_answers.values()))
+        status = 'completed'
+    except Exception as e:
+        # Leave the response for manual review rather than stuck in 'scoring'
+        logging.error(f"Chat interview scoring error for response {response_id}: {e}")
+        score, feedback, status = 0.0, None, 'pending'
+    
+    response = db.session.get(InterviewResponse, response_id)
+    if response:
+        response.ai_score = score
+        response.ai_feedback = feedback
+        response.status = status
+        db.session.commit()
+
+@app.route('/interview/response/<int:response_id>/status')
+@login_required
+def get_response_status(response_id):
+    """Poll the background scoring status of a chat interview response"""
+    response = InterviewResponse.query.get_or_404(response_id)
+    if summary_access_denied(response):
+        return jsonify({'error': 'Access denied'}), 403
+    
+    if response.status == 'scoring':
+        return jsonify({'success': True, 'status': 'scoring', 'response_id': response.id})
+    
+    return jsonify({
+        'success': True,
+        'status': response.status,
+        'score': response.ai_score,
+        'feedback': chat_feedback_cache.get(response.id) or CHAT_FEEDBACK_FALLBACK,
+        'response_id': response.id
+    })
+
+CHAT_FEEDBACK_FALLBACK = "Thank you for completing the interview! Your responses show good communication skills and thoughtful answers. We'll be in touch soon with next steps."
+
 def generate_instant_chat_feedback(responses):
     """Generate instant feedback for chat interviews using AI analysis"""
+    # Combine all responses for analysis
+    combined_text = " ".join([resp.get('answer', '') for resp in responses])
+    
+    # Nothing to analyze, or no API key configured - skip the API round-trip
+    if not combined_text.strip() or openai_client is None:
+        return CHAT_FEEDBACK_FALLBACK
+    
     try:
-        from openai import OpenAI
-        import os
-        
-        client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
-        
-        # Combine all responses for analysis
-        combined_text = " ".join([resp.get('answer', '') for resp in responses])
-        
-        response = client.chat.completions.create(
+        # Bound each attempt tighter than the shared client; retries back off on rate limits
+        response = create_chat_completion(
+            openai_client.with_options(timeout=15.0),
             model="gpt-4o",
             messages=[
                 {
@@ -4520,16 +4701,13 @@ def generate_instant_chat_feedback(responses):
         
     except Exception as e:
         logging.error(f"Error generating instant feedback: {e}")
-        return "Thank you for completing the interview! Your responses show good communication skills and thoughtful answers. We'll be in touch soon with next steps."
+        return CHAT_FEEDBACK_FALLBACK
 
 @app.route('/recruiter/invite/<int:interview_id>')
 @login_required  
+@require_role('recruiter', message='Access denied. Only recruiters can send invitations.')
 def invite_candidates(interview_id):
     """Invite specific candidates to private interview"""
-    if current_user.role != 'recruiter':
-        flash('Access denied. Only recruiters can send invitations.', 'error')
-        return redirect(url_for('dashboard'))
-    
     interview = Interview.query.filter_by(
         id=interview_id,
         recruiter_id=current_user.id
@@ -4546,11 +4724,9 @@ def invite_candidates(interview_id):
 
 @app.route('/recruiter/send_invitation', methods=['POST'])
 @login_required
+@require_role('recruiter')
 def send_invitation():
     """Send interview invitation to candidate"""
-    if current_user.role != 'recruiter':
-        return jsonify({'error': 'Access denied'}), 403
-    
     try:
         interview_id = request.form.get('interview_id')
         candidate_id = request.form.get('candidate_id')
@@ -4567,12 +4743,12 @@ def send_invitation():
             return redirect(url_for('dashboard'))
         
         # Check if already invited
-        existing_invitation = InterviewInvitation.query.filter_by(
-            interview_id=interview_id,
-            candidate_id=candidate_id
-        ).first()
+        already_invited = db.session.query(db.exists().where(
+            InterviewInvitation.interview_id == interview_id,
+            InterviewInvitation.candidate_id == candidate_id
+        )).scalar()
         
-        if existing_invitation:
+        if already_invited:
             flash('Candidate has already been invited to this interview.', 'warning')
             return redirect(url_for('invite_candidates', interview_id=interview_id))
         
@@ -4609,14 +4785,20 @@ def schedule_dashboard():
     if current_user.role == 'recruiter':
         # Get interviews that need scheduling
         interviews = Interview.query.filter_by(recruiter_id=current_user.id).all()
-        scheduled_interviews = InterviewSchedule.query.filter_by(recruiter_id=current_user.id).all()
+        scheduled_interviews = InterviewSchedule.query.options(
+            selectinload(InterviewSchedule.interview).load_only(Interview.title),
+            selectinload(InterviewSchedule.candidate).load_only(User.username)
+        ).filter_by(recruiter_id=current_user.id).all()
         
         return render_template('schedule_dashboard.html', 
                              interviews=interviews, 
                              scheduled_interviews=scheduled_interviews)
     else:
         # Candidate view - show their scheduled interviews
-        scheduled_interviews = InterviewSchedule.query.filter_by(candidate_id=current_user.id).all()
+        scheduled_interviews = InterviewSchedule.query.options(
+            selectinload(InterviewSchedule.interview).load_only(Interview.title),
+            selectinload(InterviewSchedule.recruiter).load_only(User.username)
+        ).filter_by(candidate_id=current_user.id).all()
         availability_slots = AvailabilitySlot.query.filter_by(user_id=current_user.id).all()
         
         return render_template('candidate_schedule.html',
@@ -4625,63 +4807,68 @@ def schedule_dashboard():
 
 @app.route('/schedule/interview/<int:interview_id>')
 @login_required
+@require_role('recruiter', message='Access denied. Only recruiters can schedule interviews.')
 def schedule_interview(interview_id):
     """Schedule a specific interview"""
-    if current_user.role != 'recruiter':
-        flash('Access denied. Only recruiters can schedule interviews.', 'error')
-        return redirect(url_for('dashboard'))
-    
     interview = Interview.query.get_or_404(interview_id)
     if interview.recruiter_id != current_user.id:
         flash('Access denied.', 'error')
         return redirect(url_for('dashboard'))
     
-    # Get all candidates in the organization who haven't completed this interview yet
-    completed_candidate_ids = db.session.query(InterviewResponse.candidate_id).filter(
-        InterviewResponse.interview_id == interview_id
-    ).scalar_subquery()
-    
-    candidates = User.query.filter(
+    # Get all candidates in the organization who haven't completed this interview yet (anti-join)
+    candidates = User.query.options(
+        load_only(User.id, User.username, User.email)
+    ).outerjoin(
+        InterviewResponse, db.and_(
+            InterviewResponse.candidate_id == User.id,
+            InterviewResponse.interview_id == interview_id
+        )
+    ).filter(
+        InterviewResponse.id.is_(None),
         User.organization_id == current_user.organization_id,
         User.role == 'candidate',
-        User.user_active == True,
-        ~User.id.in_(completed_candidate_ids)
+        User.user_active == True
     ).all()
     
     return render_template('schedule_interview.html', interview=interview, candidates=candidates)
 
 @app.route('/schedule/bulk')
 @login_required
+@require_role('recruiter', message='Access denied. Only recruiters can schedule interviews.')
 def bulk_schedule():
     """Bulk scheduling interface"""
-    if current_user.role != 'recruiter':
-        flash('Access denied. Only recruiters can schedule interviews.', 'error')
-        return redirect(url_for('dashboard'))
-    
     interviews = Interview.query.filter_by(recruiter_id=current_user.id).all()
     return render_template('bulk_schedule.html', interviews=interviews)
 
+def send_bulk_schedule_email(candidate_email, **email_args):
+    """Background task: send one bulk scheduling invitation email"""
+    from enhanced_email_service import EnhancedEmailService as EmailService
+    try:
+        EmailService().send_interview_invitation_email(candidate_email=candidate_email, **email_args)
+    except Exception as e:
+        logging.warning(f"Failed to send email to {candidate_email}: {e}")
+
 @app.route('/schedule/bulk/create', methods=['POST'])
 @login_required
+@require_role('recruiter')
 def create_bulk_schedule():
     """Create multiple interview schedules"""
-    if current_user.role != 'recruiter':
-        return jsonify({'error': 'Access denied'}), 403
+    try:
+        params = parse_bulk_schedule_request(request.get_data())
+    except (KeyError, ValueError, TypeError) as e:
+        return jsonify({'error': f'Invalid bulk schedule request: {e}'}), 400
     
     try:
-        data = request.get_json()
-        interview_id = data.get('interview_id')
-        candidate_ids = data.get('candidate_ids', [])
+        interview_id = params['interview_id']
+        candidate_ids = params['candidate_ids']
         
         # Time slot generation parameters
-        start_date = data.get('start_date')
-        end_date = data.get('end_date')
-        start_time = data.get('start_time')
-        end_time = data.get('end_time')
-        duration_minutes = data.get('duration_minutes', 60)
-        break_minutes = data.get('break_minutes', 15)
-        time_zone = data.get('time_zone', 'UTC')
-        auto_assign = data.get('auto_assign', False)
+        start_date = params['start_date']
+        end_date = params['end_date']
+        start_time = params['start_time']
+        end_time = params['end_time']
+        duration_minutes = params['duration_minutes']
+        break_minutes = params['break_minutes']
         
         # Validate interview ownership
         interview = Interview.query.get_or_404(interview_id)
@@ -4690,120 +4877,149 @@ def create_bulk_schedule():
         
         # Generate time slots from parameters
         time_slots = []
+        time_slots_count = 0
         if start_date and end_date and start_time and end_time:
-            current_date = datetime.strptime(start_date, '%Y-%m-%d').date()
+            start_date_obj = datetime.strptime(start_date, '%Y-%m-%d').date()
             end_date_obj = datetime.strptime(end_date, '%Y-%m-%d').date()
             start_time_obj = datetime.strptime(start_time, '%H:%M').time()
             end_time_obj = datetime.strptime(end_time, '%H:%M').time()
             
-            while current_date <= end_date_obj:
-                # Skip weekends if desired (for now, include all days)
-                current_datetime = datetime.combine(current_date, start_time_obj)
-                end_datetime = datetime.combine(current_date, end_time_obj)
-                
-                # Generate slots for this day
-                while current_datetime + timedelta(minutes=duration_minutes) <= end_datetime:
-                    time_slots.append({
-                        'datetime': current_datetime.isoformat() + 'Z',
-                        'duration': duration_minutes
-                    })
-                    current_datetime += timedelta(minutes=duration_minutes + break_minutes)
-                
-                current_date += timedelta(days=1)
+            # Slots per day follow arithmetically from the window, so count them without
+            # enumerating, then only build the slots that will actually be assigned
+            slot_step_minutes = duration_minutes + break_minutes
+            day_minutes = (end_time_obj.hour * 60 + end_time_obj.minute) - (start_time_obj.hour * 60 + start_time_obj.minute)
+            slots_per_day = (day_minutes - duration_minutes) // slot_step_minutes + 1 if day_minutes >= duration_minutes else 0
+            time_slots_count = max(0, (end_date_obj - start_date_obj).days + 1) * slots_per_day
+            
+            for n in range(min(time_slots_count, len(candidate_ids))):
+                day_offset, slot_index = divmod(n, slots_per_day)
+                slot_start = datetime.combine(start_date_obj + timedelta(days=day_offset), start_time_obj)
+                time_slots.append({
+                    'datetime': (slot_start + timedelta(minutes=slot_index * slot_step_minutes)).replace(tzinfo=timezone.utc),
+                    'duration': duration_minutes
+                })
         
         # Import calendar service
         from calendar_service import CalendarService
         calendar_service = CalendarService()
         
         created_schedules = []
+        calendar_requests = []
         failed_schedules = []
         
+        # Load the candidates that can receive a slot in one IN query, formatting each name once;
+        # plain tuples survive the commit
+        candidates_by_id = {
+            row.id: (f"{row.first_name} {row.last_name}", row.email) for row in db.session.query(
+                User.id, User.first_name, User.last_name, User.email
+            ).filter(
+                User.id.in_(candidate_ids[:len(time_slots)]),
+                User.organization_id == current_user.organization_id
+            )
+        }
+        
+        # Read interview and recruiter details once, before the commit expires them
+        interview_title = interview.title
+        event_title = f"Interview: {interview_title}"
+        recruiter_id = current_user.id
+        organization_id = current_user.organization_id
+        company_name = get_organization_name(organization_id)
+        recruiter_name = f"{current_user.first_name} {current_user.last_name}"
+        
         # Create schedules for each candidate-timeslot pair
         for i, candidate_id in enumerate(candidate_ids):
             if i >= len(time_slots):
                 break
                 
-            candidate = User.query.get(candidate_id)
-            if not candidate or candidate.organization_id != current_user.organization_id:
+            candidate = candidates_by_id.get(candidate_id)
+            if not candidate:
                 continue
+            candidate_name, candidate_email = candidate
                 
             slot = time_slots[i]
-            scheduled_datetime = datetime.fromisoformat(slot['datetime'].replace('Z', '+00:00'))
-            
-            # Create interview schedule
-            schedule = InterviewSchedule(
-                interview_id=interview_id,
-                candidate_id=candidate_id,
-                recruiter_id=current_user.id,
-                scheduled_datetime=scheduled_datetime,
-                duration_minutes=slot.get('duration', 60),
-                meeting_link=f"https://meet.google.com/new",
-                status='scheduled'
-            )
+            scheduled_datetime = slot['datetime']
+            
+            # Collect interview schedule row for a single multi-row INSERT
+            schedule = {
+                'interview_id': interview_id,
+                'candidate_id': candidate_id,
+                'recruiter_id': recruiter_id,
+                'scheduled_datetime': scheduled_datetime,
+                'duration_minutes': slot.get('duration', 60),
+                'meeting_link': f"https://meet.google.com/new",
+                'status': 'scheduled',
+                'calendar_event_id': None
+            }
             
+            created_schedules.append(schedule)
+            calendar_requests.append((schedule, {
+                'title': event_title,
+                'description': f"Interview with {candidate_name}",
+                'start_datetime': scheduled_datetime,
+                'end_datetime': scheduled_datetime + timedelta(minutes=slot.get('duration', 60)),
+                'attendee_emails': [candidate_email]
+            }))
+        
+        # Create Google Calendar events in batched requests rather than one HTTPS round-trip
+        # each; skip the step entirely when no calendar is connected
+        if calendar_requests and calendar_service.service is not None:
             try:
-                # Try to create Google Calendar event
-                calendar_event = calendar_service.create_event(
-                    title=f"Interview: {interview.title}",
-                    description=f"Interview with {candidate.first_name} {candidate.last_name}",
-                    start_datetime=scheduled_datetime,
-                    end_datetime=scheduled_datetime + timedelta(minutes=slot.get('duration', 60)),
-                    attendee_emails=[candidate.email]
+                calendar_events = calendar_service.create_events_batch(
+                    [event_args for _, event_args in calendar_requests]
                 )
-                
-                if calendar_event:
-                    schedule.calendar_event_id = calendar_event.get('id')
-                    
+                for (schedule, _), calendar_event in zip(calendar_requests, calendar_events):
+                    if calendar_event:
+                        schedule['calendar_event_id'] = calendar_event.get('id')
             except Exception as e:
-                logging.warning(f"Failed to create calendar event: {e}")
+                logging.warning(f"Failed to create calendar events: {e}")
                 # Continue without calendar integration
-            
-            db.session.add(schedule)
-            created_schedules.append(schedule)
         
-        # Commit all schedules
-        db.session.commit()
-        
-        # Send email notifications
-        from enhanced_email_service import EnhancedEmailService as EmailService
-        email_service = EmailService()
+        # Insert all schedules in one round-trip and keep the generated ids
+        if created_schedules:
+            schedule_ids = db.session.execute(
+                insert(InterviewSchedule).returning(InterviewSchedule.id, sort_by_parameter_order=True),
+                created_schedules
+            ).scalars().all()
+            for schedule, schedule_id in zip(created_schedules, schedule_ids):
+                schedule['id'] = schedule_id
         
-        for schedule in created_schedules:
-            try:
-                candidate = User.query.get(schedule.candidate_id)
-                email_service.send_interview_invitation_email(
-                    candidate_email=candidate.email,
-                    candidate_name=f"{candidate.first_name} {candidate.last_name}",
-                    interview_title=interview.title,
-                    company_name=current_user.organization.name,
-                    interview_link=schedule.meeting_link,
-                    recruiter_name=f"{current_user.first_name} {current_user.last_name}"
-                )
-            except Exception as e:
-                logging.warning(f"Failed to send email to {candidate.email}: {e}")
+        db.session.commit()
         
-        # Create audit log
-        audit_log = AuditLog(
-            user_id=current_user.id,
-            action='BULK_SCHEDULE_INTERVIEWS',
-            resource_type='interview_schedule',
-            resource_id=interview_id,
-            details=json.dumps({
-                'interview_title': interview.title,
+        # Audit entry is written by the background audit writer
+        audit_queue.enqueue([{
+            'user_id': recruiter_id,
+            'organization_id': organization_id,
+            'action': 'BULK_SCHEDULE_INTERVIEWS',
+            'resource_type': 'interview_schedule',
+            'resource_id': interview_id,
+            'details': json_dumps({
+                'interview_title': interview_title,
                 'schedules_created': len(created_schedules),
                 'candidates_count': len(candidate_ids),
-                'time_slots_count': len(time_slots)
+                'time_slots_count': time_slots_count
             }),
-            ip_address=request.remote_addr,
-            user_agent=request.headers.get('User-Agent', '')
-        )
-        db.session.add(audit_log)
-        db.session.commit()
+            'ip_address': request.remote_addr,
+            'user_agent': request.headers.get('User-Agent', '')
+        }])
+        
+        # Send email notifications on the background pool so SMTP round-trips overlap
+        for schedule in created_schedules:
+            candidate_name, candidate_email = candidates_by_id[schedule['candidate_id']]
+            submit_background_task(
+                send_bulk_schedule_email,
+                candidate_email=candidate_email,
+                candidate_name=candidate_name,
+                interview_title=interview_title,
+                company_name=company_name,
+                interview_link=schedule['meeting_link'],
+                recruiter_name=recruiter_name
+            )
         
         return jsonify({
             'success': True,
             'message': f'Successfully created {len(created_schedules)} interview schedules',
             'schedules_created': len(created_schedules),
+            'schedule_ids': [schedule['id'] for schedule in created_schedules],
             'failed_schedules': len(failed_schedules)
         })
         
@@ -4814,37 +5030,44 @@ def create_bulk_schedule():
 
 @app.route('/schedule/bulk/candidates/<int:interview_id>')
 @login_required
+@require_role('recruiter')
 def get_bulk_candidates(interview_id):
     """Get candidates available for bulk scheduling"""
-    if current_user.role != 'recruiter':
-        return jsonify({'error': 'Access denied'}), 403
-    
     # Validate interview ownership
     interview = Interview.query.get_or_404(interview_id)
     if interview.recruiter_id != current_user.id:
         return jsonify({'error': 'Access denied'}), 403
     
-    # Get candidates who have completed this interview but not yet scheduled
-    completed_responses = InterviewResponse.query.filter_by(
+    # Get candidates in this organization who have completed this interview but not yet scheduled
+    scheduled_candidate_ids = db.session.query(InterviewSchedule.candidate_id).filter_by(
         interview_id=interview_id
-    ).filter(InterviewResponse.completed_at.isnot(None)).all()
+    )
+    candidate_rows = db.session.query(
+        User.id,
+        User.first_name,
+        User.last_name,
+        User.email,
+        InterviewResponse.ai_score,
+        InterviewResponse.completed_at
+    ).join(
+        InterviewResponse, InterviewResponse.candidate_id == User.id
+    ).filter(
+        InterviewResponse.interview_id == interview_id,
+        InterviewResponse.completed_at.isnot(None),
+        User.organization_id == current_user.organization_id,
+        ~InterviewResponse.candidate_id.in_(scheduled_candidate_ids)
+    ).all()
     
-    scheduled_candidate_ids = [row[0] for row in db.session.query(InterviewSchedule.candidate_id).filter_by(
-        interview_id=interview_id
-    ).all()]
-    
-    available_candidates = []
-    for response in completed_responses:
-        if response.candidate_id not in scheduled_candidate_ids:
-            candidate = User.query.get(response.candidate_id)
-            if candidate and candidate.organization_id == current_user.organization_id:
-                available_candidates.append({
-                    'id': candidate.id,
-                    'name': f"{candidate.first_name} {candidate.last_name}",
-                    'email': candidate.email,
-                    'score': response.ai_score or 0,
-                    'completed_at': response.completed_at.isoformat() if response.completed_at else None
-                })
+    available_candidates = [
+        {
+            'id': row.id,
+            'name': f"{row.first_name} {row.last_name}",
+            'email': row.email,
+            'score': row.ai_score or 0,
+            'completed_at': row.completed_at.isoformat()
+        }
+        for row in candidate_rows
+    ]
     
     return jsonify({
         'success': True,
@@ -4886,6 +5109,27 @@ def update_schedule(schedule_id):
         logging.error(f"Error updating schedule: {e}")
         return jsonify({'error': 'Failed to update schedule'}), 500
 
+def set_availability_slot(user_id, day_of_week, start_time, end_time, time_zone):
+    """
+    Update the user's first slot for a weekday, or create one if the day has none (caller commits).
+    A day may hold several slots (split shifts), so there is no unique key to upsert on.
+    """
+    values = {
+        'start_time': start_time,
+        'end_time': end_time,
+        'time_zone': time_zone,
+        'is_active': True
+    }
+    first_slot_id = db.select(AvailabilitySlot.id).where(
+        AvailabilitySlot.user_id == user_id,
+        AvailabilitySlot.day_of_week == day_of_week
+    ).order_by(AvailabilitySlot.id).limit(1).scalar_subquery()
+    updated = db.session.execute(
+        db.update(AvailabilitySlot).where(AvailabilitySlot.id == first_slot_id).values(**values)
+    ).rowcount
+    if not updated:
+        db.session.add(AvailabilitySlot(user_id=user_id, day_of_week=day_of_week, **values))
+
 @app.route('/availability')
 @login_required
 def manage_availability():
@@ -4953,53 +5197,27 @@ def schedule_notifications(schedule):
 @login_required
 def user_profile(user_id):
     """Display detailed user profile"""
-    # Get user profile with organization access check
-    user_profile = User.query.filter_by(id=user_id, organization_id=current_user.organization_id).first_or_404()
-    
-    # Parse JSON fields
-    skills_list = []
-    education_list = []
-    certifications_list = []
-    
-    if user_profile.skills:
-        try:
-            skills_list = json.loads(user_profile.skills)
-            logging.info(f"Skills parsed for user {user_id}: {skills_list}")
-        except Exception as e:
-            logging.error(f"Error parsing skills for user {user_id}: {e}")
-            skills_list = []
-    else:
-        logging.info(f"No skills found for user {user_id}")
-    
-    if user_profile.education:
-        try:
-            education_list = json.loads(user_profile.education)
-        except:
-            education_list = []
-    
-    if user_profile.certifications:
-        try:
-            certifications_list = json.loads(user_profile.certifications)
-            logging.info(f"Certifications parsed for user {user_id}: {certifications_list}")
-        except Exception as e:
-            logging.error(f"Error parsing certifications for user {user_id}: {e}")
-            certifications_list = []
-    else:
-        logging.info(f"No certifications found for user {user_id}")
+    # Get user profile with organization access check, loading the organization in the same query
+    user_profile = User.query.options(joinedload(User.organization)).filter_by(
+        id=user_id, organization_id=current_user.organization_id
+    ).first_or_404()
     
-    # Get interview responses for candidates
+    # Get interview responses for candidates, with the interview title joined in
     interview_responses = []
     if user_profile.role == 'candidate':
-        interview_responses = InterviewResponse.query.filter_by(
+        interview_responses = InterviewResponse.query.options(
+            load_only(InterviewResponse.ai_score, InterviewResponse.completed_at),
+            joinedload(InterviewResponse.interview).load_only(Interview.title)
+        ).filter_by(
             candidate_id=user_id,
             organization_id=current_user.organization_id
         ).order_by(InterviewResponse.completed_at.desc()).limit(5).all()
     
     return render_template('user_profile.html', 
                          user_profile=user_profile,
-                         skills_list=skills_list,
-                         education_list=education_list,
-                         certifications_list=certifications_list,
+                         skills_list=user_profile.skills_list,
+                         education_list=user_profile.education_list,
+                         certifications_list=user_profile.certifications_list,
                          interview_responses=interview_responses)
 
 @app.route('/team-directory')
@@ -5015,31 +5233,21 @@ def team_directory():
         flash('Access denied. Please contact your administrator.', 'error')
         return redirect(url_for('dashboard'))
     
-    # Get all users in the current organization
-    recruiters = User.query.filter_by(
-        organization_id=current_user.organization_id,
-        role='recruiter',
-        user_active=True
-    ).all()
-    
-    candidates = User.query.filter_by(
-        organization_id=current_user.organization_id,
-        role='candidate',
-        user_active=True
-    ).all()
-    
-    admins = User.query.filter_by(
-        organization_id=current_user.organization_id,
-        role='admin',
-        user_active=True
+    # Get all active users in the current organization in one query, then split them by role
+    users_by_role = {'recruiter': [], 'candidate': [], 'admin': [], 'technical_person': []}
+    users = User.query.filter(
+        User.organization_id == current_user.organization_id,
+        User.user_active == True,
+        User.role.in_(list(users_by_role))
     ).all()
+    for user in users:
+        users_by_role[user.role].append(user)
     
-    # Get technical interviewers in the organization
-    technical_persons = User.query.filter_by(
-        organization_id=current_user.organization_id,
-        role='technical_person',
-        user_active=True
-    ).all()
+    recruiters = users_by_role['recruiter']
+    candidates = users_by_role['candidate']
+    admins = users_by_role['admin']
+    # Technical interviewers in the organization
+    technical_persons = users_by_role['technical_person']
     
     # Get organization info
     organization = Organization.query.get(current_user.organization_id)
@@ -5056,29 +5264,37 @@ def team_directory():
 @login_required
 def admin_panel():
     """Admin panel - only accessible to admin users"""
-    if current_user.role not in ['admin', 'super_admin']:
+    if current_user.role not in ADMIN_ROLES:
         flash('Access denied. Admin privileges required.', 'error')
         return redirect(url_for('dashboard'))
     
-    # Get statistics based on user role
-    if current_user.role == 'super_admin':
-        # Super admin sees system-wide statistics
-        organization = None  # No specific organization for super admin
-        total_users = User.query.count()
-        total_interviews = Interview.query.count()
-        total_responses = InterviewResponse.query.count()
-        
-        # Get all users in the system
-        users = User.query.order_by(User.created_at.desc()).all()
-    else:
-        # Regular admin sees organization-specific statistics
-        organization = Organization.query.get(current_user.organization_id)
-        total_users = User.query.filter_by(organization_id=current_user.organization_id).count()
-        total_interviews = Interview.query.filter_by(organization_id=current_user.organization_id).count()
-        total_responses = InterviewResponse.query.filter_by(organization_id=current_user.organization_id).count()
-        
-        # Get all users in the organization
-        users = User.query.filter_by(organization_id=current_user.organization_id).order_by(User.created_at.desc()).all()
+    # Super admin sees system-wide statistics; regular admin is scoped to their organization
+    organization_id = None if current_user.role == 'super_admin' else current_user.organization_id
+    organization = Organization.query.get(organization_id) if organization_id else None
+    
+    def scoped_count(model):
+        count_query = db.session.query(db.func.count(model.id))
+        if organization_id:
+            count_query = count_query.filter(model.organization_id == organization_id)
+        return count_query.scalar_subquery()
+    
+    # All three totals in one round-trip
+    total_users, total_interviews, total_responses = db.session.query(
+        scoped_count(User),
+        scoped_count(Interview),
+        scoped_count(InterviewResponse)
+    ).one()
+    
+    # Paginated user list, loading only the columns the table renders
+    users_query = User.query.options(load_only(
+        User.id, User.username, User.first_name, User.last_name, User.email,
+        User.role, User.user_active, User.created_at
+    ))
+    if organization_id:
+        users_query = users_query.filter(User.organization_id == organization_id)
+    users = users_query.order_by(User.created_at.desc()).paginate(
+        page=request.args.get('page', 1, type=int), per_page=50, error_out=False
+    )
     
     return render_template('admin_panel.html',
                          organization=organization,
@@ -5087,14 +5303,58 @@ def admin_panel():
                          total_responses=total_responses,
                          users=users)
 
+# Placeholder stored until the real hash is set in the background; never matches any password
+PENDING_PASSWORD_HASH = '!pending'
+# Upper bound on users per bulk invite request
+MAX_BULK_INVITES = 1000
+
+def send_invitation_email_task(invited_user_id, invited_by_id, organization_id, **email_args):
+    """Background task: hash a new user's password, email their credentials and record the delivery outcome"""
+    from enhanced_email_service import email_service
+    
+    # Any failure still records a failed delivery below, so the invitation can be resent from the audit log
+    email_sent = False
+    try:
+        invited_user = db.session.get(User, invited_user_id)
+        if invited_user is None:
+            raise LookupError(f"invited user {invited_user_id} no longer exists")
+        # Password hashing is deliberately CPU-heavy, so it runs here rather than on the request thread
+        invited_user.password_hash = generate_password_hash(email_args['password'])
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logging.error(f"Failed to set the password for invited user {invited_user_id}: {e}")
+    else:
+        try:
+            email_sent = bool(email_service.send_user_invitation_email(**email_args))
+        except Exception as e:
+            logging.error(f"Failed to send invitation email to {email_args.get('user_email')}: {e}")
+    
+    audit_queue.enqueue([{
+        'user_id': invited_by_id,
+        'organization_id': organization_id,
+        'action': 'INVITE_USER_EMAIL',
+        'resource_type': 'user',
+        'resource_id': invited_user_id,
+        'details': json_dumps({
+            'invited_email': email_args.get('user_email'),
+            'email_sent': email_sent
+        })
+    }])
+
 @app.route('/admin/invite_user', methods=['POST'])
 @login_required
 def invite_user():
     """Invite a new user to the organization with automatic email delivery - admin only"""
-    if current_user.role not in ['admin', 'super_admin']:
+    if current_user.role not in ADMIN_ROLES:
         flash('Access denied. Admin privileges required.', 'error')
         return redirect(url_for('dashboard'))
     
+    # Read the inviting admin's attributes once
+    inviter_id = current_user.id
+    inviter_role = current_user.role
+    organization_id = current_user.organization_id
+    
     try:
         from enhanced_email_service import email_service
         
@@ -5104,39 +5364,32 @@ def invite_user():
         last_name = request.form.get('last_name', '')
         
         # Role validation: Admin users cannot create other admin users
-        if current_user.role == 'admin' and role == 'admin':
+        if inviter_role == 'admin' and role == 'admin':
             flash('Access denied. Only super administrators can create admin users.', 'error')
             return redirect(url_for('admin_panel'))
         
         # Validate allowed roles for admin users
-        allowed_roles_for_admin = ['candidate', 'recruiter', 'technical_person']
-        allowed_roles_for_super_admin = ['candidate', 'recruiter', 'technical_person', 'admin']
-        
-        if current_user.role == 'admin' and role not in allowed_roles_for_admin:
+        if inviter_role == 'admin' and role not in ALLOWED_ROLES_FOR_ADMIN:
             flash('Invalid role selection. Admin users can only create candidates, recruiters, and technical interviewers.', 'error')
             return redirect(url_for('admin_panel'))
         
-        if current_user.role == 'super_admin' and role not in allowed_roles_for_super_admin:
+        if inviter_role == 'super_admin' and role not in ALLOWED_ROLES_FOR_SUPER_ADMIN:
             flash('Invalid role selection.', 'error')
             return redirect(url_for('admin_panel'))
         
-        # Check if user already exists in this organization
-        existing_user = User.query.filter_by(
-            email=email,
-            organization_id=current_user.organization_id
-        ).first()
+        # One query for both the existing-email check and taken username variants in this organization
+        base_username = email.split('@')[0]
+        matching_users = db.session.query(User.email, User.username).filter(
+            User.organization_id == organization_id,
+            db.or_(User.email == email, username_variants_clause(base_username))
+        ).all()
         
-        if existing_user:
+        if any(row.email == email for row in matching_users):
             flash('A user with this email already exists in your organization.', 'error')
             return redirect(url_for('admin_panel'))
         
         # Generate username from email
-        username = email.split('@')[0]
-        counter = 1
-        original_username = username
-        while User.query.filter_by(username=username, organization_id=current_user.organization_id).first():
-            username = f"{original_username}_{counter}"
-            counter += 1
+        username = first_free_username(base_username, {row.username for row in matching_users})
         
         # Generate secure password
         secure_password = email_service.generate_secure_password()
@@ -5145,60 +5398,63 @@ def invite_user():
         new_user = User(
             username=username,
             email=email,
-            password_hash=generate_password_hash(secure_password),
+            password_hash=PENDING_PASSWORD_HASH,  # Hashed by the invitation email task
             role=role,
-            organization_id=current_user.organization_id,
+            organization_id=organization_id,
             first_name=first_name,
             last_name=last_name,
             user_active=True
         )
         
         db.session.add(new_user)
-        db.session.commit()
+        db.session.flush()  # Assign the user id for the audit entry without committing
         
         # Get organization name
-        organization = Organization.query.get(current_user.organization_id)
-        organization_name = organization.name if organization else "Unknown Organization"
+        organization_name = get_organization_name(organization_id) or "Unknown Organization"
         
-        # Send welcome email with credentials
+        # Names for the welcome email
         user_full_name = f"{first_name} {last_name}".strip() or email.split('@')[0]
-        invited_by_name = f"{current_user.first_name} {current_user.last_name}".strip() or current_user.username
+        inviter_username = current_user.username
+        invited_by_name = f"{current_user.first_name} {current_user.last_name}".strip() or inviter_username
         
-        email_sent = email_service.send_user_invitation_email(
-            user_email=email,
-            user_name=user_full_name,
-            username=username,
-            password=secure_password,
-            organization_name=organization_name,
-            role=role,
-            invited_by=invited_by_name
-        )
-        
-        # Log the action
+        # Log the action; delivery outcome is logged separately by the email task
         audit_log = AuditLog(
-            user_id=current_user.id,
+            user_id=inviter_id,
+            organization_id=organization_id,
             action='INVITE_USER',
             resource_type='user',
             resource_id=new_user.id,
-            details=json.dumps({
+            details=json_dumps({
                 'invited_email': email,
                 'invited_role': role,
-                'invited_by': current_user.username,
-                'email_sent': email_sent,
+                'invited_by': inviter_username,
+                'email_sent': None,
                 'organization_name': organization_name
             }),
             ip_address=request.remote_addr,
             user_agent=request.headers.get('User-Agent', '')
         )
         db.session.add(audit_log)
+        invited_user_id = new_user.id
         db.session.commit()
         
-        if email_sent:
-            flash(f'User {email} has been invited successfully! Login credentials sent via email.', 'success')
-        else:
-            # Provide fallback credentials if email fails
-            flash(f'User {email} created successfully! Email delivery failed. Please provide these credentials manually:', 'warning')
-            flash(f'Username: {username} | Password: {secure_password}', 'info')
+        # Hash the password and send the welcome email on the background pool once the user is committed
+        submit_background_task(
+            send_invitation_email_task,
+            invited_user_id=invited_user_id,
+            invited_by_id=inviter_id,
+            organization_id=organization_id,
+            user_email=email,
+            user_name=user_full_name,
+            username=username,
+            password=secure_password,
+            organization_name=organization_name,
+            role=role,
+            invited_by=invited_by_name
+        )
+        
+        flash(f'User {email} has been invited successfully! Login credentials are being sent via email; '
+              'if delivery fails it can be resent from the audit log.', 'success')
         
     except Exception as e:
         db.session.rollback()
@@ -5207,25 +5463,206 @@ def invite_user():
     
     return redirect(url_for('admin_panel'))
 
+@app.route('/admin/invite_users_bulk', methods=['POST'])
+@login_required
+@require_role(*ADMIN_ROLES)
+def invite_users_bulk():
+    """Invite many users to the organization in one request - admin only"""
+    try:
+        invites = orjson.loads(request.get_data()).get('users')
+        if not isinstance(invites, list) or not all(isinstance(invite, dict) and invite.get('email') for invite in invites):
+            raise ValueError("users must be a list of objects with an email")
+    except (ValueError, AttributeError) as e:
+        return jsonify({'error': f'Invalid bulk invite request: {e}'}), 400
+    
+    if len(invites) > MAX_BULK_INVITES:
+        return jsonify({'error': f'At most {MAX_BULK_INVITES} users can be invited per request'}), 400
+    
+    # Validate every role up front
+    allowed_roles = ALLOWED_ROLES_FOR_SUPER_ADMIN if current_user.role == 'super_admin' else ALLOWED_ROLES_FOR_ADMIN
+    invalid_roles = sorted({invite.get('role', 'candidate') for invite in invites} - allowed_roles)
+    if invalid_roles:
+        return jsonify({'error': f'Invalid role selection: {", ".join(invalid_roles)}'}), 400
+    
+    try:
+        # One query for existing emails and every taken username variant in this organization
+        emails = [invite['email'] for invite in invites]
+        base_usernames = {email.split('@')[0] for email in emails}
+        matching_users = db.session.query(User.email, User.username).filter(
+            User.organization_id == current_user.organization_id,
+            db.or_(User.email.in_(emails), username_variants_clause(*base_usernames))
+        ).all()
+        existing_emails = {row.email for row in matching_users}
+        taken_usernames = {row.username for row in matching_users}
+        
+        organization_name = get_organization_name(current_user.organization_id) or "Unknown Organization"
+        invited_by_name = f"{current_user.first_name} {current_user.last_name}".strip() or current_user.username
+        
+        from enhanced_email_service import email_service
+        
+        new_users = []
+        skipped = []
+        for invite in invites:
+            email = invite['email']
+            if email in existing_emails:
+                skipped.append({'email': email, 'reason': 'already exists'})
+                continue
+            existing_emails.add(email)
+            
+            username = first_free_username(email.split('@')[0], taken_usernames)
+            taken_usernames.add(username)
+            new_users.append((User(
+                username=username,
+                email=email,
+                password_hash=PENDING_PASSWORD_HASH,  # Hashed by the invitation email task
+                role=invite.get('role', 'candidate'),
+                organization_id=current_user.organization_id,
+                first_name=invite.get('first_name', ''),
+                last_name=invite.get('last_name', ''),
+                user_active=True
+            ), email_service.generate_secure_password()))
+        
+        # All users go out in one batched INSERT on flush
+        db.session.add_all([user for user, _ in new_users])
+        db.session.flush()
+        
+        log_audit_bulk([{
+            'user_id': current_user.id,
+            'organization_id': current_user.organization_id,
+            'action': 'INVITE_USER',
+            'resource_type': 'user',
+            'resource_id': user.id,
+            'details': json_dumps({
+                'invited_email': user.email,
+                'invited_role': user.role,
+                'invited_by': current_user.username,
+                'email_sent': None,
+                'organization_name': organization_name,
+                'bulk': True
+            }),
+            'ip_address': request.remote_addr,
+            'user_agent': request.headers.get('User-Agent', '')
+        } for user, _ in new_users])
+        
+        invited = [
+            (user.id, user.email, user.username, user.role, f"{user.first_name} {user.last_name}".strip(), password)
+            for user, password in new_users
+        ]
+        invited_by_id = current_user.id
+        organization_id = current_user.organization_id
+        db.session.commit()
+        
+        # Hash passwords and send welcome emails on the background pool
+        for invited_user_id, email, username, role, full_name, password in invited:
+            submit_background_task(
+                send_invitation_email_task,
+                invited_user_id=invited_user_id,
+                invited_by_id=invited_by_id,
+                organization_id=organization_id,
+                user_email=email,
+                user_name=full_name or email.split('@')[0],
+                username=username,
+                password=password,
+                organization_name=organization_name,
+                role=role,
+                invited_by=invited_by_name
+            )
+        
+        return jsonify({
+            'success': True,
+            'invited': [{'email': email, 'username': username} for _, email, username, _, _, _ in invited],
+            'skipped': skipped
+        })
+        
+    except Exception as e:
+        db.session.rollback()
+        logging.error(f"Error bulk inviting users: {e}")
+        return jsonify({'error': 'Failed to invite users'}), 500
+
+@app.route('/admin/users/<int:user_id>/resend_invitation', methods=['POST'])
+@login_required
+@require_role(*ADMIN_ROLES, message='Access denied. Admin privileges required.')
+def resend_invitation(user_id):
+    """Issue a new temporary password to an invited user whose welcome email failed and send it again"""
+    invited_user = User.query.filter_by(id=user_id, organization_id=current_user.organization_id).first()
+    allowed_roles = ALLOWED_ROLES_FOR_SUPER_ADMIN if current_user.role == 'super_admin' else ALLOWED_ROLES_FOR_ADMIN
+    if not invited_user or invited_user.role not in allowed_roles:
+        flash('User not found.', 'error')
+        return redirect(url_for('audit_logs'))
+    
+    # Only invitations whose latest delivery attempt failed and were never used to log in can be resent;
+    # anything else would overwrite a working password
+    latest_delivery = db.session.execute(
+        db.select(AuditLog.details).where(
+            AuditLog.organization_id == current_user.organization_id,
+            AuditLog.action == 'INVITE_USER_EMAIL',
+            AuditLog.resource_type == 'user',
+            AuditLog.resource_id == invited_user.id
+        ).order_by(AuditLog.timestamp.desc(), AuditLog.id.desc()).limit(1)
+    ).scalar()
+    if (invited_user.last_login is not None or latest_delivery is None
+            or orjson.loads(latest_delivery).get('email_sent')):
+        flash('Only invitations whose email could not be delivered can be resent.', 'error')
+        return redirect(url_for('audit_logs'))
+    
+    from enhanced_email_service import email_service
+    
+    # The undelivered password is discarded; the new one is hashed by the email task
+    invited_user.password_hash = PENDING_PASSWORD_HASH
+    db.session.commit()
+    
+    submit_background_task(
+        send_invitation_email_task,
+        invited_user_id=invited_user.id,
+        invited_by_id=current_user.id,
+        organization_id=current_user.organization_id,
+        user_email=invited_user.email,
+        user_name=f"{invited_user.first_name or ''} {invited_user.last_name or ''}".strip() or invited_user.username,
+        username=invited_user.username,
+        password=email_service.generate_secure_password(),
+        organization_name=get_organization_name(current_user.organization_id) or "Unknown Organization",
+        role=invited_user.role,
+        invited_by=f"{current_user.first_name or ''} {current_user.last_name or ''}".strip() or current_user.username
+    )
+    
+    flash(f'A new invitation with fresh login credentials is being sent to {invited_user.email}.', 'success')
+    return redirect(url_for('audit_logs'))
+
 @app.route('/admin/audit_logs')
 @login_required
 def audit_logs():
     """View audit logs - admin only"""
-    if current_user.role not in ['admin', 'super_admin']:
+    if current_user.role not in ADMIN_ROLES:
         flash('Access denied. Admin privileges required.', 'error')
         return redirect(url_for('dashboard'))
     
-    # Get audit logs for users in this organization
-    logs = db.session.query(AuditLog).join(User).filter(
-        User.organization_id == current_user.organization_id
-    ).order_by(AuditLog.timestamp.desc()).limit(100).all()
+    # Get audit logs for this organization (newest first, straight off the org/timestamp index).
+    # Display-only, so select plain rows with the acting user's name and role instead of ORM objects.
+    logs = db.session.execute(
+        db.select(
+            AuditLog.id, AuditLog.action, AuditLog.resource_type, AuditLog.resource_id,
+            AuditLog.details, AuditLog.ip_address, AuditLog.timestamp,
+            User.username, User.role.label('user_role')
+        ).join(User, User.id == AuditLog.user_id).where(
+            AuditLog.organization_id == current_user.organization_id
+        ).order_by(AuditLog.timestamp.desc()).limit(100)
+    ).all()
+    
+    # Invitation emails whose latest delivery attempt failed can be resent from the log
+    failed_invitation_log_ids = set()
+    delivery_checked_user_ids = set()
+    for log in logs:
+        if log.action == 'INVITE_USER_EMAIL' and log.resource_id not in delivery_checked_user_ids:
+            delivery_checked_user_ids.add(log.resource_id)
+            if not orjson.loads(log.details or '{}').get('email_sent'):
+                failed_invitation_log_ids.add(log.id)
     
-    return render_template('audit_logs.html', logs=logs)
+    return render_template('audit_logs.html', logs=logs, failed_invitation_log_ids=failed_invitation_log_ids)
 
     
     # Get availability slots for recruiters/admins
     availability_slots = []
-    if current_user.role in ['recruiter', 'admin']:
+    if current_user.role in RECRUITER_OR_ADMIN_ROLES:
         availability_slots = AvailabilitySlot.query.filter_by(
             user_id=current_user.id
         ).order_by(AvailabilitySlot.day_of_week.asc()).all()
@@ -5233,7 +5670,7 @@ def audit_logs():
     # Get available interviews and candidates for scheduling
     available_interviews = []
     candidates = []
-    if current_user.role in ['recruiter', 'admin']:
+    if current_user.role in RECRUITER_OR_ADMIN_ROLES:
         if current_user.role == 'admin':
             available_interviews = Interview.query.filter_by(
                 organization_id=current_user.organization_id,
@@ -5266,10 +5703,14 @@ def audit_logs():
 @login_required
 def create_schedule():
     """Schedule a new interview"""
-    if current_user.role not in ['recruiter', 'admin']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         flash('Access denied. Only recruiters and admins can schedule interviews.', 'error')
         return redirect(url_for('schedule'))
     
+    # Read the scheduling user's attributes once
+    recruiter_id = current_user.id
+    organization_id = current_user.organization_id
+    
     try:
         interview_id = request.form.get('interview_id')
         candidate_id = request.form.get('candidate_id')
@@ -5284,7 +5725,7 @@ def create_schedule():
         # Verify interview belongs to user's organization
         interview = Interview.query.filter_by(
             id=interview_id,
-            organization_id=current_user.organization_id
+            organization_id=organization_id
         ).first()
         
         if not interview:
@@ -5294,7 +5735,7 @@ def create_schedule():
         # Verify candidate belongs to user's organization
         candidate = User.query.filter_by(
             id=candidate_id,
-            organization_id=current_user.organization_id,
+            organization_id=organization_id,
             role='candidate'
         ).first()
         
@@ -5306,7 +5747,7 @@ def create_schedule():
         new_schedule = InterviewSchedule(
             interview_id=interview_id,
             candidate_id=candidate_id,
-            recruiter_id=current_user.id,
+            recruiter_id=recruiter_id,
             scheduled_datetime=scheduled_datetime,
             duration_minutes=duration,
             meeting_link=meeting_link,
@@ -5315,15 +5756,16 @@ def create_schedule():
         )
         
         db.session.add(new_schedule)
-        db.session.commit()
+        db.session.flush()  # Assign the schedule id for the audit entry without committing
         
         # Log the action
         audit_log = AuditLog(
-            user_id=current_user.id,
+            user_id=recruiter_id,
+            organization_id=organization_id,
             action='SCHEDULE_INTERVIEW',
             resource_type='interview_schedule',
             resource_id=new_schedule.id,
-            details=json.dumps({
+            details=json_dumps({
                 'interview_title': interview.title,
                 'candidate_email': candidate.email,
                 'scheduled_datetime': scheduled_datetime.isoformat(),
@@ -5348,7 +5790,7 @@ def create_schedule():
 @login_required
 def set_availability():
     """Set availability slot"""
-    if current_user.role not in ['recruiter', 'admin']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         flash('Access denied. Only recruiters and admins can set availability.', 'error')
         return redirect(url_for('schedule'))
     
@@ -5362,30 +5804,7 @@ def set_availability():
         start_time_obj = datetime.strptime(start_time, "%H:%M").time()
         end_time_obj = datetime.strptime(end_time, "%H:%M").time()
         
-        # Check if slot already exists
-        existing_slot = AvailabilitySlot.query.filter_by(
-            user_id=current_user.id,
-            day_of_week=day_of_week
-        ).first()
-        
-        if existing_slot:
-            # Update existing slot
-            existing_slot.start_time = start_time_obj
-            existing_slot.end_time = end_time_obj
-            existing_slot.time_zone = time_zone
-            existing_slot.is_active = True
-        else:
-            # Create new slot
-            new_slot = AvailabilitySlot(
-                user_id=current_user.id,
-                day_of_week=day_of_week,
-                start_time=start_time_obj,
-                end_time=end_time_obj,
-                time_zone=time_zone,
-                is_active=True
-            )
-            db.session.add(new_slot)
-        
+        set_availability_slot(current_user.id, day_of_week, start_time_obj, end_time_obj, time_zone)
         db.session.commit()
         flash('Availability updated successfully!', 'success')
         
@@ -5439,7 +5858,7 @@ def edit_user_profile(user_id):
             skills_text = request.form.get('skills', '').strip()
             if skills_text:
                 skills_list = [skill.strip() for skill in skills_text.split(',') if skill.strip()]
-                user_profile.skills = json.dumps(skills_list)
+                user_profile.skills = json_dumps(skills_list)
             else:
                 user_profile.skills = None
             
@@ -5447,7 +5866,7 @@ def edit_user_profile(user_id):
             certifications_text = request.form.get('certifications', '').strip()
             if certifications_text:
                 certifications_list = [cert.strip() for cert in certifications_text.split(',') if cert.strip()]
-                user_profile.certifications = json.dumps(certifications_list)
+                user_profile.certifications = json_dumps(certifications_list)
             else:
                 user_profile.certifications = None
             
@@ -5469,16 +5888,17 @@ def edit_user_profile(user_id):
             user_profile.resume_url = request.form.get('resume_url', '').strip()
             user_profile.profile_image_url = request.form.get('profile_image_url', '').strip()
             
-            # Save changes
-            db.session.commit()
+            if user_profile.role == 'candidate':
+                user_profile.profile_completed = check_profile_completion(user_profile)
             
-            # Log the action
+            # Log the action in the same transaction as the profile changes
             audit_log = AuditLog(
                 user_id=current_user.id,
+                organization_id=current_user.organization_id,
                 action='UPDATE_USER_PROFILE',
                 resource_type='user',
                 resource_id=user_profile.id,
-                details=json.dumps({
+                details=json_dumps({
                     'updated_user': user_profile.email,
                     'fields_updated': ['basic_info', 'professional_info', 'skills', 'certifications', 'links']
                 }),
@@ -5496,28 +5916,8 @@ def edit_user_profile(user_id):
             logging.error(f"Error updating user profile: {e}")
             flash('Failed to update user profile. Please try again.', 'error')
     
-    # Prepare data for the form
-    skills_text = ''
-    certifications_text = ''
-    
-    if user_profile.skills:
-        try:
-            skills_list = json.loads(user_profile.skills)
-            skills_text = ', '.join(skills_list)
-        except:
-            skills_text = user_profile.skills
-    
-    if user_profile.certifications:
-        try:
-            certifications_list = json.loads(user_profile.certifications)
-            certifications_text = ', '.join(certifications_list)
-        except:
-            certifications_text = user_profile.certifications
-    
-    return render_template('edit_user_profile.html', 
-                         user_profile=user_profile,
-                         skills_text=skills_text,
-                         certifications_text=certifications_text)
+    # The template joins user_profile.skills_list / certifications_list, which are decoded once per instance
+    return render_template('edit_user_profile.html', user_profile=user_profile)
 
 @app.errorhandler(404)
 def not_found_error(error):
@@ -5557,6 +5957,7 @@ def add_company():
             
             db.session.add(company)
             db.session.commit()
+            company_choices_cache.clear()
             
             flash(f'Company "{name}" added successfully!', 'success')
             return redirect(url_for('post_job'))
@@ -5643,7 +6044,10 @@ def post_job():
             flash('An error occurred while posting the job. Please try again.', 'error')
     
     # Get companies for dropdown - show all active companies for now
-    companies = Company.query.order_by(Company.name).all()
+    companies = company_choices_cache.get_or_set(
+        'all',
+        lambda: db.session.query(Company.id, Company.name).order_by(Company.name).all()
+    )
     
     return render_template('jobs/post_job.html', companies=companies)
 
@@ -5655,24 +6059,20 @@ def job_detail(job_id):
     """Job detail page"""
     job = JobPosting.query.options(db.joinedload(JobPosting.company)).get_or_404(job_id)
     
-    # Increment view count
-    job.views_count = (job.views_count or 0) + 1
-    db.session.commit()
+    # Count the view; buffered and applied in batches off the request path
+    job_view_counts.increment(job_id)
     
     # Check if user has saved or applied to this job
     is_saved = False
     has_applied = False
     
     if current_user.is_authenticated:
-        is_saved = SavedJob.query.filter_by(
-            user_id=current_user.id, 
-            job_posting_id=job_id
-        ).first() is not None
-        
-        has_applied = JobApplication.query.filter_by(
-            user_id=current_user.id, 
-            job_posting_id=job_id
-        ).first() is not None
+        user_id = current_user.id
+        # Both checks as EXISTS in a single SELECT; no rows are loaded
+        is_saved, has_applied = db.session.query(
+            db.exists().where(SavedJob.user_id == user_id, SavedJob.job_posting_id == job_id),
+            db.exists().where(JobApplication.user_id == user_id, JobApplication.job_posting_id == job_id)
+        ).one()
     
     # Similar jobs functionality removed - Ez2source focuses on core talent intelligence features
     similar_jobs = []
@@ -5901,16 +6301,25 @@ def generate_cover_letter_editor(job_id):
             'location': job.location
         }
         
-        # Generate cover letter
-        result = generator.generate_cover_letter(
-            candidate_info=candidate_info,
-            job_details=job_info,
-            template_type=template_type,
-            tone=tone
-        )
-        
-        if result.get('error'):
-            return jsonify({'error': result['error']}), 500
+        # Reuse the letter for identical inputs; any profile or job edit changes the key
+        cache_key = hashlib.blake2b(orjson.dumps(
+            [candidate_info, job_info, template_type, tone], option=orjson.OPT_SORT_KEYS
+        ), digest_size=16).hexdigest()
+        result = cover_letter_cache.get(cache_key)
+        
+        if result is None:
+            # Generate cover letter
+            result = generator.generate_cover_letter(
+                candidate_info=candidate_info,
+                job_details=job_info,
+                template_type=template_type,
+                tone=tone
+            )
+            
+            if result.get('error'):
+                return jsonify({'error': result['error']}), 500
+            
+            cover_letter_cache.set(cache_key, result)
         
         return jsonify({
             'success': True,
@@ -5941,9 +6350,19 @@ def ai_match_score(job_id):
         # OneClickApplicationService removed
         job = JobPosting.query.get_or_404(job_id)
         
-        # Match score calculation disabled - service removed
-        job_data = service._extract_job_requirements(job)
-        match_score = service._calculate_match_score(profile_data, job_data, use_ai=True)
+        # Reuse the score until either the candidate's profile or the job's content changes. last_updated
+        # is not used: the view-count flush bumps it on every page view.
+        job_fingerprint = hashlib.blake2b(orjson.dumps(
+            [getattr(job, field) for field in MATCH_SCORE_JOB_FIELDS]
+        ), digest_size=16).hexdigest()
+        cache_key = (current_user.id, job_id, current_user.updated_at, job_fingerprint)
+        match_score = match_score_cache.get(cache_key)
+        
+        if match_score is None:
+            # Match score calculation disabled - service removed
+            job_data = service._extract_job_requirements(job)
+            match_score = service._calculate_match_score(profile_data, job_data, use_ai=True)
+            match_score_cache.set(cache_key, match_score)
         
         return jsonify({
             'success': True,
@@ -5980,17 +6399,10 @@ def browse_companies():
     if location:
         query = query.filter(Company.location.ilike(f'%{location}%'))
     
-    total_count = query.count()
-    companies = query.order_by(Company.name).offset((page - 1) * per_page).limit(per_page).all()
+    companies, total_count = paginate_with_total(query.order_by(Company.name), page, per_page)
     
-    # Get company job counts
-    company_job_counts = {}
-    for company in companies:
-        job_count = JobPosting.query.filter_by(
-            company_id=company.id, 
-            is_active=True
-        ).count()
-        company_job_counts[company.id] = job_count
+    # Active job counts are kept on the company row
+    company_job_counts = {company.id: company.active_job_count for company in companies}
     
     total_pages = (total_count + per_page - 1) // per_page
     
@@ -6022,8 +6434,7 @@ def company_detail(company_id):
         is_active=True
     ).order_by(JobPosting.posted_date.desc())
     
-    total_jobs = jobs_query.count()
-    jobs = jobs_query.offset((page - 1) * per_page).limit(per_page).all()
+    jobs, total_jobs = paginate_with_total(jobs_query, page, per_page)
     
     total_pages = (total_jobs + per_page - 1) // per_page
     
@@ -6072,45 +6483,50 @@ def save_interview_progress():
         return jsonify({'error': 'Access denied'}), 403
     
     try:
-        data = request.get_json()
+        # Autosave fires often; decode the body directly rather than through request.get_json()
+        try:
+            data = orjson.loads(request.get_data(cache=False))
+        except orjson.JSONDecodeError:
+            return jsonify({'error': 'Invalid JSON body'}), 400
+        
         interview_id = data.get('interview_id')
         responses = data.get('responses', {})
+        saved_questions = len(responses)
         
         if not interview_id:
             return jsonify({'error': 'Interview ID required'}), 400
         
         # Verify interview access
-        interview = Interview.query.get(interview_id)
-        if not interview:
+        if not db.session.query(db.exists().where(Interview.id == interview_id)).scalar():
             return jsonify({'error': 'Interview not found'}), 404
         
-        # Create or update interview progress record
-        
-        progress = InterviewProgress.query.filter_by(
-            interview_id=interview_id,
-            candidate_id=current_user.id
-        ).first()
-        
-        if not progress:
-            progress = InterviewProgress(
+        # Create or update the interview progress record in one statement
+        # (conflict target is the unique_interview_candidate_progress constraint)
+        now = datetime.utcnow()
+        progress_values = {
+            'responses': json_dumps(responses),
+            'progress_percentage': data.get('progress_percentage', 0),
+            'last_question': data.get('last_question', 0),
+            'updated_at': now
+        }
+        db.session.execute(
+            pg_insert(InterviewProgress).values(
                 interview_id=interview_id,
                 candidate_id=current_user.id,
-                organization_id=current_user.organization_id
+                organization_id=current_user.organization_id,
+                created_at=now,
+                **progress_values
+            ).on_conflict_do_update(
+                index_elements=[InterviewProgress.interview_id, InterviewProgress.candidate_id],
+                set_=progress_values
             )
-            db.session.add(progress)
-        
-        # Update progress data
-        progress.responses = json.dumps(responses)
-        progress.progress_percentage = data.get('progress_percentage', 0)
-        progress.last_question = data.get('last_question', 0)
-        progress.updated_at = datetime.utcnow()
-        
+        )
         db.session.commit()
         
         return jsonify({
             'success': True,
             'message': 'Progress saved successfully',
-            'saved_questions': len(responses)
+            'saved_questions': saved_questions
         })
         
     except Exception as e:
@@ -6162,40 +6578,87 @@ def get_candidates_comparison(interview_id):
 @app.route('/interview/response/<int:response_id>/regenerate-summary', methods=['POST'])
 @login_required
 def regenerate_response_summary(response_id):
-    """Regenerate AI summary for an interview response"""
+    """Start regenerating the AI summary for an interview response in the background"""
     try:
-        from interview_feedback_service import InterviewFeedbackSummarizer
-        
         # Verify access
         response = InterviewResponse.query.get_or_404(response_id)
         
         # Check permissions
-        if current_user.role == 'candidate' and response.candidate_id != current_user.id:
-            return jsonify({'error': 'Access denied'}), 403
-        elif current_user.role == 'recruiter' and response.organization_id != current_user.organization_id:
+        if summary_access_denied(response):
             return jsonify({'error': 'Access denied'}), 403
         
-        # Generate fresh summary
-        summarizer = InterviewFeedbackSummarizer()
-        summary = summarizer.generate_comprehensive_summary(response)
-        
-        # Update the response with new AI feedback
-        response.ai_feedback = json.dumps(summary)
-        if 'overall_score' in summary:
-            response.ai_score = summary['overall_score']
-        
-        db.session.commit()
+        # Only one regeneration per response at a time; repeat clicks join the running one
+        if summary_regeneration_jobs.add(response_id, True):
+            regenerated_summary_cache.delete(response_id)
+            submit_background_task(regenerate_summary_task, response_id)
         
         return jsonify({
             'success': True,
-            'summary': summary,
-            'message': 'Summary regenerated successfully'
-        })
+            'status': 'regenerating',
+            'response_id': response_id
+        }), 202
         
     except Exception as e:
         logging.error(f"Error regenerating summary: {e}")
         return jsonify({'error': 'Failed to regenerate summary'}), 500
 
+def summary_access_denied(response):
+    """
+    Whether the current user may not view this response's score and summary or regenerate the summary.
+    Denied unless the user is the responding candidate, staff of the response's organization, or a super admin.
+    """
+    if current_user.role == 'super_admin':
+        return False
+    if current_user.role == 'candidate':
+        return response.candidate_id != current_user.id
+    return response.organization_id != current_user.organization_id
+
+def regenerate_summary_task(response_id):
+    """Background task: regenerate and store a response's AI summary, keeping the result for polling"""
+    from interview_feedback_service import InterviewFeedbackSummarizer
+    
+    try:
+        response = db.session.get(InterviewResponse, response_id)
+        summary = InterviewFeedbackSummarizer().generate_comprehensive_summary(response)
+        
+        # Update the response with new AI feedback
+        response.ai_feedback = json_dumps(summary)
+        if 'overall_score' in summary:
+            response.ai_score = summary['overall_score']
+        db.session.commit()
+        result = {'status': 'completed', 'summary': summary}
+    except Exception as e:
+        db.session.rollback()
+        logging.error(f"Error regenerating summary for response {response_id}: {e}")
+        result = {'status': 'failed'}
+    
+    regenerated_summary_cache.set(response_id, result)
+    summary_regeneration_jobs.delete(response_id)
+
+@app.route('/interview/response/<int:response_id>/regenerate-summary/status')
+@login_required
+def regenerate_response_summary_status(response_id):
+    """Poll a background summary regeneration"""
+    response = InterviewResponse.query.get_or_404(response_id)
+    if summary_access_denied(response):
+        return jsonify({'error': 'Access denied'}), 403
+    
+    if summary_regeneration_jobs.get(response_id):
+        return jsonify({'success': True, 'status': 'regenerating'})
+    
+    result = regenerated_summary_cache.get(response_id)
+    if result is None:
+        return jsonify({'success': False, 'error': 'No summary regeneration in progress'}), 404
+    if result['status'] == 'failed':
+        return jsonify({'success': False, 'status': 'failed', 'error': 'Failed to regenerate summary'})
+    
+    return jsonify({
+        'success': True,
+        'status': 'completed',
+        'summary': result['summary'],
+        'message': 'Summary regenerated successfully'
+    })
+
 @app.route('/interview/response/<int:response_id>/feedback-summary')
 @login_required
 def interview_feedback_summary(response_id):
@@ -6248,7 +6711,7 @@ def get_interview_progress(interview_id):
         ).first()
         
         if progress and progress.responses:
-            responses = json.loads(progress.responses)
+            responses = orjson.loads(progress.responses)
             return jsonify({
                 'success': True,
                 'responses': responses,
@@ -6288,24 +6751,20 @@ def transcribe_audio_endpoint():
         if not validation_result['valid']:
             return jsonify({'error': validation_result['error']}), 400
         
-        # Transcribe audio using OpenAI Whisper
-        transcription_result = transcribe_audio(audio_file)
+        # Transcribe with OpenAI Whisper on the background pool; the client polls for the transcript
+        audio_file.seek(0)
+        job_id = uuid.uuid4().hex
+        transcription_cache.set(job_id, {'user_id': current_user.id, 'status': 'transcribing'})
+        submit_background_task(
+            transcribe_audio_task, job_id, current_user.id, audio_file.read(), question_index
+        )
         
-        if transcription_result['success']:
-            # Log successful transcription (without sensitive data)
-            logging.info(f"Audio transcription successful for user {current_user.id}, question {question_index}")
-            
-            return jsonify({
-                'success': True,
-                'transcript': transcription_result['transcript'],
-                'question_index': question_index
-            })
-        else:
-            logging.error(f"Transcription failed for user {current_user.id}: {transcription_result['error']}")
-            return jsonify({
-                'success': False,
-                'error': transcription_result['error']
-            }), 500
+        return jsonify({
+            'success': True,
+            'status': 'transcribing',
+            'job_id': job_id,
+            'question_index': question_index
+        }), 202
             
     except Exception as e:
         logging.error(f"Audio transcription endpoint error: {e}")
@@ -6314,6 +6773,45 @@ def transcribe_audio_endpoint():
             'error': 'Internal server error during transcription'
         }), 500
 
+def transcribe_audio_task(job_id, user_id, audio_bytes, question_index):
+    """Background task: transcribe a dictation clip and keep the result for polling"""
+    result = transcribe_audio(io.BytesIO(audio_bytes))
+    
+    if result['success']:
+        # Log successful transcription (without sensitive data)
+        logging.info(f"Audio transcription successful for user {user_id}, question {question_index}")
+    else:
+        logging.error(f"Transcription failed for user {user_id}: {result['error']}")
+    
+    transcription_cache.set(job_id, {
+        'user_id': user_id,
+        'status': 'completed' if result['success'] else 'failed',
+        'transcript': result['transcript'],
+        'error': result['error'],
+        'question_index': question_index
+    })
+
+@app.route('/api/transcribe-audio/<job_id>')
+@login_required
+def get_transcription_status(job_id):
+    """Poll a background voice dictation transcription"""
+    job = transcription_cache.get(job_id)
+    if job is None or job['user_id'] != current_user.id:
+        return jsonify({'success': False, 'error': 'Transcription not found'}), 404
+    
+    if job['status'] == 'transcribing':
+        return jsonify({'success': True, 'status': 'transcribing'})
+    
+    if job['status'] == 'failed':
+        return jsonify({'success': False, 'status': 'failed', 'error': job['error']})
+    
+    return jsonify({
+        'success': True,
+        'status': 'completed',
+        'transcript': job['transcript'],
+        'question_index': job['question_index']
+    })
+
 @app.route('/candidate/download-resume')
 @login_required
 def download_resume():
@@ -6328,15 +6826,21 @@ def download_resume():
         # Get candidate information
         candidate = current_user
         
-        # Create a text-based resume
-        resume_content = generate_text_resume(candidate)
+        # Create a text-based resume, rebuilt only after the profile changes or the cache entry expires
+        def build_resume():
+            body = generate_text_resume(candidate).encode()
+            return body, hashlib.md5(body).hexdigest()
         
-        # Create response with downloadable file
+        resume_content, etag = text_resume_cache.get_or_set((candidate.id, candidate.updated_at), build_resume)
+        
+        # Create response with downloadable file; repeat downloads of an unchanged resume get a 304
         response = make_response(resume_content)
         response.headers['Content-Type'] = 'text/plain'
         response.headers['Content-Disposition'] = f'attachment; filename="{candidate.username}_resume.txt"'
+        response.headers['Cache-Control'] = 'private, max-age=300'
+        response.set_etag(etag)
         
-        return response
+        return response.make_conditional(request)
         
     except Exception as e:
         logging.error(f"Resume download error for user {current_user.id}: {e}")
@@ -6381,37 +6885,27 @@ def generate_text_resume(candidate):
     if hasattr(candidate, 'skills') and candidate.skills:
         resume_lines.append("TECHNICAL SKILLS")
         resume_lines.append("-" * 16)
-        try:
-            import json
-            skills_list = json.loads(candidate.skills) if isinstance(candidate.skills, str) else candidate.skills
-            if isinstance(skills_list, list):
-                skills_text = ", ".join(skills_list)
-            else:
-                skills_text = str(candidate.skills)
-        except:
-            skills_text = str(candidate.skills)
-        resume_lines.append(skills_text)
+        # The *_list properties decode each JSON column once per loaded user; non-list values print as-is
+        if candidate.skills_list:
+            resume_lines.append(", ".join(map(str, candidate.skills_list)))
+        else:
+            resume_lines.append(str(candidate.skills))
         resume_lines.append("")
     
     # Work Experience
     if hasattr(candidate, 'experience') and candidate.experience:
         resume_lines.append("WORK EXPERIENCE")
         resume_lines.append("-" * 15)
-        try:
-            import json
-            experience_list = json.loads(candidate.experience) if isinstance(candidate.experience, str) else candidate.experience
-            if isinstance(experience_list, list):
-                for exp in experience_list:
-                    if isinstance(exp, dict):
-                        resume_lines.append(f"• {exp.get('title', 'Position')} at {exp.get('company', 'Company')}")
-                        if exp.get('duration'):
-                            resume_lines.append(f"  Duration: {exp['duration']}")
-                        if exp.get('description'):
-                            resume_lines.append(f"  {exp['description']}")
-                        resume_lines.append("")
-            else:
-                resume_lines.append(str(candidate.experience))
-        except:
+        if candidate.experience_list:
+            for exp in candidate.experience_list:
+                if isinstance(exp, dict):
+                    resume_lines.append(f"• {exp.get('title', 'Position')} at {exp.get('company', 'Company')}")
+                    if exp.get('duration'):
+                        resume_lines.append(f"  Duration: {exp['duration']}")
+                    if exp.get('description'):
+                        resume_lines.append(f"  {exp['description']}")
+                    resume_lines.append("")
+        else:
             resume_lines.append(str(candidate.experience))
         resume_lines.append("")
     
@@ -6419,24 +6913,21 @@ def generate_text_resume(candidate):
     if hasattr(candidate, 'education') and candidate.education:
         resume_lines.append("EDUCATION")
         resume_lines.append("-" * 9)
-        try:
-            import json
-            education_list = json.loads(candidate.education) if isinstance(candidate.education, str) else candidate.education
-            if isinstance(education_list, list):
-                for edu in education_list:
-                    if isinstance(edu, dict):
-                        resume_lines.append(f"• {edu.get('degree', 'Degree')} - {edu.get('institution', 'Institution')}")
-                        if edu.get('year'):
-                            resume_lines.append(f"  Year: {edu['year']}")
-                        resume_lines.append("")
-            else:
-                resume_lines.append(str(candidate.education))
-        except:
+        if candidate.education_list:
+            for edu in candidate.education_list:
+                if isinstance(edu, dict):
+                    resume_lines.append(f"• {edu.get('degree', 'Degree')} - {edu.get('institution', 'Institution')}")
+                    if edu.get('year'):
+                        resume_lines.append(f"  Year: {edu['year']}")
+                    resume_lines.append("")
+        else:
             resume_lines.append(str(candidate.education))
         resume_lines.append("")
     
     # Interview Performance
-    responses = InterviewResponse.query.filter_by(
+    responses = InterviewResponse.query.options(
+        joinedload(InterviewResponse.interview).load_only(Interview.id, Interview.title)
+    ).filter_by(
         candidate_id=candidate.id,
         organization_id=candidate.organization_id
     ).order_by(InterviewResponse.completed_at.desc()).limit(3).all()
@@ -6460,7 +6951,7 @@ def generate_text_resume(candidate):
 @login_required
 def universal_candidates():
     """Universal candidate access with cross-organization profiles"""
-    if current_user.role not in ['recruiter', 'admin']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         flash('Access denied. Recruiter or admin privileges required.', 'error')
         return redirect(url_for('dashboard'))
     
@@ -6488,7 +6979,7 @@ def universal_candidates():
 @login_required
 def send_public_invitation_page(candidate_id):
     """Send public interview invitation page (replaces modal)"""
-    if current_user.role not in ['recruiter', 'admin']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         flash('Access denied. Recruiter or admin privileges required.', 'error')
         return redirect(url_for('dashboard'))
     
@@ -6501,19 +6992,24 @@ def send_public_invitation_page(candidate_id):
     # Get available public interviews
     from universal_profile_service import UniversalProfileService
     
-    # Get public interviews that this recruiter can send invitations for
-    available_interviews = []
-    interviews = Interview.query.filter_by(
-        interview_type='public',
-        organization_id=current_user.organization_id
-    ).all()
+    # Get public interviews that this recruiter can send invitations for; they all belong to
+    # the recruiter's organization, so its name is looked up once. Shares the picker cache
+    # (and its invalidation) under its own key since this list includes inactive interviews.
+    organization_id = current_user.organization_id
     
-    for interview in interviews:
-        available_interviews.append({
-            'id': interview.id,
-            'title': interview.title,
-            'organization_name': interview.organization.name if interview.organization else 'Unknown'
-        })
+    def build_available_interviews():
+        organization_name = get_organization_name(organization_id) or 'Unknown'
+        return [
+            {'id': interview.id, 'title': interview.title, 'organization_name': organization_name}
+            for interview in db.session.query(Interview.id, Interview.title).filter_by(
+                interview_type='public',
+                organization_id=organization_id
+            ).all()
+        ]
+    
+    available_interviews = interview_list_cache.get_or_set(
+        ('public_invitation_page', organization_id), build_available_interviews
+    )
     
     return render_template('send_public_invitation.html',
                          candidate=candidate,
@@ -6523,7 +7019,7 @@ def send_public_invitation_page(candidate_id):
 @login_required
 def send_public_invitation_submit(candidate_id):
     """Handle public interview invitation submission"""
-    if current_user.role not in ['recruiter', 'admin']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         return jsonify({'success': False, 'message': 'Access denied'}), 403
     
     # Get form data
@@ -6559,7 +7055,7 @@ def send_public_invitation_submit(candidate_id):
 @login_required
 def filter_candidates():
     """Advanced candidate filtering for recruiters"""
-    if current_user.role not in ['recruiter', 'admin']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         flash('Access denied.', 'error')
         return redirect(url_for('dashboard'))
     
@@ -6591,64 +7087,89 @@ def filter_candidates():
     if max_experience is not None:
         query = query.filter(User.experience_years <= max_experience)
     
-    # Filter by interview performance
+    # Filter by interview performance (correlated EXISTS, evaluated as a semi-join in the database)
     if min_score is not None or max_score is not None:
-        subquery = db.session.query(InterviewResponse.candidate_id).join(Interview).filter(
+        score_match = db.session.query(InterviewResponse.id).join(Interview).filter(
+            InterviewResponse.candidate_id == User.id,
             Interview.organization_id == current_user.organization_id
         )
         if min_score is not None:
-            subquery = subquery.filter(InterviewResponse.ai_score >= min_score)
+            score_match = score_match.filter(InterviewResponse.ai_score >= min_score)
         if max_score is not None:
-            subquery = subquery.filter(InterviewResponse.ai_score <= max_score)
-        
-        candidate_ids = [row[0] for row in subquery.distinct().all()]
-        if candidate_ids:
-            query = query.filter(User.id.in_(candidate_ids))
-        else:
-            query = query.filter(User.id.in_([]))  # No matches
+            score_match = score_match.filter(InterviewResponse.ai_score <= max_score)
+        query = query.filter(score_match.exists())
     
     # Filter by tags
     if tag_ids:
-        tag_candidate_ids = db.session.query(CandidateTagAssignment.candidate_id).filter(
+        query = query.filter(db.session.query(CandidateTagAssignment.id).filter(
+            CandidateTagAssignment.candidate_id == User.id,
             CandidateTagAssignment.tag_id.in_(tag_ids)
-        ).distinct().all()
-        tag_candidate_ids = [row[0] for row in tag_candidate_ids]
-        if tag_candidate_ids:
-            query = query.filter(User.id.in_(tag_candidate_ids))
-        else:
-            query = query.filter(User.id.in_([]))
+        ).exists())
     
     candidates = query.order_by(User.created_at.desc()).all()
     
-    # Get interview performance for each candidate
+    # Get interview performance and tags for all candidates at once instead of per candidate
+    candidate_ids = [candidate.id for candidate in candidates]
+    performance = {}
+    tags_by_candidate = {}
+    if candidate_ids:
+        performance = {
+            row.candidate_id: row for row in db.session.query(
+                InterviewResponse.candidate_id,
+                db.func.avg(InterviewResponse.ai_score).label('avg_score'),
+                db.func.count(InterviewResponse.id).label('interview_count')
+            ).join(Interview).filter(
+                InterviewResponse.candidate_id.in_(candidate_ids),
+                Interview.organization_id == current_user.organization_id
+            ).group_by(InterviewResponse.candidate_id).all()
+        }
+        for candidate_id, tag in db.session.query(CandidateTagAssignment.candidate_id, CandidateTag).join(
+            CandidateTag, CandidateTag.id == CandidateTagAssignment.tag_id
+        ).filter(CandidateTagAssignment.candidate_id.in_(candidate_ids)).all():
+            tags_by_candidate.setdefault(candidate_id, []).append(tag)
+    
     for candidate in candidates:
-        responses = InterviewResponse.query.join(Interview).filter(
-            InterviewResponse.candidate_id == candidate.id,
-            Interview.organization_id == current_user.organization_id
-        ).all()
-        candidate.avg_score = sum(r.ai_score for r in responses) / len(responses) if responses else 0
-        candidate.interview_count = len(responses)
-        candidate.tags = db.session.query(CandidateTag).join(CandidateTagAssignment).filter(
-            CandidateTagAssignment.candidate_id == candidate.id
-        ).all()
+        stats = performance.get(candidate.id)
+        candidate.avg_score = (stats.avg_score or 0) if stats else 0
+        candidate.interview_count = stats.interview_count if stats else 0
+        candidate.tags = tags_by_candidate.get(candidate.id, [])
     
     # Get available tags for filtering
-    available_tags = CandidateTag.query.filter_by(organization_id=current_user.organization_id).all()
+    available_tags = candidate_filter_choices_cache.get_or_set(
+        ('tags', current_user.organization_id),
+        lambda: db.session.query(CandidateTag.id, CandidateTag.name, CandidateTag.color).filter_by(
+            organization_id=current_user.organization_id
+        ).all()
+    )
     
     # Get available lists for bulk actions
-    candidate_lists = CandidateList.query.filter_by(organization_id=current_user.organization_id).all()
+    candidate_lists = candidate_filter_choices_cache.get_or_set(
+        ('lists', current_user.organization_id),
+        lambda: db.session.query(CandidateList.id, CandidateList.name).filter_by(
+            organization_id=current_user.organization_id
+        ).all()
+    )
     
-    # Get recruiter's interviews for bulk email invitations
-    recruiter_interviews = Interview.query.filter_by(
-        recruiter_id=current_user.id,
-        organization_id=current_user.organization_id,
-        is_active=True
-    ).all()
+    # Get recruiter's interviews for bulk email invitations (dropped with the organization's other
+    # interview lists whenever an interview changes)
+    recruiter_interviews = interview_list_cache.get_or_set(
+        ('candidate_filter', current_user.organization_id, current_user.id),
+        lambda: db.session.query(Interview.id, Interview.title).filter_by(
+            recruiter_id=current_user.id,
+            organization_id=current_user.organization_id,
+            is_active=True
+        ).all()
+    )
     
-    # Get communication flags for all candidates
+    # Get communication flags and summary for all candidates; both scan the interaction history,
+    # so they are cached briefly per recruiter
     from communication_service import CommunicationTracker
-    communication_flags = CommunicationTracker.get_candidate_communication_flags(
-        current_user.id, current_user.organization_id
+    communication_flags, communication_summary = communication_flags_cache.get_or_set(
+        (current_user.id, current_user.organization_id),
+        lambda: (
+            CommunicationTracker.get_candidate_communication_flags(current_user.id, current_user.organization_id),
+            CommunicationTracker.get_communication_summary(current_user.id, current_user.organization_id)
+        )
     )
     
     # Enrich candidates with communication data
@@ -6663,11 +7184,6 @@ def filter_candidates():
         })
         enriched_candidates.append(candidate)
     
-    # Get communication summary
-    communication_summary = CommunicationTracker.get_communication_summary(
-        current_user.id, current_user.organization_id
-    )
-    
     return render_template('candidates/filter.html',
                          candidates=enriched_candidates,
                          communication_summary=communication_summary,
@@ -6688,7 +7204,7 @@ def filter_candidates():
 @login_required
 def export_candidates():
     """Export candidate data to Excel or PDF"""
-    if current_user.role not in ['recruiter', 'admin']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         return jsonify({'error': 'Access denied'}), 403
     
     candidate_ids = request.json.get('candidate_ids', [])
@@ -6714,7 +7230,7 @@ def export_candidates():
 @login_required
 def tag_candidates():
     """Add tags to selected candidates"""
-    if current_user.role not in ['recruiter', 'admin']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         return jsonify({'error': 'Access denied'}), 403
     
     candidate_ids = request.json.get('candidate_ids', [])
@@ -6723,6 +7239,15 @@ def tag_candidates():
     if not candidate_ids or not tag_id:
         return jsonify({'error': 'Missing required data'}), 400
     
+    # Bad ids would otherwise fail inside the single INSERT below and abort the whole batch
+    try:
+        if not isinstance(candidate_ids, list):
+            raise TypeError
+        candidate_ids = {int(candidate_id) for candidate_id in candidate_ids}
+        tag_id = int(tag_id)
+    except (TypeError, ValueError):
+        return jsonify({'error': 'candidate_ids must be a list of ids and tag_id an id'}), 400
+    
     # Verify tag belongs to organization
     tag = CandidateTag.query.filter_by(
         id=tag_id,
@@ -6732,23 +7257,23 @@ def tag_candidates():
     if not tag:
         return jsonify({'error': 'Tag not found'}), 404
     
-    # Add tags to candidates
-    tagged_count = 0
-    for candidate_id in candidate_ids:
-        # Check if already tagged
-        existing = CandidateTagAssignment.query.filter_by(
-            candidate_id=candidate_id,
-            tag_id=tag_id
-        ).first()
-        
-        if not existing:
-            assignment = CandidateTagAssignment(
-                candidate_id=candidate_id,
-                tag_id=tag_id,
-                assigned_by=current_user.id
-            )
-            db.session.add(assignment)
-            tagged_count += 1
+    # Tag the organization's candidates among candidate_ids in one INSERT ... SELECT; unknown ids
+    # simply select nothing, already-tagged candidates are skipped by the unique constraint, and
+    # RETURNING counts only the rows actually added
+    organization_candidates = db.select(
+        User.id, db.literal(tag_id), db.literal(current_user.id), db.literal(datetime.utcnow())
+    ).where(
+        User.id.in_(candidate_ids),
+        User.organization_id == current_user.organization_id,
+        User.role == 'candidate'
+    )
+    tagged_count = len(db.session.execute(
+        pg_insert(CandidateTagAssignment).from_select(
+            ['candidate_id', 'tag_id', 'assigned_by', 'assigned_at'], organization_candidates
+        ).on_conflict_do_nothing(
+            index_elements=[CandidateTagAssignment.candidate_id, CandidateTagAssignment.tag_id]
+        ).returning(CandidateTagAssignment.id)
+    ).all())
     
     db.session.commit()
     return jsonify({'success': True, 'tagged_count': tagged_count})
@@ -6757,7 +7282,7 @@ def tag_candidates():
 @login_required
 def bulk_email_candidates():
     """Send bulk email invitations to candidates"""
-    if current_user.role not in ['recruiter', 'admin']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         return jsonify({'error': 'Access denied'}), 403
     
     candidate_ids = request.json.get('candidate_ids', [])
@@ -6774,43 +7299,48 @@ def bulk_email_candidates():
         User.role == 'candidate'
     ).all()
     
-    sent_count = 0
-    for candidate in candidates:
-        try:
-            # Create interview invitation if interview_id provided
-            if interview_id:
-                # Check if invitation already exists
-                existing_invitation = InterviewInvitation.query.filter_by(
-                    interview_id=interview_id,
-                    candidate_id=candidate.id
-                ).first()
-                
-                if not existing_invitation:
-                    invitation = InterviewInvitation(
-                        interview_id=interview_id,
-                        candidate_id=candidate.id,
-                        recruiter_id=current_user.id,
-                        organization_id=current_user.organization_id,
-                        message=message,
-                        status='pending'
-                    )
-                    db.session.add(invitation)
-            
-            # Send email (placeholder - implement with actual email service)
-            send_candidate_email(candidate.email, subject, message)
-            sent_count += 1
-            
-        except Exception as e:
-            logging.error(f"Failed to send email to {candidate.email}: {e}")
+    # Invite every candidate in one INSERT; existing invitations are skipped by the unique constraint
+    if interview_id and candidates:
+        db.session.execute(
+            pg_insert(InterviewInvitation).values([
+                {
+                    'interview_id': interview_id,
+                    'candidate_id': candidate.id,
+                    'recruiter_id': current_user.id,
+                    'organization_id': current_user.organization_id,
+                    'message': message,
+                    'status': 'pending'
+                }
+                for candidate in candidates
+            ]).on_conflict_do_nothing(
+                index_elements=[InterviewInvitation.interview_id, InterviewInvitation.candidate_id]
+            )
+        )
     
     db.session.commit()
+    
+    # Send emails concurrently - each is a blocking network round-trip
+    sent_count = 0
+    if candidates:
+        with ThreadPoolExecutor(max_workers=min(16, len(candidates))) as pool:
+            email_futures = {
+                pool.submit(send_bulk_candidate_email, candidate.email, subject, message): candidate.email
+                for candidate in candidates
+            }
+            for future in as_completed(email_futures):
+                try:
+                    future.result()
+                    sent_count += 1
+                except Exception as e:
+                    logging.error(f"Failed to send email to {email_futures[future]}: {e}")
+    
     return jsonify({'success': True, 'sent_count': sent_count})
 
 @app.route('/tags/create', methods=['POST'])
 @login_required
 def create_tag():
     """Create a new candidate tag"""
-    if current_user.role not in ['recruiter', 'admin']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         return jsonify({'error': 'Access denied'}), 403
     
     name = request.json.get('name', '').strip()
@@ -6819,15 +7349,6 @@ def create_tag():
     if not name:
         return jsonify({'error': 'Tag name is required'}), 400
     
-    # Check if tag already exists
-    existing = CandidateTag.query.filter_by(
-        name=name,
-        organization_id=current_user.organization_id
-    ).first()
-    
-    if existing:
-        return jsonify({'error': 'Tag already exists'}), 400
-    
     tag = CandidateTag(
         name=name,
         color=color,
@@ -6836,7 +7357,13 @@ def create_tag():
     )
     
     db.session.add(tag)
-    db.session.commit()
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # The organization already has a tag with this name
+        db.session.rollback()
+        return jsonify({'error': 'Tag already exists'}), 400
+    candidate_filter_choices_cache.delete(('tags', current_user.organization_id))
     
     return jsonify({
         'success': True,
@@ -6851,7 +7378,7 @@ def create_tag():
 @login_required
 def create_candidate_list():
     """Create a new candidate list"""
-    if current_user.role not in ['recruiter', 'admin']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         return jsonify({'error': 'Access denied'}), 403
     
     name = request.json.get('name', '').strip()
@@ -6861,15 +7388,6 @@ def create_candidate_list():
     if not name:
         return jsonify({'error': 'List name is required'}), 400
     
-    # Check if list name already exists for this organization
-    existing_list = CandidateList.query.filter_by(
-        name=name,
-        organization_id=current_user.organization_id
-    ).first()
-    
-    if existing_list:
-        return jsonify({'error': 'A list with this name already exists'}), 400
-    
     candidate_list = CandidateList(
         name=name,
         description=description,
@@ -6878,34 +7396,18 @@ def create_candidate_list():
     )
     
     db.session.add(candidate_list)
-    db.session.flush()  # Get the ID
+    try:
+        db.session.flush()  # Get the ID
+    except IntegrityError:
+        # The organization already has a list with this name
+        db.session.rollback()
+        return jsonify({'error': 'A list with this name already exists'}), 400
     
     # Add candidates to list (verify they belong to the organization)
-    added_count = 0
-    for candidate_id in candidate_ids:
-        candidate = User.query.filter_by(
-            id=candidate_id,
-            organization_id=current_user.organization_id,
-            role='candidate'
-        ).first()
-        
-        if candidate:
-            # Check if already in list
-            existing_membership = CandidateListMembership.query.filter_by(
-                list_id=candidate_list.id,
-                candidate_id=candidate_id
-            ).first()
-            
-            if not existing_membership:
-                membership = CandidateListMembership(
-                    list_id=candidate_list.id,
-                    candidate_id=candidate_id,
-                    added_by=current_user.id
-                )
-                db.session.add(membership)
-                added_count += 1
+    added_count = add_candidates_to_list(candidate_list.id, candidate_ids)
     
     db.session.commit()
+    candidate_filter_choices_cache.delete(('lists', current_user.organization_id))
     
     return jsonify({
         'success': True,
@@ -6921,7 +7423,7 @@ def create_candidate_list():
 @login_required
 def add_list_members():
     """Add candidates to an existing list"""
-    if current_user.role not in ['recruiter', 'admin']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         return jsonify({'error': 'Access denied'}), 403
     
     list_id = request.json.get('list_id')
@@ -6940,29 +7442,7 @@ def add_list_members():
         return jsonify({'error': 'List not found'}), 404
     
     # Add candidates to list
-    added_count = 0
-    for candidate_id in candidate_ids:
-        candidate = User.query.filter_by(
-            id=candidate_id,
-            organization_id=current_user.organization_id,
-            role='candidate'
-        ).first()
-        
-        if candidate:
-            # Check if already in list
-            existing_membership = CandidateListMembership.query.filter_by(
-                list_id=list_id,
-                candidate_id=candidate_id
-            ).first()
-            
-            if not existing_membership:
-                membership = CandidateListMembership(
-                    list_id=list_id,
-                    candidate_id=candidate_id,
-                    added_by=current_user.id
-                )
-                db.session.add(membership)
-                added_count += 1
+    added_count = add_candidates_to_list(list_id, candidate_ids)
     
     db.session.commit()
     
@@ -6972,35 +7452,61 @@ def add_list_members():
         'list_name': candidate_list.name
     })
 
+def add_candidates_to_list(list_id, candidate_ids):
+    """
+    Add the organization's candidates among candidate_ids to a list, skipping existing members.
+    A single INSERT ... SELECT ... ON CONFLICT DO NOTHING; returns how many were added (caller commits).
+    """
+    organization_candidates = db.select(
+        db.literal(list_id), User.id, db.literal(current_user.id), db.literal(datetime.utcnow())
+    ).where(
+        User.id.in_(candidate_ids),
+        User.organization_id == current_user.organization_id,
+        User.role == 'candidate'
+    )
+    added = db.session.execute(
+        pg_insert(CandidateListMembership).from_select(
+            ['list_id', 'candidate_id', 'added_by', 'added_at'], organization_candidates
+        ).on_conflict_do_nothing(
+            index_elements=[CandidateListMembership.list_id, CandidateListMembership.candidate_id]
+        ).returning(CandidateListMembership.id)
+    ).all()
+    return len(added)
+
 def export_candidates_excel(candidates):
     """Export candidates to Excel format"""
+    import csv
     import io
     from datetime import datetime
     
-    # Create CSV content (simpler than Excel for demo)
-    output = io.StringIO()
-    output.write("Name,Email,Phone,Location,Experience,Skills,Average Score,Interview Count,Tags\n")
+    # Create CSV content (simpler than Excel for demo); csv.writer handles quoting of embedded quotes/newlines
+    # Tag names for every exported candidate in one join, indexed by candidate id
+    tag_names = {}
+    for candidate_id, tag_name in db.session.query(
+        CandidateTagAssignment.candidate_id, CandidateTag.name
+    ).join(CandidateTag, CandidateTag.id == CandidateTagAssignment.tag_id).filter(
+        CandidateTagAssignment.candidate_id.in_([candidate.id for candidate in candidates])
+    ).all():
+        tag_names.setdefault(candidate_id, []).append(tag_name)
     
-    for candidate in candidates:
-        tags = ', '.join([tag.name for tag in getattr(candidate, 'tags', [])])
-        skills = candidate.skills or ''
-        if skills.startswith('['):
-            try:
-                import json
-                skills_list = json.loads(skills)
-                skills = ', '.join(skills_list)
-            except:
-                pass
-        
-        output.write(f'"{candidate.first_name or ""} {candidate.last_name or ""}",')
-        output.write(f'"{candidate.email}",')
-        output.write(f'"{candidate.phone or ""}",')
-        output.write(f'"{candidate.location or ""}",')
-        output.write(f'"{candidate.experience_years or 0}",')
-        output.write(f'"{skills}",')
-        output.write(f'"{getattr(candidate, "avg_score", 0):.1f}",')
-        output.write(f'"{getattr(candidate, "interview_count", 0)}",')
-        output.write(f'"{tags}"\n')
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(['Name', 'Email', 'Phone', 'Location', 'Experience', 'Skills', 'Average Score', 'Interview Count', 'Tags'])
+    writer.writerows(
+        (
+            f'{candidate.first_name or ""} {candidate.last_name or ""}',
+            candidate.email,
+            candidate.phone or '',
+            candidate.location or '',
+            candidate.experience_years or 0,
+            # skills_list is decoded once per loaded user; non-JSON values are exported as stored
+            ', '.join(map(str, candidate.skills_list)) if candidate.skills_list else (candidate.skills or ''),
+            f'{getattr(candidate, "avg_score", 0):.1f}',
+            getattr(candidate, 'interview_count', 0),
+            ', '.join(tag_names.get(candidate.id, []))
+        )
+        for candidate in candidates
+    )
     
     response = make_response(output.getvalue())
     response.headers['Content-Type'] = 'text/csv'
@@ -7027,20 +7533,18 @@ def export_candidates_pdf(candidates):
     response.headers['Content-Disposition'] = f'attachment; filename=candidates_{datetime.now().strftime("%Y%m%d")}.txt'
     return response
 
-def send_candidate_email(email, subject, message):
+def send_bulk_candidate_email(email, subject, message):
     """Send email to candidate (placeholder implementation)"""
     # This would integrate with your email service (SendGrid, etc.)
     logging.info(f"Sending email to {email}: {subject}")
     return True
 
 # System Settings API Routes
-@app.route('/system/settings-panel')
-@login_required
-@login_required
+@app.route('/api/system/database/status')
 @login_required
 def api_database_status():
     """Get database status and table information"""
-    if current_user.role not in ['super_admin', 'admin']:
+    if current_user.role not in ADMIN_ROLES:
         return jsonify({'error': 'Access denied'}), 403
     
     try:
@@ -7054,7 +7558,7 @@ def api_database_status():
 @login_required
 def api_optimize_database():
     """Optimize database performance"""
-    if current_user.role not in ['super_admin', 'admin']:
+    if current_user.role not in ADMIN_ROLES:
         return jsonify({'error': 'Access denied'}), 403
     
     try:
@@ -7092,8 +7596,7 @@ def api_performance_metrics():
         logging.error(f"Error getting performance metrics: {e}")
         return jsonify({'error': 'Failed to get performance metrics'}), 500
 
-@app.route('/api/system/settings', methods=['GET', 'POST'])
-@login_required
+@app.route('/api/system/users/import', methods=['POST'])
 @login_required
 def api_bulk_import_users():
     """Bulk import users from CSV file"""
@@ -7115,43 +7618,55 @@ def api_bulk_import_users():
         import io
         
         stream = io.StringIO(file.stream.read().decode("UTF8"), newline=None)
-        csv_input = csv.DictReader(stream)
+        csv_rows = list(csv.DictReader(stream))
         
-        imported = 0
+        # Look up every already-registered email in one query instead of one per row
+        existing_emails = set(db.session.scalars(
+            db.select(User.email).where(User.email.in_({row['email'] for row in csv_rows if row.get('email')}))
+        ))
+        
+        new_users = []
         errors = 0
         
-        for row in csv_input:
+        for row in csv_rows:
             try:
                 # Validate required fields
                 if not all([row.get('username'), row.get('email'), row.get('organization_id')]):
                     errors += 1
                     continue
                 
-                # Check if user already exists
-                if User.query.filter_by(email=row['email']).first():
+                # Check if user already exists (in the database or earlier in this file)
+                if row['email'] in existing_emails:
                     errors += 1
                     continue
                 
                 # Create user
-                user = User(
-                    username=row['username'],
-                    email=row['email'],
-                    password_hash=generate_password_hash(row.get('password', 'TempPass123!')),
-                    role=row.get('role', 'candidate'),
-                    organization_id=int(row['organization_id']),
-                    first_name=row.get('first_name', ''),
-                    last_name=row.get('last_name', ''),
-                    phone=row.get('phone', ''),
-                    cross_org_accessible=True
-                )
+                user = {
+                    'username': row['username'],
+                    'email': row['email'],
+                    'password_hash': generate_password_hash(row.get('password', 'TempPass123!')),
+                    'role': row.get('role', 'candidate'),
+                    'organization_id': int(row['organization_id']),
+                    'first_name': row.get('first_name', ''),
+                    'last_name': row.get('last_name', ''),
+                    'phone': row.get('phone', ''),
+                    'cross_org_accessible': True
+                }
+                # Core inserts skip the attribute events that normally maintain profile_flags
+                user['profile_flags'] = compute_profile_flags(SimpleNamespace(**user))
                 
-                db.session.add(user)
-                imported += 1
+                new_users.append(user)
+                existing_emails.add(row['email'])
                 
             except Exception as e:
                 logging.error(f"Error importing user: {e}")
                 errors += 1
         
+        # Multi-row INSERTs in chunks, without building ORM objects
+        for start in range(0, len(new_users), 1000):
+            db.session.execute(insert(User), new_users[start:start + 1000])
+        imported = len(new_users)
+        
         db.session.commit()
         
         return jsonify({
@@ -7177,34 +7692,45 @@ def api_export_users():
         import io
         from datetime import datetime
         
-        # Get all users
-        users = User.query.all()
-        
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        writer.writerow([
-            'ID', 'Username', 'Email', 'Role', 'Organization ID', 'First Name', 
-            'Last Name', 'Phone', 'Created At', 'Active'
-        ])
+        # Get all users - only the exported columns, fetched in batches from a server-side cursor
+        user_rows = db.session.execute(
+            db.select(
+                User.id, User.username, User.email, User.role, User.organization_id,
+                User.first_name, User.last_name, User.phone, User.created_at, User.user_active
+            ).order_by(User.id).execution_options(yield_per=1000)
+        )
         
-        # Write user data
-        for user in users:
+        def generate_csv():
+            output = io.StringIO()
+            writer = csv.writer(output)
+            
+            # Write header
             writer.writerow([
-                user.id, user.username, user.email, user.role, user.organization_id,
-                user.first_name or '', user.last_name or '', user.phone or '',
-                user.created_at.isoformat() if user.created_at else '',
-                user.user_active
+                'ID', 'Username', 'Email', 'Role', 'Organization ID', 'First Name', 
+                'Last Name', 'Phone', 'Created At', 'Active'
             ])
+            yield output.getvalue()
+            
+            # Write user data one batch at a time
+            for rows in user_rows.partitions():
+                output.seek(0)
+                output.truncate()
+                writer.writerows(
+                    (user_id, username, email, role, organization_id,
+                     first_name or '', last_name or '', phone or '',
+                     created_at.isoformat() if created_at else '',
+                     user_active)
+                    for (user_id, username, email, role, organization_id,
+                         first_name, last_name, phone, created_at, user_active) in rows
+                )
+                yield output.getvalue()
         
-        output.seek(0)
-        
-        response = make_response(output.getvalue())
-        response.headers['Content-Type'] = 'text/csv'
-        response.headers['Content-Disposition'] = f'attachment; filename=users_export_{datetime.now().strftime("%Y%m%d")}.csv'
-        
-        return response
+        # Stream the CSV so memory stays bounded and the first bytes go out immediately
+        return Response(
+            stream_with_context(generate_csv()),
+            mimetype='text/csv',
+            headers={'Content-Disposition': f'attachment; filename=users_export_{datetime.now().strftime("%Y%m%d")}.csv'}
+        )
         
     except Exception as e:
         logging.error(f"Error exporting users: {e}")
@@ -7231,26 +7757,64 @@ def api_create_database_indexes():
             "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_interview_responses_status ON interview_responses(status)",
             "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_job_posting_is_active ON job_posting(is_active)",
             "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_job_posting_created_at ON job_posting(created_at)",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_job_company_active ON job_posting(company_id, is_active)",
             "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_job_application_candidate_id ON job_application(candidate_id)",
             "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_job_application_job_id ON job_application(job_id)",
             "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_audit_log_user_id ON audit_log(user_id)",
             "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_audit_log_created_at ON audit_log(created_at)",
             "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_messages_sender_id ON messages(sender_id)",
             "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_messages_recipient_id ON messages(recipient_id)",
-            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_messages_created_at ON messages(created_at)"
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_messages_created_at ON messages(created_at)",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_interview_org_type_active ON interview(organization_id, interview_type, is_active)",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_invitation_candidate_status_invited ON interview_invitation(candidate_id, status, invited_at)",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_invitation_candidate_pending ON interview_invitation(candidate_id, invited_at) WHERE status = 'pending'",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_org_role_active ON \"user\"(organization_id, role, user_active)",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_org_role_when_active ON \"user\"(organization_id, role) WHERE user_active",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_interview_recruiter ON interview(recruiter_id)",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_schedule_interview_candidate ON interview_schedule(interview_id, candidate_id)",
+            # audit_log.organization_id itself is added and backfilled by schema_migrations at startup
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_audit_log_org_timestamp ON audit_log(organization_id, timestamp)",
+            # Users may keep several availability slots per weekday; drop the one-slot-per-day
+            # constraint (or index) that earlier versions of this list created
+            "ALTER TABLE availability_slot DROP CONSTRAINT IF EXISTS _availability_user_day_uc",
+            "DROP INDEX CONCURRENTLY IF EXISTS _availability_user_day_uc",
+            # Trigram indexes let the '%term%' ILIKE/contains filters in browse_companies and
+            # filter_candidates use an index; kept out of the models since they need the pg_trgm extension
+            "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_company_industry_trgm ON company USING gin (industry gin_trgm_ops)",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_company_location_trgm ON company USING gin (location gin_trgm_ops)",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_location_trgm ON \"user\" USING gin (location gin_trgm_ops)",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_skills_trgm ON \"user\" USING gin (skills gin_trgm_ops)",
+            # Drop duplicate tag assignments, then enforce one per (candidate, tag) for ON CONFLICT tagging
+            "DELETE FROM candidate_tag_assignment a USING candidate_tag_assignment b WHERE a.candidate_id = b.candidate_id AND a.tag_id = b.tag_id AND a.id > b.id",
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS _tag_assignment_candidate_tag_uc ON candidate_tag_assignment(candidate_id, tag_id)",
+            # Same for candidate list memberships
+            "DELETE FROM candidate_list_membership a USING candidate_list_membership b WHERE a.list_id = b.list_id AND a.candidate_id = b.candidate_id AND a.id > b.id",
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS _list_membership_list_candidate_uc ON candidate_list_membership(list_id, candidate_id)",
+            # Tag and list names are unique per organization; existing duplicates are renamed with their id
+            # rather than deleted, since they may already have assignments and members
+            "UPDATE candidate_tag a SET name = left(a.name, 38) || ' (' || a.id || ')' FROM candidate_tag b WHERE a.organization_id = b.organization_id AND a.name = b.name AND a.id > b.id",
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS _candidate_tag_org_name_uc ON candidate_tag(organization_id, name)",
+            "UPDATE candidate_list a SET name = left(a.name, 88) || ' (' || a.id || ')' FROM candidate_list b WHERE a.organization_id = b.organization_id AND a.name = b.name AND a.id > b.id",
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS _candidate_list_org_name_uc ON candidate_list(organization_id, name)"
         ]
         
         created = 0
         errors = []
         
-        for index_sql in indexes:
-            try:
-                db.session.execute(text(index_sql))
-                db.session.commit()
-                created += 1
-            except Exception as e:
-                errors.append(f"Index creation failed: {str(e)}")
-                db.session.rollback()
+        # End the request session's transaction first: it still holds the lock and snapshot taken while
+        # loading current_user, which ALTER TABLE "user" and CONCURRENTLY below would wait on forever
+        db.session.commit()
+
+        # CREATE INDEX CONCURRENTLY can't run inside a transaction block, so use an autocommit
+        # connection; each statement then commits (or fails) on its own
+        with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+            for index_sql in indexes:
+                try:
+                    connection.execute(text(index_sql))
+                    created += 1
+                except Exception as e:
+                    errors.append(f"Index creation failed: {str(e)}")
         
         return jsonify({
             'success': True,
@@ -7376,6 +7940,7 @@ def admin_edit_organization(org_id):
         
         try:
             db.session.commit()
+            organization_name_cache.delete(org_id)
             flash(f'Organization "{org.name}" updated successfully!', 'success')
             return redirect(url_for('admin_organizations'))
         except Exception as e:
@@ -7424,12 +7989,7 @@ def admin_add_user_to_organization(org_id):
             return redirect(url_for('admin_organization_users', org_id=org_id))
         
         # Generate username from email
-        username = email.split('@')[0]
-        counter = 1
-        original_username = username
-        while User.query.filter_by(username=username).first():
-            username = f"{original_username}_{counter}"
-            counter += 1
+        username = generate_unique_username(email.split('@')[0])
         
         # Create new user
         new_user = User(
@@ -7449,10 +8009,11 @@ def admin_add_user_to_organization(org_id):
         # Log the action
         audit_log = AuditLog(
             user_id=current_user.id,
+            organization_id=current_user.organization_id,
             action='CREATE_USER',
             resource_type='user',
             resource_id=new_user.id,
-            details=json.dumps({
+            details=json_dumps({
                 'created_email': email,
                 'created_role': role,
                 'organization_id': org_id,
@@ -7491,6 +8052,7 @@ def admin_delete_organization(org_id):
         org_name = org.name
         db.session.delete(org)
         db.session.commit()
+        organization_name_cache.delete(org_id)
         flash(f'Organization "{org_name}" deleted successfully!', 'success')
     except Exception as e:
         db.session.rollback()
@@ -7620,10 +8182,6 @@ def admin_organization_settings(org_id):
 
 @app.route('/admin/job-scheduler')
 @login_required
-@login_required
-@login_required
-@login_required
-@login_required
 def technical_person_dashboard():
     """Dashboard for technical persons"""
     if current_user.role != 'technical_person':
@@ -7754,10 +8312,11 @@ def submit_technical_feedback(assignment_id):
             from models import AuditLog
             audit_log = AuditLog(
                 user_id=current_user.id,
+                organization_id=current_user.organization_id,
                 action='technical_feedback_submitted',
                 resource_type='technical_interview_feedback',
                 resource_id=feedback.id,
-                details=json.dumps({
+                details=json_dumps({
                     'assignment_id': assignment_id,
                     'candidate_id': assignment.candidate_id,
                     'decision': feedback_data['decision'],
@@ -7810,7 +8369,7 @@ def technical_assignments():
 @login_required
 def manage_technical_persons():
     """Manage technical persons"""
-    if current_user.role not in ['admin', 'recruiter']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         flash('Access denied. Admin or HR privileges required.', 'error')
         return redirect(url_for('dashboard'))
     
@@ -7835,7 +8394,7 @@ def manage_technical_persons():
 @login_required
 def assign_technical_interview():
     """Assign technical person to interview"""
-    if current_user.role not in ['admin', 'recruiter']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         flash('Access denied. Admin or HR privileges required.', 'error')
         return redirect(url_for('dashboard'))
     
@@ -7884,7 +8443,7 @@ def assign_technical_interview():
 @login_required
 def schedule_google_meet():
     """HR interface for scheduling Google Meet meetings with technical interviewers"""
-    if current_user.role not in ['admin', 'recruiter']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         flash('Access denied. Admin or HR privileges required.', 'error')
         return redirect(url_for('dashboard'))
     
@@ -8049,7 +8608,7 @@ def schedule_google_meet():
 @login_required
 def view_technical_feedback(feedback_id):
     """View technical interview feedback"""
-    if current_user.role not in ['admin', 'recruiter']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         flash('Access denied. Admin or HR privileges required.', 'error')
         return redirect(url_for('dashboard'))
     
@@ -8075,7 +8634,7 @@ def view_technical_feedback(feedback_id):
 @login_required
 def second_round_requests():
     """View candidates requiring second round interviews"""
-    if current_user.role not in ['admin', 'recruiter']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         flash('Access denied. Admin or HR privileges required.', 'error')
         return redirect(url_for('dashboard'))
     
@@ -8097,7 +8656,7 @@ def second_round_requests():
 @login_required
 def admin_analytics():
     """Organization analytics dashboard for admin and super admin"""
-    if current_user.role not in ['admin', 'super_admin']:
+    if current_user.role not in ADMIN_ROLES:
         flash('Access denied. Admin privileges required.', 'error')
         return redirect(url_for('dashboard'))
     
@@ -8247,14 +8806,15 @@ def add_candidate():
             # Create audit log
             audit_log = AuditLog()
             audit_log.user_id = current_user.id
+            audit_log.organization_id = current_user.organization_id
             audit_log.action = 'CREATE_CANDIDATE'
-            audit_log.details = f'Added candidate {first_name} {last_name} (ID: {new_candidate.id}) to organization {current_user.organization.name}'
+            audit_log.details = f'Added candidate {first_name} {last_name} (ID: {new_candidate.id}) to organization {get_organization_name(current_user.organization_id)}'
             audit_log.ip_address = request.remote_addr
             
             db.session.add(audit_log)
             db.session.commit()
             
-            flash(f'Candidate {first_name} {last_name} added successfully to {current_user.organization.name}!', 'success')
+            flash(f'Candidate {first_name} {last_name} added successfully to {get_organization_name(current_user.organization_id)}!', 'success')
             return redirect(url_for('candidates'))
             
         except Exception as e:
@@ -8265,7 +8825,7 @@ def add_candidate():
     
     # GET request - show the form
     return render_template('add_candidate.html', 
-                         current_organization=current_user.organization.name if current_user.organization else 'Unknown')
+                         current_organization=get_organization_name(current_user.organization_id) or 'Unknown')
 
 @app.route('/api/add-organization-candidate', methods=['POST'])
 @login_required
@@ -8319,6 +8879,7 @@ def api_add_organization_candidate():
         # Create audit log
         audit_log = AuditLog()
         audit_log.user_id = current_user.id
+        audit_log.organization_id = current_user.organization_id
         audit_log.action = 'API_CREATE_CANDIDATE'
         audit_log.details = f'Added candidate {data["first_name"]} {data["last_name"]} (ID: {new_candidate.id}) via API'
         audit_log.ip_address = request.remote_addr
@@ -8330,7 +8891,7 @@ def api_add_organization_candidate():
             'success': True,
             'message': 'Candidate added successfully',
             'candidate_id': new_candidate.id,
-            'organization': current_user.organization.name
+            'organization': get_organization_name(current_user.organization_id)
         })
         
     except Exception as e:
@@ -8342,7 +8903,7 @@ def api_add_organization_candidate():
 @login_required
 def hr_technical_feedback():
     """HR interface to view all technical feedback in organization"""
-    if current_user.role not in ['recruiter', 'admin']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         flash('Access denied. HR/Admin role required.', 'error')
         return redirect(url_for('dashboard'))
     
@@ -8370,7 +8931,7 @@ def hr_technical_feedback():
 @login_required
 def send_candidate_email():
     """Send decision email to candidate based on technical interview feedback"""
-    if current_user.role not in ['recruiter', 'admin']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         return jsonify({'success': False, 'message': 'Access denied. HR/Admin role required.'}), 403
     
     try:
@@ -8551,8 +9112,7 @@ def create_resume():
             # Parse work experience from user profile
             if current_user.experience:
                 try:
-                    import json
-                    experiences = json.loads(current_user.experience)
+                    experiences = orjson.loads(current_user.experience)
                     for idx, exp in enumerate(experiences[:5]):  # Limit to 5 experiences
                         # Handle different date formats
                         start_date = None
@@ -8604,8 +9164,7 @@ def create_resume():
             # Parse education from user profile  
             if current_user.education:
                 try:
-                    import json
-                    educations = json.loads(current_user.education)
+                    educations = orjson.loads(current_user.education)
                     for idx, edu in enumerate(educations[:5]):  # Limit to 5 education entries
                         # Handle different date formats for education
                         start_date = None
@@ -8850,7 +9409,6 @@ def resume_analysis(resume_id):
         # Parse JSON fields if analysis exists
         if analysis:
             try:
-                import json
                 analysis.strengths = json.loads(analysis.strengths) if analysis.strengths else []
                 analysis.weaknesses = json.loads(analysis.weaknesses) if analysis.weaknesses else []
                 analysis.recommendations = json.loads(analysis.recommendations) if analysis.recommendations else []
@@ -9324,10 +9882,10 @@ def save_resume():
         resume.headline = data.get('headline', resume.headline)
         
         # Update skills
-        resume.technical_skills = json.dumps(data.get('technical_skills', []))
-        resume.soft_skills = json.dumps(data.get('soft_skills', []))
-        resume.languages = json.dumps(data.get('languages', []))
-        resume.certifications = json.dumps(data.get('certifications', []))
+        resume.technical_skills = json_dumps(data.get('technical_skills', []))
+        resume.soft_skills = json_dumps(data.get('soft_skills', []))
+        resume.languages = json_dumps(data.get('languages', []))
+        resume.certifications = json_dumps(data.get('certifications', []))
         
         # Update settings
         resume.color_scheme = data.get('color_scheme', resume.color_scheme)
@@ -9724,7 +10282,7 @@ def quick_jobs_stats():
 @login_required
 def analytics_dashboard():
     """Advanced analytics dashboard for HR/Admin users"""
-    if current_user.role not in ['admin', 'super_admin']:
+    if current_user.role not in ADMIN_ROLES:
         flash('Access denied. Only admins can access analytics.', 'error')
         return redirect(url_for('dashboard'))
     
@@ -9746,7 +10304,7 @@ def analytics_dashboard():
 @login_required
 def analytics_pipeline():
     """Candidate pipeline analytics"""
-    if current_user.role not in ['admin', 'super_admin']:
+    if current_user.role not in ADMIN_ROLES:
         flash('Access denied. Only admins can access analytics.', 'error')
         return redirect(url_for('dashboard'))
     
@@ -9767,7 +10325,7 @@ def analytics_pipeline():
 @login_required
 def analytics_interviews():
     """Interview performance tracking"""
-    if current_user.role not in ['admin', 'super_admin']:
+    if current_user.role not in ADMIN_ROLES:
         flash('Access denied. Only admins can access analytics.', 'error')
         return redirect(url_for('dashboard'))
     
@@ -9788,7 +10346,7 @@ def analytics_interviews():
 @login_required
 def api_analytics_dashboard():
     """API endpoint for analytics dashboard data"""
-    if current_user.role not in ['admin', 'super_admin']:
+    if current_user.role not in ADMIN_ROLES:
         return jsonify({'error': 'Access denied'}), 403
     
     try:
@@ -9809,8 +10367,6 @@ def api_analytics_dashboard():
 
 @app.route('/messages')
 @login_required
-@login_required
-@login_required
 def send_message():
     """Send a message to another user"""
     try:
@@ -9854,7 +10410,6 @@ def send_message():
 
 @app.route('/messages/compose')
 @login_required
-@login_required
 def api_conversations():
     """API endpoint for user conversations"""
     try:
@@ -9892,7 +10447,7 @@ def api_notifications():
 @login_required
 def add_collaboration_team_member():
     """Add team member to application collaboration"""
-    if current_user.role not in ['admin', 'recruiter']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         return jsonify({'error': 'Access denied'}), 403
     
     try:
@@ -9953,7 +10508,7 @@ def submit_collaboration_feedback():
 @login_required
 def get_collaboration_feedback(application_id):
     """Get team feedback for application"""
-    if current_user.role not in ['admin', 'recruiter']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         return jsonify({'error': 'Access denied'}), 403
     
     try:
@@ -9972,7 +10527,7 @@ def get_collaboration_feedback(application_id):
 @login_required
 def collaboration_application(application_id):
     """View application collaboration page"""
-    if current_user.role not in ['admin', 'recruiter']:
+    if current_user.role not in RECRUITER_OR_ADMIN_ROLES:
         flash('Access denied. Only admins and recruiters can access collaboration.', 'error')
         return redirect(url_for('dashboard'))
     
@@ -10012,11 +10567,6 @@ def collaboration_application(application_id):
 
 @app.route('/system/settings')
 @login_required
-@login_required
-@login_required
-@login_required
-@login_required
-@login_required
 def test_email_configuration():
     """Test email configuration"""
     if current_user.role != 'super_admin':
@@ -0,0 +1,113 @@
+"""
+Schema migrations for Ez2source
+Brings tables created by older versions up to the current models at startup;
+db.create_all() only creates missing tables, never missing columns
+"""
+
+import logging
+
+from sqlalchemy import case, func, inspect, text, update
+
+from app import db
+from models import User, PROFILE_FIELD_FLAGS
+
+# Arbitrary key for pg_advisory_xact_lock so instances starting together migrate one at a time
+MIGRATION_LOCK_ID = 724_501
+
+
+def apply_schema_migrations():
+    """
+    Add columns the models gained after their tables were created, and backfill them.
+    Runs in one transaction, so a failed backfill leaves the schema untouched.
+    """
+    with db.engine.begin() as connection:
+        if connection.dialect.name == 'postgresql':
+            connection.execute(text("SELECT pg_advisory_xact_lock(:lock_id)"), {'lock_id': MIGRATION_LOCK_ID})
+        inspector = inspect(connection)
+
+        _migrate_user_profile_flags(connection, _column_names(inspector, 'user'))
+        _migrate_organization_audit_retention(connection, _column_names(inspector, 'organization'))
+        _migrate_company_active_job_count(connection, _column_names(inspector, 'company'))
+        _migrate_audit_log_organization(connection, {
+            column['name']: column for column in inspector.get_columns('audit_log')
+        })
+
+
+def _column_names(inspector, table_name):
+    return {column['name'] for column in inspector.get_columns(table_name)}
+
+
+def _profile_flags_expression():
+    """SQL counterpart of models.compute_profile_flags: one bit per filled-in profile field"""
+    bits = []
+    for field, flag in PROFILE_FIELD_FLAGS.items():
+        column = User.__table__.c[field]
+        empty = 0 if isinstance(column.type, db.Integer) else ''
+        bits.append(case((func.coalesce(column, empty) != empty, flag), else_=0))
+    # The bits are disjoint, so their sum is their bitwise OR
+    return sum(bits[1:], bits[0])
+
+
+def _migrate_user_profile_flags(connection, user_columns):
+    if 'profile_flags' not in user_columns:
+        connection.execute(text('ALTER TABLE "user" ADD COLUMN profile_flags INTEGER'))
+        logging.info("Added user.profile_flags")
+
+    # Also picks up rows left NULL by the column having been added without a backfill
+    backfilled = connection.execute(
+        update(User.__table__).where(User.__table__.c.profile_flags.is_(None)).values(
+            profile_flags=_profile_flags_expression()
+        )
+    ).rowcount
+    if backfilled:
+        logging.info(f"Backfilled profile_flags for {backfilled} users")
+
+
+def _migrate_organization_audit_retention(connection, organization_columns):
+    if 'audit_log_days_to_keep' not in organization_columns:
+        # A constant default fills existing rows without rewriting the table
+        connection.execute(text("ALTER TABLE organization ADD COLUMN audit_log_days_to_keep INTEGER DEFAULT 365"))
+        logging.info("Added organization.audit_log_days_to_keep")
+
+
+def _migrate_company_active_job_count(connection, company_columns):
+    if 'active_job_count' not in company_columns:
+        connection.execute(text("ALTER TABLE company ADD COLUMN active_job_count INTEGER NOT NULL DEFAULT 0"))
+        # The JobPosting mapper events keep the count current from here on
+        connection.execute(text(
+            "UPDATE company SET active_job_count = ("
+            "SELECT count(*) FROM job_posting WHERE job_posting.company_id = company.id AND job_posting.is_active)"
+        ))
+        logging.info("Added and backfilled company.active_job_count")
+
+
+def _migrate_audit_log_organization(connection, audit_log_columns):
+    column = audit_log_columns.get('organization_id')
+    if column is not None and not column['nullable']:
+        return
+
+    if column is None:
+        connection.execute(text(
+            "ALTER TABLE audit_log ADD COLUMN organization_id INTEGER REFERENCES organization(id)"
+        ))
+        # The table is locked by the ALTER anyway, so build the per-organization log index now
+        connection.execute(text(
+            "CREATE INDEX IF NOT EXISTS idx_audit_log_org_timestamp ON audit_log (organization_id, timestamp)"
+        ))
+        logging.info("Added audit_log.organization_id")
+
+    # Rows written before the column existed belong to their acting user's organization
+    connection.execute(text(
+        "UPDATE audit_log SET organization_id = u.organization_id FROM \"user\" u "
+        "WHERE audit_log.user_id = u.id AND audit_log.organization_id IS NULL"
+    ))
+
+    unattributed = connection.execute(text(
+        "SELECT count(*) FROM audit_log WHERE organization_id IS NULL"
+    )).scalar()
+    if unattributed:
+        logging.warning(f"{unattributed} audit log rows have no organization; leaving audit_log.organization_id nullable")
+        return
+
+    connection.execute(text("ALTER TABLE audit_log ALTER COLUMN organization_id SET NOT NULL"))
+    logging.info("Backfilled audit_log.organization_id and made it NOT NULL")
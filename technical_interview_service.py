@@ -19,7 +19,7 @@ from models import (
 )
 from enhanced_email_service import EnhancedEmailService as EmailService
 from calendar_service import CalendarService
-from ai_service import openai
+from ai_service import openai, create_chat_completion, REQUEST_MAX_ATTEMPTS
 
 
 class TechnicalInterviewService:
@@ -383,7 +383,9 @@ class TechnicalInterviewService:
             Keep the summary professional and constructive.
             """
             
-            response = self.openai_client.chat.completions.create(
+            response = create_chat_completion(
+                self.openai_client,
+                max_attempts=REQUEST_MAX_ATTEMPTS,
                 model="gpt-4o",
                 messages=[
                     {
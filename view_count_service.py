@@ -0,0 +1,85 @@
+"""
+View Count Service for Ez2source
+Buffers job posting page views in memory and applies them as one batched UPDATE
+"""
+
+import atexit
+import logging
+import os
+import threading
+from collections import Counter
+
+from sqlalchemy import Integer, column, update, values
+
+from app import app, db
+from models import JobPosting
+
+FLUSH_INTERVAL_SECONDS = 10.0
+FLUSH_THRESHOLD = 100
+
+
+class ViewCountBuffer:
+    """Per-process view counters drained by a writer thread every few seconds or every N views"""
+
+    def __init__(self):
+        self._counts = Counter()
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._writer = None
+        self._writer_pid = None
+
+    def increment(self, job_id: int) -> None:
+        """Record one view of job_id; the database is updated on the next flush"""
+        with self._lock:
+            self._counts[job_id] += 1
+            self._pending += 1
+            if self._pending >= FLUSH_THRESHOLD:
+                self._wake.set()
+        self._ensure_writer()
+
+    def flush(self) -> None:
+        """Apply all buffered counts in a single UPDATE ... FROM (VALUES ...)"""
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+            self._pending = 0
+
+        if not counts:
+            return
+
+        deltas = values(
+            column('id', Integer), column('delta', Integer), name='view_deltas'
+        ).data(list(counts.items()))
+        stmt = update(JobPosting).where(JobPosting.id == deltas.c.id).values(
+            views_count=db.func.coalesce(JobPosting.views_count, 0) + deltas.c.delta
+        )
+
+        with app.app_context():
+            try:
+                db.session.execute(stmt)
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                logging.error(f"Failed to write view counts for {len(counts)} job postings: {e}")
+            finally:
+                db.session.remove()
+
+    def _ensure_writer(self):
+        # Threads don't survive gunicorn's fork after --preload, so start (or restart) per process
+        with self._lock:
+            if self._writer is None or not self._writer.is_alive() or self._writer_pid != os.getpid():
+                self._writer = threading.Thread(target=self._run, name="view-count-writer", daemon=True)
+                self._writer_pid = os.getpid()
+                self._writer.start()
+
+    def _run(self):
+        while True:
+            self._wake.wait(timeout=FLUSH_INTERVAL_SECONDS)
+            self._wake.clear()
+            self.flush()
+
+
+job_view_counts = ViewCountBuffer()
+
+# Don't drop buffered views on a clean shutdown
+atexit.register(job_view_counts.flush)